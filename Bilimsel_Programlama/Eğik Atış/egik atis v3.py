@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Eğik atış örneği v3.
+
+Dizilerle analitik çözüm, analitik çarpma zamanı ve parametre taraması.
+"""
+# sonradan gerekecek kütüphanelerini çağır
+import argparse
+import os
+import sys
+
+import numpy as np
+
+# hesaplama fonksiyonları bir üst dizindeki dinamik paketinde
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from dinamik import grafik
+from dinamik.egikatis import (gAy, gDünya, atışYörüngesi, başlangıçHızı,
+                              menzil, tepeNoktası)
+from dinamik.cozuculer import ODEÇözücüTipi, İvmeModeli, sabitAdımlıÇözüm
+from dinamik.olaylar import olaylıÇözüm, yereÇarpma, yükseklikGeçişi
+
+
+# başlangıç zamanı
+t0 = 0
+# adım büyüklüğü (sn)
+tAdım = 0.5
+
+
+def main():
+    ayrıştırıcı = argparse.ArgumentParser(description="Eğik atış örneği v3")
+    # başlangıç hızı (m/sn) ve atış açısı (derece)
+    ayrıştırıcı.add_argument("--v0", type=float, default=100,
+                             help="atış hızı (m/s)")
+    ayrıştırıcı.add_argument("--aci", type=float, default=50,
+                             help="yükselme açısı (derece)")
+    ayrıştırıcı.add_argument("--kaydet", metavar="DIZIN", default=None,
+                             help="grafikleri ekranda göstermek yerine bu "
+                                  "dizine PNG olarak yaz")
+    argümanlar = ayrıştırıcı.parse_args()
+    v0, yükselmeAçısı = argümanlar.v0, argümanlar.aci
+
+    plt = grafik.başlat(argümanlar.kaydet)
+
+    # Gerçek yörünge: bütün zamanlar tek seferde, son nokta tam çarpma anı
+    gerçek = atışYörüngesi(v0, yükselmeAçısı, tAdım, t0=t0)
+
+    # Euler ile sayısal çözüm; aynı zamanlarda karşılaştırmak için çarpmadan
+    # önceki son adıma kadar
+    vx0, vy0 = başlangıçHızı(v0, yükselmeAçısı)
+    tNum, numDurum = sabitAdımlıÇözüm([0, 0, vx0, vy0], t0, tAdım, gerçek.t[-1],
+                                      ODEÇözücüTipi.EULER,
+                                      İvmeModeli.SABİTYERÇEKİMİ, gDünya)
+    hata = numDurum - gerçek.durum[:len(tNum)]
+
+    tTepe, hTepe = tepeNoktası(v0, yükselmeAçısı)
+    print("Uçuş süresi: %.3f s, menzil: %.2f m, tepe noktası: %.2f m (%.3f s)"
+          % (gerçek.t[-1], gerçek.r[-1, 0], hTepe, tTepe))
+
+    # Olay algılamalı çözüm: yere çarpma ve 100 m'nin aşağı doğru geçilmesi
+    # adım adım h < 0 beklemek yerine kök bularak hesaplanır
+    for tip, adım in [(ODEÇözücüTipi.RK45, None), (ODEÇözücüTipi.EULER, tAdım),
+                      (ODEÇözücüTipi.VERLET, tAdım)]:
+        çözüm = olaylıÇözüm([0, 0, vx0, vy0], t0, 1000,
+                            [yereÇarpma(), yükseklikGeçişi(100, yön=-1)],
+                            zamanlar=[], çözücüTipi=tip, tAdım=adım,
+                            model=İvmeModeli.SABİTYERÇEKİMİ, parametre=gDünya)
+        yüz = çözüm.olaylar["yükseklik 100"].t
+        print("%-8s çarpma: %.6f s (hata %.1e s), 100 m: %s, %d ivme hesabı"
+              % (tip.value, çözüm.olaylar["yereÇarpma"].t[0],
+                 çözüm.olaylar["yereÇarpma"].t[0] - gerçek.t[-1],
+                 "%.6f s" % yüz[0] if len(yüz) else "-",
+                 çözüm.fonksiyonÇağrısı))
+
+    # konum grafiği
+    grafik.çiz( gerçek.r[:, 0], gerçek.r[:, 1], label="gerçek")
+    grafik.çiz( numDurum[:, 0], numDurum[:, 1], label="Euler (" + str(tAdım) + " s)")
+
+    plt.title(r"Konum")
+    plt.xlabel("x konum (m)")
+    plt.ylabel('y konum (m)')
+    plt.legend(loc=3)
+
+    grafik.bitir("konum")
+
+    # hata grafikleri
+    plt.subplot(211)
+    grafik.çiz( tNum, np.linalg.norm(hata[:, :2], axis=1))
+
+    plt.title(r"Konum ve Hız Hatası Değişimi (" + str(tAdım) + " s)")
+    plt.xlabel("zaman (s)")
+    plt.ylabel('konum hatası (m)')
+
+    plt.subplot(212)
+    grafik.çiz( tNum, np.linalg.norm(hata[:, 2:], axis=1))
+
+    plt.xlabel("zaman (s)")
+    plt.ylabel('hız hatası (m/s)')
+
+    grafik.bitir("hata")
+
+    # menzil - açı grafiği: bütün açılar ve iki gezegen tek seferde
+    açılar = np.linspace(0, 90, 181)
+    menziller = menzil(v0, açılar[:, None], np.array([gDünya, gAy]))
+
+    plt.plot( açılar, menziller[:, 0], label="Dünya")
+    plt.plot( açılar, menziller[:, 1], label="Ay")
+
+    plt.title("Menzil (" + str(v0) + " m/s)")
+    plt.xlabel("yükselme açısı (derece)")
+    plt.ylabel("menzil (m)")
+    plt.yscale('log')
+    plt.legend(loc=3)
+
+    grafik.bitir("menzil")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Serbest düşüş örneği v3.
+
+Zaman dizisiyle tek seferde hesap ve analitik yere çarpma zamanı.
+"""
+# sonradan gerekecek kütüphanelerini çağır
+import argparse
+import os
+import sys
+
+import numpy as np
+
+# hesaplama fonksiyonları bir üst dizindeki dinamik paketinde
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from dinamik import grafik
+from dinamik.egikatis import gAy, gDünya, serbestDüşüş
+
+# bitiş zamanı (sn)
+tSon = 10
+# adım büyüklüğü (sn)
+tAdım = 0.5
+
+# başlangıç zamanı, irtifa ve hız
+t0 = 0
+h0 = 0
+v0 = 0
+
+
+def main():
+    ayrıştırıcı = argparse.ArgumentParser(description="Serbest düşüş örneği v3")
+    ayrıştırıcı.add_argument("--kaydet", metavar="DIZIN", default=None,
+                             help="grafikleri ekranda göstermek yerine bu "
+                                  "dizine PNG olarak yaz")
+    argümanlar = ayrıştırıcı.parse_args()
+
+    plt = grafik.başlat(argümanlar.kaydet)
+
+    # Zaman dizisi ve iki gezegen için yükseklik ve hızlar: (zaman x gezegen)
+    tList = np.arange(t0, tSon + tAdım/2, tAdım)
+    hList, vList = serbestDüşüş(tList[:, None], h0, v0, np.array([gDünya, gAy]))
+
+    # Zaman dizisinin ilk 3 elemanını ekrana bas
+    print(tList[:3])
+    # Yükseklik dizisinin ilk 3 elemanını ekrana bas (Dünya)
+    print(hList[:3, 0])
+    # Hız dizisinin ilk 3 elemanını ekrana bas (Dünya)
+    print(vList[:3, 0])
+
+    # 100 m yükseklikten bırakılan cismin yere düşme zamanı: h0 = g t^2 / 2
+    print("100 m'den düşme süresi: Dünya %.3f s, Ay %.3f s"
+          % tuple(np.sqrt(2*100/np.array([gDünya, gAy]))))
+
+    # Yükseklik grafiği
+    plt.subplot(211)
+    grafik.çiz( tList , hList[:, 0], label="Dünya")
+    grafik.çiz( tList , hList[:, 1], label="Ay")
+
+    plt.title(r"Yükseklik ve Hız Değişimi ($ h = \frac{1}{2} g t^2 $ & $ v = -gt $)")
+    plt.xlabel("zaman (s)")
+    plt.ylabel('yükseklik (m)')
+    plt.legend(loc=3)
+
+    # Hız grafiği
+    plt.subplot(212)
+    grafik.çiz( tList , vList[:, 0], label="Dünya")
+    grafik.çiz( tList , vList[:, 1], label="Ay")
+
+    plt.xlabel("zaman (s)")
+    plt.ylabel("hız (m/sn)")
+    plt.legend(loc=3)
+
+    grafik.bitir("serbest_dusus")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+"""
+Bilimsel_Programlama örneklerinin (serbest düşüş, eğik atış, iki cisim)
+ortak hesaplama paketi.
+
+Örnek betikler bu paketi kendi dizinlerinin bir üstünden yükler:
+
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+    from dinamik.ikicisim import ZamanKonumHız, hesapDöngüsüEuler
+"""
+from .yorunge import DurumGörünümü, Yörünge
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""
+Sabit adımlı sayısal integrasyon yöntemleri.
+
+Euler, RK4 ve simplektik Velocity-Verlet ile Yoshida (4. derece) yöntemleri
+iki cisim (merkezi kütleçekimi) ve eğik atış (sabit yerçekimi) modelleri
+için. İç döngüler önceden ayrılmış (n, 2d) boyutlu durum dizisine doğrudan
+yazar. Numba kuruluysa döngüler makine koduna derlenir; değilse aynı kod
+Python'da çalışır (sonuç aynıdır, sadece daha yavaştır).
+
+Simplektik yöntemler enerjiyi uzun süre boyunca sınırlı bir hata içinde
+tutar; aynı enerji hatası için Euler'e göre çok daha büyük adımlar
+kullanılabilir.
+"""
+import math
+from enum import Enum, IntEnum
+
+import numpy as np
+from scipy.interpolate import CubicHermiteSpline
+
+try:
+    from numba import njit
+    NUMBA = True
+
+    def _derle(fonksiyon):
+        return njit(cache=True)(fonksiyon)
+except ImportError:
+    NUMBA = False
+
+    def _derle(fonksiyon):
+        return fonksiyon
+
+
+class ODEÇözücüTipi(Enum):
+    """
+    solve_ivp integrasyon tipleri ve sabit adımlı yöntemler
+    """
+    RK45 = 'RK45'
+    RK23 = 'RK23'
+    RADAU = 'Radau'
+    BDF = 'BDF'
+    LSODA = 'LSODA'
+    # sabit adımlı yöntemler (bu modülde)
+    EULER = 'Euler'
+    RK4 = 'RK4'
+    VERLET = 'Verlet'
+    YOSHIDA4 = 'Yoshida4'
+
+    @property
+    def sabitAdımlı(self):
+        """solve_ivp yerine bu modüldeki sabit adımlı bir yöntem mi?"""
+        return self.value in ('Euler', 'RK4', 'Verlet', 'Yoshida4')
+
+
+class İvmeModeli(IntEnum):
+    """
+    İvme modelleri. parametre İKİCİSİM için kütleçekimi sabiti mu
+    (m^3/s^2), SABİTYERÇEKİMİ için yerçekimi ivmesi g (m/s^2; son eksen
+    boyunca aşağı doğru).
+    """
+    İKİCİSİM = 0
+    SABİTYERÇEKİMİ = 1
+
+
+# Yoshida katsayıları
+_w1 = 1 / (2 - 2**(1/3))
+_w0 = -2**(1/3) / (2 - 2**(1/3))
+_YOSHIDA_C = np.array([_w1/2, (_w0+_w1)/2, (_w0+_w1)/2, _w1/2])
+_YOSHIDA_D = np.array([_w1, _w0, _w1])
+
+
+# *********** derlenen çekirdekler ***********
+
+@_derle
+def _ivme(y, a, model, parametre):
+    """y = [r v] durumundaki ivmeyi a dizisine yazar."""
+    d = len(a)
+    if model == 0:
+        rKare = 0.0
+        for i in range(d):
+            rKare += y[i]*y[i]
+        c = -parametre / (rKare*math.sqrt(rKare))
+        for i in range(d):
+            a[i] = c*y[i]
+    else:
+        for i in range(d):
+            a[i] = 0.0
+        a[d-1] = -parametre
+
+
+@_derle
+def _türev(y, dy, a, model, parametre):
+    """dy = [v a] (RK4 için)"""
+    d = len(a)
+    _ivme(y, a, model, parametre)
+    for i in range(d):
+        dy[i] = y[d+i]
+        dy[d+i] = a[i]
+
+
+@_derle
+def _euler(durum, dt, model, parametre):
+    d = durum.shape[1] // 2
+    a = np.empty(d)
+    for s in range(durum.shape[0] - 1):
+        _ivme(durum[s], a, model, parametre)
+        for i in range(d):
+            durum[s+1, i] = durum[s, i] + durum[s, d+i]*dt
+            durum[s+1, d+i] = durum[s, d+i] + a[i]*dt
+
+
+@_derle
+def _rk4(durum, dt, model, parametre):
+    m = durum.shape[1]
+    a = np.empty(m // 2)
+    k1, k2, k3, k4 = np.empty(m), np.empty(m), np.empty(m), np.empty(m)
+    ara = np.empty(m)
+    for s in range(durum.shape[0] - 1):
+        y = durum[s]
+        _türev(y, k1, a, model, parametre)
+        for i in range(m):
+            ara[i] = y[i] + 0.5*dt*k1[i]
+        _türev(ara, k2, a, model, parametre)
+        for i in range(m):
+            ara[i] = y[i] + 0.5*dt*k2[i]
+        _türev(ara, k3, a, model, parametre)
+        for i in range(m):
+            ara[i] = y[i] + dt*k3[i]
+        _türev(ara, k4, a, model, parametre)
+        for i in range(m):
+            durum[s+1, i] = y[i] + dt/6*(k1[i] + 2*k2[i] + 2*k3[i] + k4[i])
+
+
+@_derle
+def _verlet(durum, dt, model, parametre):
+    # hız yarım adım (kick), konum tam adım (drift), hız yarım adım (kick)
+    d = durum.shape[1] // 2
+    a = np.empty(d)
+    y = durum[0].copy()
+    _ivme(y, a, model, parametre)
+    for s in range(durum.shape[0] - 1):
+        for i in range(d):
+            y[d+i] += 0.5*dt*a[i]
+            y[i] += dt*y[d+i]
+        _ivme(y, a, model, parametre)
+        for i in range(d):
+            y[d+i] += 0.5*dt*a[i]
+        durum[s+1] = y
+
+
+@_derle
+def _yoshida(durum, dt, model, parametre, c, dk):
+    # Üç Verlet adımının özel katsayılarla birleşimi (4. derece)
+    d = durum.shape[1] // 2
+    a = np.empty(d)
+    y = durum[0].copy()
+    for s in range(durum.shape[0] - 1):
+        for j in range(3):
+            for i in range(d):
+                y[i] += c[j]*dt*y[d+i]
+            _ivme(y, a, model, parametre)
+            for i in range(d):
+                y[d+i] += dk[j]*dt*a[i]
+        for i in range(d):
+            y[i] += c[3]*dt*y[d+i]
+        durum[s+1] = y
+
+
+def ivmeler(r, model, parametre):
+    """
+    Konum dizisindeki her satır için ivmeyi tek seferde hesaplar.
+
+    _ivme çekirdeğinin NumPy karşılığı; ara değerleme ve diferansiyel
+    denklem fonksiyonları için.
+
+    Arguments:
+        r {ndarray} -- (d,) ya da (n, d) boyutlu konum dizisi (m)
+        model {İvmeModeli} -- ivme modeli
+        parametre {float} -- modelin parametresi (mu ya da g)
+
+    Returns:
+        {ndarray} -- r ile aynı boyutlu ivme dizisi (m/s^2)
+    """
+    r = np.asarray(r, dtype=np.float64)
+    if model == İvmeModeli.İKİCİSİM:
+        rBüyüklüğü = np.sqrt(np.sum(r*r, axis=-1, keepdims=True))
+        return -parametre / rBüyüklüğü**3 * r
+    a = np.zeros_like(r)
+    a[..., -1] = -parametre
+    return a
+
+
+def hermiteEğrisi(t, durum, model, parametre):
+    """
+    Sabit adımlı bir çözümün adımları arasında kübik Hermite ara değerlemesi.
+
+    Her adımdaki konum, hız ve ivme kullanılır; adım noktalarında değerler
+    aynen korunur.
+
+    Arguments:
+        t {ndarray} -- (n,) boyutlu zaman dizisi (s)
+        durum {ndarray} -- (n, 2d) boyutlu durum dizisi
+        model {İvmeModeli} -- ivme modeli
+        parametre {float} -- modelin parametresi (mu ya da g)
+
+    Returns:
+        {CubicHermiteSpline} -- zamanlar için (m, 2d) boyutlu durum döndürür
+    """
+    d = durum.shape[1] // 2
+    türev = np.hstack([durum[:, d:], ivmeler(durum[:, :d], model, parametre)])
+    return CubicHermiteSpline(t, durum, türev, axis=0)
+
+
+def sabitAdımlıÇözüm(durum0, t0, tAdım, tSon, çözücüTipi, model, parametre):
+    """
+    Sabit adımlı bir yöntemle durumu t0'dan tSon'a kadar ilerletir.
+
+    Arguments:
+        durum0 {array_like} -- başlangıç durumu [r v], 2*d elemanlı
+        t0 {float} -- başlangıç zamanı (s)
+        tAdım {float} -- adım büyüklüğü (s)
+        tSon {float} -- bitiş zamanı (s); t0 + k*tAdım <= tSon olan son adıma
+            kadar hesaplanır
+        çözücüTipi {ODEÇözücüTipi} -- EULER, RK4, VERLET ya da YOSHIDA4
+        model {İvmeModeli} -- ivme modeli
+        parametre {float} -- modelin parametresi (mu ya da g)
+
+    Returns:
+        {tuple} -- (n,) boyutlu zaman dizisi ve (n, 2d) boyutlu durum dizisi
+    """
+    if not çözücüTipi.sabitAdımlı:
+        raise ValueError(çözücüTipi.value + " sabit adımlı bir yöntem değil")
+    adımSayısı = int(np.floor((tSon - t0)/tAdım + 1e-9)) + 1
+    # yuvarlama payıyla eklenen son adım tSon'u aşmasın
+    t = np.minimum(t0 + tAdım*np.arange(adımSayısı), tSon)
+    durum = np.empty((adımSayısı, len(durum0)))
+    durum[0] = durum0
+
+    model, parametre, tAdım = int(model), float(parametre), float(tAdım)
+    if çözücüTipi is ODEÇözücüTipi.EULER:
+        _euler(durum, tAdım, model, parametre)
+    elif çözücüTipi is ODEÇözücüTipi.RK4:
+        _rk4(durum, tAdım, model, parametre)
+    elif çözücüTipi is ODEÇözücüTipi.VERLET:
+        _verlet(durum, tAdım, model, parametre)
+    else:
+        _yoshida(durum, tAdım, model, parametre, _YOSHIDA_C, _YOSHIDA_D)
+    return t, durum
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Serbest düşüş ve eğik atış için analitik çözümler.
+
+Bütün fonksiyonlar NumPy yayınlama (broadcasting) kurallarıyla çalışır:
+zaman, yerçekimi ivmesi, atış hızı ve açısı dizi olarak verilebilir ve
+bütün parametre ızgarası tek seferde, Python döngüsü olmadan hesaplanır.
+Yere çarpma zamanı adım adım ilerleyip h<0 olmasını beklemek yerine
+ikinci derece denklemin kökünden bulunur.
+
+Örnek: 1000 hız x 90 açı x (Dünya, Ay) için menziller
+
+    v0 = np.linspace(1, 100, 1000)[:, None, None]
+    açı = np.arange(1, 91)[None, :, None]
+    g = np.array([gDünya, gAy])
+    menzil(v0, açı, g)          # (1000, 90, 2) boyutlu
+"""
+import numpy as np
+
+from .yorunge import Yörünge
+
+# Kütleçekimi Sabiti [m/s^2]
+gDünya = 9.81
+gAy  = 1.625
+
+
+def serbestDüşüş(t, h0=0, v0=0, g=gDünya):
+    """
+    Verilen zamanlardaki yükseklik ve hızı döndürür.
+
+    $ h(t) = h_0 + v_0 t - \\frac{1}{2} g t^2 $, $ v(t) = v_0 - g t $
+
+    Arguments:
+        t {array_like} -- zaman (s)
+
+    Keyword Arguments:
+        h0 {array_like} -- başlangıç yüksekliği (m) (default: {0})
+        v0 {array_like} -- başlangıç hızı, yukarı pozitif (m/s) (default: {0})
+        g {array_like} -- yerçekimi ivmesi (m/s^2) (default: {gDünya})
+
+    Returns:
+        {tuple} -- yükseklik (m) ve hız (m/s) dizileri
+    """
+    t = np.asarray(t, dtype=np.float64)
+    return h0 + v0*t - 0.5*g*t**2, v0 - g*t
+
+
+def başlangıçHızı(v0, yükselmeAçısı):
+    """
+    Atış hızı ve açısından (derece) hız bileşenlerini döndürür.
+
+    Returns:
+        {tuple} -- x ve y eksenindeki hızlar (m/s)
+    """
+    açı = np.radians(yükselmeAçısı)
+    return v0*np.cos(açı), v0*np.sin(açı)
+
+
+def atışDurumu(t, v0, yükselmeAçısı, g=gDünya, h0=0):
+    """
+    Verilen zamanlardaki konum ve hızı döndürür (hava direnci yok).
+
+    Arguments:
+        t {array_like} -- atıştan itibaren geçen zaman (s)
+        v0 {array_like} -- atış hızı (m/s)
+        yükselmeAçısı {array_like} -- atış açısı (derece)
+
+    Keyword Arguments:
+        g {array_like} -- yerçekimi ivmesi (m/s^2) (default: {gDünya})
+        h0 {array_like} -- atış yüksekliği (m) (default: {0})
+
+    Returns:
+        {tuple} -- rx, ry (m), vx, vy (m/s) dizileri; girdilerin yayınlanmış
+        boyutunda
+    """
+    t = np.asarray(t, dtype=np.float64)
+    vx0, vy0 = başlangıçHızı(v0, yükselmeAçısı)
+    ry, vy = serbestDüşüş(t, h0, vy0, g)
+    return vx0*t, ry, np.broadcast_to(vx0, np.shape(vy)), vy
+
+
+def çarpmaZamanı(v0, yükselmeAçısı, g=gDünya, h0=0):
+    """
+    Cismin yere (y = 0) çarptığı zamanı analitik olarak hesaplar.
+
+    $ h_0 + v_{y0} t - \\frac{1}{2} g t^2 = 0 $ denkleminin pozitif kökü.
+
+    Returns:
+        {ndarray} -- çarpma zamanı (s)
+    """
+    _, vy0 = başlangıçHızı(v0, yükselmeAçısı)
+    return (vy0 + np.sqrt(vy0**2 + 2*g*h0)) / g
+
+
+def menzil(v0, yükselmeAçısı, g=gDünya, h0=0):
+    """Yere çarpana kadar yatayda alınan yol (m)."""
+    vx0, _ = başlangıçHızı(v0, yükselmeAçısı)
+    return vx0 * çarpmaZamanı(v0, yükselmeAçısı, g, h0)
+
+
+def tepeNoktası(v0, yükselmeAçısı, g=gDünya, h0=0):
+    """
+    En yüksek noktaya varış zamanını ve yüksekliğini döndürür.
+
+    Aşağı doğru atışlarda en yüksek nokta başlangıç noktasıdır.
+
+    Returns:
+        {tuple} -- zaman (s) ve yükseklik (m) dizileri
+    """
+    _, vy0 = başlangıçHızı(v0, yükselmeAçısı)
+    t = np.maximum(vy0, 0) / g
+    return t, h0 + vy0*t - 0.5*g*t**2
+
+
+def atışYörüngesi(v0, yükselmeAçısı, tAdım, g=gDünya, h0=0, t0=0):
+    """
+    Tek bir atışın tAdım aralıklı yörüngesini yere çarpana kadar hesaplar.
+
+    Son eleman tam çarpma anıdır (y = 0); adım büyüklüğünden bağımsız olarak
+    yörünge yerin altına taşmaz.
+
+    Arguments:
+        v0 {float} -- atış hızı (m/s)
+        yükselmeAçısı {float} -- atış açısı (derece)
+        tAdım {float} -- adım büyüklüğü (s)
+
+    Keyword Arguments:
+        g {float} -- yerçekimi ivmesi (m/s^2) (default: {gDünya})
+        h0 {float} -- atış yüksekliği (m) (default: {0})
+        t0 {float} -- atış zamanı (s) (default: {0})
+
+    Returns:
+        {Yörünge} -- her bir zaman adımı için zaman konum hız değerleri
+    """
+    tÇarpma = float(çarpmaZamanı(v0, yükselmeAçısı, g, h0))
+    t = np.arange(0, tÇarpma, tAdım)
+    if len(t) == 0 or t[-1] < tÇarpma:
+        t = np.append(t, tÇarpma)
+    rx, ry, vx, vy = atışDurumu(t, v0, yükselmeAçısı, g, h0)
+    ry[-1] = 0.0
+    return Yörünge.dizilerden(t0 + t, np.column_stack([rx, ry, vx, vy]))
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+Yörünge dizileri için grafik katmanı.
+
+Hesaplamadan ayrıdır: dinamik paketinin diğer modülleri matplotlib'i
+yüklemez. Büyük diziler çizilmeden önce ekran çözünürlüğüne seyreltilir
+(her aralıkta en küçük ve en büyük değerler ya da LTTB); 10^6 - 10^7
+noktalık bir yörünge birkaç bin noktayla, görünüşü değişmeden çizilir.
+
+Toplu (batch) çalışmada grafikler pencere açılmadan Agg ile dosyaya
+yazılır:
+
+    grafik.başlat(kayıtDizini)      # None ise ekranda gösterir
+    grafik.çiz(yörünge.r[:, 0], yörünge.r[:, 1], label="RK45")
+    grafik.bitir("konum")           # kayıtDizini/konum.png ya da plt.show()
+"""
+import os
+
+import numpy as np
+
+# ekranda en fazla bu kadar nokta çizilir (aralık başına en küçük ve en büyük)
+hedefNoktaSayısı = 4000
+
+_kayıtDizini = None
+
+
+def başlat(kayıtDizini=None):
+    """
+    Grafik ortamını hazırlar.
+
+    kayıtDizini verilirse matplotlib Agg ile (ekransız) çalışır ve bitir()
+    grafikleri bu dizine PNG olarak yazar. pyplot'un ilk kez yüklenmesinden
+    önce çağrılmalıdır.
+
+    Keyword Arguments:
+        kayıtDizini {str} -- grafiklerin yazılacağı dizin (default: {None})
+
+    Returns:
+        {module} -- matplotlib.pyplot
+    """
+    global _kayıtDizini
+    import matplotlib
+    if kayıtDizini is not None:
+        matplotlib.use("Agg")
+        os.makedirs(kayıtDizini, exist_ok=True)
+    _kayıtDizini = kayıtDizini
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def bitir(isim):
+    """
+    Geçerli grafiği dosyaya yazar (toplu çalışma) ya da ekranda gösterir.
+
+    Arguments:
+        isim {str} -- dosya ismi (uzantısız)
+    """
+    import matplotlib.pyplot as plt
+    if _kayıtDizini is None:
+        plt.show()
+    else:
+        plt.savefig(os.path.join(_kayıtDizini, isim + ".png"), dpi=100)
+        plt.close()
+
+
+def seyreltİndisleri(değerler, hedef=hedefNoktaSayısı):
+    """
+    En küçük/en büyük seyreltmesi için tutulacak indisler.
+
+    Diziler sıralı aralıklara bölünür; her aralıkta her sütunun en küçük ve
+    en büyük değerinin indisleri tutulur. Böylece çizginin zarfı ve tepe
+    noktaları korunur. Hem zaman serileri hem de x-y (parametrik) eğriler
+    için çalışır; tamamen vektörleştirilmiştir.
+
+    Arguments:
+        değerler {ndarray} -- (n,) ya da (n, k) boyutlu dizi
+
+    Keyword Arguments:
+        hedef {int} -- yaklaşık en fazla nokta sayısı
+
+    Returns:
+        {ndarray} -- artan sırada indisler; ilk ve son nokta her zaman dahil
+    """
+    değerler = np.asarray(değerler)
+    if değerler.ndim == 1:
+        değerler = değerler[:, None]
+    n, k = değerler.shape
+    aralıkSayısı = max(hedef // (2*k), 1)
+    if n <= hedef or n <= 2*aralıkSayısı:
+        return np.arange(n)
+
+    # tam aralıklar yeniden şekillendirilerek, kalan kısım ayrıca işlenir
+    boy = n // aralıkSayısı
+    tam = boy*aralıkSayısı
+    bloklar = değerler[:tam].reshape(aralıkSayısı, boy, k)
+    başlar = (np.arange(aralıkSayısı)*boy)[:, None]
+    indisler = [(bloklar.argmin(axis=1) + başlar).ravel(),
+                (bloklar.argmax(axis=1) + başlar).ravel(),
+                [0, n - 1]]
+    if tam < n:
+        kalan = değerler[tam:]
+        indisler += [kalan.argmin(axis=0) + tam, kalan.argmax(axis=0) + tam]
+    return np.unique(np.concatenate(indisler))
+
+
+def lttb(x, y, hedef=hedefNoktaSayısı):
+    """
+    Largest-Triangle-Three-Buckets seyreltmesi (Steinarsson, 2013).
+
+    Her aralıktan, bir önceki seçilen nokta ve sonraki aralığın ortalamasıyla
+    en büyük üçgeni oluşturan nokta seçilir. Zaman serilerinin görünüşünü
+    en küçük/en büyük yönteminden daha az noktayla korur.
+
+    Arguments:
+        x {ndarray} -- (n,) boyutlu artan dizi
+        y {ndarray} -- (n,) boyutlu dizi
+
+    Keyword Arguments:
+        hedef {int} -- seçilecek nokta sayısı
+
+    Returns:
+        {ndarray} -- seçilen noktaların artan sıradaki indisleri
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if hedef >= n or hedef < 3:
+        return np.arange(n)
+
+    # ilk ve son nokta dışındakiler hedef-2 aralığa bölünür
+    sınırlar = np.linspace(1, n - 1, hedef - 1).astype(np.int64)
+    seçilen = np.empty(hedef, dtype=np.int64)
+    seçilen[0], seçilen[-1] = 0, n - 1
+    a = 0
+    for i in range(hedef - 2):
+        baş, son = sınırlar[i], sınırlar[i + 1]
+        if i + 2 < len(sınırlar):
+            sonrakiX = x[son:sınırlar[i + 2]].mean()
+            sonrakiY = y[son:sınırlar[i + 2]].mean()
+        else:
+            sonrakiX, sonrakiY = x[-1], y[-1]
+        alan = np.abs((x[a] - sonrakiX)*(y[baş:son] - y[a])
+                      - (x[a] - x[baş:son])*(sonrakiY - y[a]))
+        a = baş + int(np.argmax(alan))
+        seçilen[i + 1] = a
+    return seçilen
+
+
+def çiz(x, y, *args, hedef=hedefNoktaSayısı, yöntem="minmax", **kwargs):
+    """
+    plt.plot gibi; çok büyük diziler önce seyreltilir.
+
+    Arguments:
+        x {array_like} -- yatay eksen değerleri
+        y {array_like} -- dikey eksen değerleri
+
+    Keyword Arguments:
+        hedef {int} -- en fazla nokta sayısı
+        yöntem {str} -- "minmax" (x ve y'nin zarfı; x-y eğrileri için de
+            uygun) ya da "lttb" (x artan zaman serileri için)
+
+    Diğer argümanlar plt.plot'a aynen verilir.
+    """
+    import matplotlib.pyplot as plt
+    x, y = np.asarray(x), np.asarray(y)
+    if yöntem == "lttb":
+        indisler = lttb(x, y, hedef)
+    else:
+        indisler = seyreltİndisleri(np.column_stack([x, y]), hedef)
+    return plt.plot(x[indisler], y[indisler], *args, **kwargs)
+
+
+def eşitEksen():
+    """Geçerli eksenlerde x ve y ölçeğini eşitler ve ızgara çizer."""
+    import matplotlib.pyplot as plt
+    plt.gca().set_aspect('equal')
+    plt.grid(True, which='major', linestyle='--')
@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+"""
+İki cisim problemi için hesaplama fonksiyonları.
+
+"iki cisim v3 solve_ivp.py" örneğinin hesaplama kısmı. Sonuçlar adım başına
+bir ZamanKonumHız nesnesi listesi yerine bir Yörünge olarak döndürülür;
+Yörünge'nin elemanları ZamanKonumHız gibi davrandığından eski kullanım
+(pvt.t, pvt.r, pvt.spesifikEnerji() ...) aynen çalışır.
+"""
+from enum import Enum
+
+import numpy as np
+from scipy.integrate import solve_ivp
+from scipy.sparse import block_diag
+
+from .cozuculer import (İvmeModeli, ODEÇözücüTipi, hermiteEğrisi,
+                        sabitAdımlıÇözüm)
+from .yorunge import DurumGörünümü, TembelYörünge, Yörünge
+
+# Kütleçekimi Sabiti [m^3/s^2]
+muDünya = 398600.5*1E9
+# Dünya ekvator yarıçapı [m]
+rDünya = 6378137.0
+
+
+class ÇıktıTipi(Enum):
+    """
+    odeÇözümü sonuç biçimleri
+    """
+    # istenen zamanlarda örneklenmiş Yörünge
+    YÖRÜNGE = 'Yörünge'
+    # (zamanlar, durum) dizileri; (n,) ve (n, 4) boyutlu
+    DİZİ = 'Dizi'
+    # yoğun çıktı üzerinde istendiğinde hesaplanan TembelYörünge
+    TEMBEL = 'Tembel'
+
+
+class ZamanKonumHız(DurumGörünümü):
+    """
+    Zaman, 2D konum ve 2D hız değerlerini içeren vektör sınıfı
+    """
+    __slots__ = ()
+
+    def __init__(self, t0, rx0, ry0, vx0, vy0):
+        """
+        Zaman, konum ve hızı ilk değerleriyle başlatır.
+
+        Arguments:
+            t0  {float} -- zaman (s)
+            rx0 {float} -- x ekseninde konum (m)
+            ry0 {float} -- y ekseninde konum (m)
+            vx0 {float} -- x ekseninde hız (m/s)
+            vy0 {float} -- y ekseninde hız (m/s)
+        """
+        super().__init__(t0, np.array([rx0, ry0]), np.array([vx0, vy0]))
+
+    def spesifikEnerji(self, mu=muDünya):
+        """
+        Spesifik enerjiyi hesaplar.
+
+        Spesifik enerji birim kütleye düşen enerji olarak tanımlanır
+
+        $e =  \\frac{1}{2} v^2 - \\frac{\\mu}{r} $
+
+        Keyword Arguments:
+            mu {float} -- Kütleçekimi Sabiti (m^3/s^2) (default: {muDünya})
+
+        Returns:
+            float -- spesifik enerji ($m^2/s^2$)
+        """
+        return 0.5*self.v.dot(self.v) - mu/self.konumBüyüklüğü()
+
+    def ivme(self, mu=muDünya):
+        """
+        İvmeyi hesaplar
+
+        İki cisim problemine göre bu konum ve hıza ait ivmeyi hesaplar.
+
+        Keyword Arguments:
+            mu {float} -- Kütleçekimi Sabiti (m^3/s^2) (default: {muDünya})
+
+        Returns:
+            {ndarray} -- İvme vektörü ($m/s^2$)
+        """
+        return -mu/np.power(self.konumBüyüklüğü(), 3) * self.r
+
+
+def spesifikEnerjiler(yörünge, mu=muDünya):
+    """
+    Yörüngenin her adımı için spesifik enerjiyi tek seferde hesaplar.
+
+    Arguments:
+        yörünge {Yörünge} -- zaman konum hız değerleri
+
+    Keyword Arguments:
+        mu {float} -- Kütleçekimi Sabiti (m^3/s^2) (default: {muDünya})
+
+    Returns:
+        {ndarray} -- (n,) boyutlu spesifik enerji dizisi ($m^2/s^2$)
+    """
+    hızKare = np.einsum("ij,ij->i", yörünge.v, yörünge.v)
+    return 0.5*hızKare - mu/yörünge.konumBüyüklüğü()
+
+
+def zamanListesi(t0, tAdım, tSon):
+    """
+    t0'dan tSon'a (dahil) tAdım aralıklı zaman dizisini oluşturur.
+
+    Zamanlar t0 + k*tAdım olarak hesaplanır; adım adım toplanmadığı için
+    uzun integrasyonlarda yuvarlama hatası birikmez. Son zaman tSon'u
+    yuvarlama payı kadar aşarsa tSon'a çekilir (solve_ivp t_eval'ı t_span
+    dışında kabul etmez).
+    """
+    adımSayısı = int(np.floor((tSon - t0)/tAdım + 1e-9)) + 1
+    return np.minimum(t0 + tAdım*np.arange(adımSayısı), tSon)
+
+
+# *********** fonksiyon tanımları ***********
+
+def eulerZamanKonumHız(dt, pvt, mu=muDünya):
+    """
+    Verilen bir dt adım büyüklüğü kadar zaman konum ve hızı Euler Metodu ile ilerletir.
+
+    Arguments:
+        dt {float} -- adım büyüklüğü (s)
+        pvt {ZamanKonumHız} -- t zamanında zaman konum hız
+        mu {float} -- Kütleçekimi Sabiti (m^3/s^2) (default: {muDünya})
+
+    Returns:
+        {ZamanKonumHız} -- t+dt zamanında zaman konum hız
+    """
+    a = pvt.ivme(mu)
+
+    tYeni  = pvt.t + dt
+    rYeni  = pvt.r + pvt.v * dt
+    vYeni  = pvt.v + a * dt
+
+    return ZamanKonumHız(tYeni, rYeni[0], rYeni[1], vYeni[0], vYeni[1])
+
+
+def hesapDöngüsüEuler(pvt0, tAdım, tSon, mu=muDünya):
+    """
+    Euler sayısal integrasyon metoduyla konum ve hız değerlerini hesaplar.
+
+    Sonuçlar önceden ayrılmış dizilere doğrudan yazılır; adım başına nesne
+    yaratılmaz (bkz. cozuculer.sabitAdımlıÇözüm).
+
+    Arguments:
+        pvt0 {ZamanKonumHız} -- başlangıç zamanında zaman konum hız
+        tAdım {float} -- adım büyüklüğü (s)
+        tSon {float} -- bitiş zamanı (s)
+        mu {float} -- Kütleçekimi Sabiti (m^3/s^2) (default: {muDünya})
+
+    Returns:
+        {Yörünge} --  her bir zaman adımı için zaman konum hız değerleri
+    """
+    return sabitAdımÇözümü(pvt0, tAdım, tSon, ODEÇözücüTipi.EULER, mu)
+
+
+def sabitAdımÇözümü(pvt0, tAdım, tSon, çözücüTipi = ODEÇözücüTipi.YOSHIDA4,
+                    mu=muDünya):
+    """
+    Sabit adımlı bir yöntemle (Euler, RK4, Verlet, Yoshida4) konum ve hız
+    değerlerini hesaplar.
+
+    Arguments:
+        pvt0 {ZamanKonumHız} -- başlangıç zamanında zaman konum hız
+        tAdım {float} -- adım büyüklüğü (s)
+        tSon {float} -- bitiş zamanı (s)
+        çözücüTipi {ODEÇözücüTipi} -- sabit adımlı ODE Çözücü Tipi
+        mu {float} -- Kütleçekimi Sabiti (m^3/s^2) (default: {muDünya})
+
+    Returns:
+        {Yörünge} --  her bir zaman adımı için zaman konum hız değerleri
+    """
+    t, durum = sabitAdımlıÇözüm(np.concatenate([pvt0.r, pvt0.v]), pvt0.t,
+                                tAdım, tSon, çözücüTipi,
+                                İvmeModeli.İKİCİSİM, mu)
+    return Yörünge.dizilerden(t, durum, ZamanKonumHız)
+
+
+def odeDiffDenklem(t, y, mu=muDünya):
+    """
+    İki cisim problemi için diferansiyel denklem setini tanımlar.
+
+    Arguments:
+        t {float} -- başlangıç zamanı (s)
+        y {ndarray} -- konum (m) ve hızı (m/s) içeren 1B, 4 elemanlı vektör [r_x r_y v_x v_y]
+
+
+    Returns:
+        {ndarray} -- konum ve hız diferansiyel denklemlerini (hız (m/s) ve ivmeyi(m/s^2)) içeren
+        1B, 4 elemanlı vektör [v_x v_y a_x a_y]
+    """
+    r = np.sqrt(y[0]**2 + y[1]**2)
+
+    dy0 = y[2]
+    dy1 = y[3]
+    dy2 = -(mu / (r**3)) * y[0]
+    dy3 = -(mu / (r**3)) * y[1]
+
+    return [dy0, dy1, dy2, dy3]
+
+
+def odeÇözümü(pvt0, tAdım, tSon, çözücüTipi = ODEÇözücüTipi.RK45,
+              rtol=1e-12, atol=1e-15, zamanlar=None,
+              çıktıTipi=ÇıktıTipi.YÖRÜNGE, mu=muDünya):
+    """
+    Scipy ODE sayısal integrasyon metodlarıyla konum ve hız değerlerini hesaplar.
+
+    Sabit adımlı bir çözücü tipi verilirse (Euler, RK4, Verlet, Yoshida4)
+    integrasyon tAdım adımlarıyla sabitAdımÇözümü ile yapılır; adımlar
+    dışındaki zamanlar kübik Hermite ara değerlemesiyle hesaplanır.
+
+    Örneklenmiş çıktıda solve_ivp'ye sadece istenen zamanlar (t_eval)
+    verilir ve yoğun çıktı saklanmaz. TEMBEL çıktıda ise bütün yoğun çıktı
+    saklanır ve hiçbir zaman önceden örneklenmez:
+
+        tembel = odeÇözümü(pvt0, 60, 30*86400, çıktıTipi=ÇıktıTipi.TEMBEL)
+        tembel.örnekle(600)           # 10 dakikada bir
+        tembel(pvt0.t + 86400)        # tek bir an
+
+    Arguments:
+        pvt0 {ZamanKonumHız} -- başlangıç zamanında zaman konum hız
+        tAdım {float} -- adım büyüklüğü (s); zamanlar verilmezse çıktı
+            aralığı, sabit adımlı çözücülerde integrasyon adımı
+        tSon {float} -- bitiş zamanı (s)
+        çözücüTipi {ODEÇözücüTipi} -- ODE Çözücü Tipi
+
+    Keyword Arguments:
+        rtol {float} -- bağıl tolerans (default: {1e-12})
+        atol {float} -- mutlak tolerans (default: {1e-15})
+        zamanlar {array_like} -- çıktı istenen zamanlar (s), artan sırada;
+            None ise pvt0.t'den tAdım aralıklarla (default: {None})
+        çıktıTipi {ÇıktıTipi} -- sonuç biçimi (default: {YÖRÜNGE})
+        mu {float} -- Kütleçekimi Sabiti (m^3/s^2) (default: {muDünya})
+
+    Returns:
+        {Yörünge} --  her bir zaman adımı için zaman konum hız değerleri;
+        DİZİ için (zamanlar, durum) dizileri, TEMBEL için TembelYörünge
+    """
+    if zamanlar is None:
+        zamanlar = zamanListesi(pvt0.t, tAdım, tSon)
+    else:
+        zamanlar = np.asarray(zamanlar, dtype=np.float64)
+    tembel = çıktıTipi is ÇıktıTipi.TEMBEL
+
+    if çözücüTipi.sabitAdımlı:
+        yörünge = sabitAdımÇözümü(pvt0, tAdım, tSon, çözücüTipi, mu)
+        adımlar, durum = yörünge.t, yörünge.durum
+        if tembel or not np.array_equal(zamanlar, adımlar):
+            eğri = hermiteEğrisi(adımlar, durum, İvmeModeli.İKİCİSİM, mu)
+            if tembel:
+                return TembelYörünge(eğri, adımlar[0], adımlar[-1], 2,
+                                     ZamanKonumHız)
+            durum = eğri(zamanlar)
+    else:
+        # diff denklem başlangıç değerlerini oluştur
+        diffIlkDeğer = np.concatenate([pvt0.r, pvt0.v])
+
+        # diff denklemi başlangıç zamanından son zamana dek çöz; sadece
+        # gerekiyorsa yoğun çıktıyı sakla
+        diffDenkÇözüm = solve_ivp(odeDiffDenklem, [pvt0.t, tSon], diffIlkDeğer,
+                                  method=çözücüTipi.value, args=(mu,),
+                                  t_eval=None if tembel else zamanlar,
+                                  dense_output=tembel, rtol=rtol, atol=atol)
+        if not diffDenkÇözüm.success:
+            raise RuntimeError(diffDenkÇözüm.message)
+        if tembel:
+            yoğunÇıktı = diffDenkÇözüm.sol
+            return TembelYörünge(lambda z: yoğunÇıktı(z).T, pvt0.t, tSon, 2,
+                                 ZamanKonumHız)
+
+        # çözüm (4 x n) boyutlu; satırları adımlar olacak şekilde çevir
+        durum = diffDenkÇözüm.y.T
+
+    if çıktıTipi is ÇıktıTipi.DİZİ:
+        return zamanlar, np.ascontiguousarray(durum)
+    return Yörünge.dizilerden(zamanlar, durum, ZamanKonumHız)
+
+
+def odeDiffDenklemToplu(t, y, mu=muDünya, boyut=2):
+    """
+    Birçok uydu için iki cisim diferansiyel denklem setini tek seferde tanımlar.
+
+    N uydunun durumları art arda dizilmiş tek bir vektör olarak verilir;
+    ivmeler Python döngüsü olmadan, bütün uydular için birlikte hesaplanır.
+
+    Arguments:
+        t {float} -- zaman (s)
+        y {ndarray} -- N uydunun konum (m) ve hızlarını (m/s) içeren 1B,
+            N*2*boyut elemanlı vektör [r_1 v_1 r_2 v_2 ...]
+
+    Keyword Arguments:
+        mu {float} -- Kütleçekimi Sabiti (m^3/s^2) (default: {muDünya})
+        boyut {int} -- uzay boyutu, 2 ya da 3 (default: {2})
+
+    Returns:
+        {ndarray} -- y ile aynı düzende hız (m/s) ve ivme (m/s^2) vektörü
+    """
+    y = y.reshape(-1, 2*boyut)
+    r = y[:, :boyut]
+    rBüyüklüğü = np.sqrt(np.einsum("ij,ij->i", r, r))
+
+    dy = np.empty_like(y)
+    dy[:, :boyut] = y[:, boyut:]
+    dy[:, boyut:] = -(mu / rBüyüklüğü**3)[:, None] * r
+    return dy.ravel()
+
+
+def odeÇözümüToplu(pvt0Listesi, tAdım, tSon, çözücüTipi = ODEÇözücüTipi.RK45,
+                   t0=None, mu=muDünya, rtol=1e-12, atol=1e-15):
+    """
+    Birçok başlangıç durumunu tek bir solve_ivp çağrısıyla birlikte çözer.
+
+    Monte Carlo dağılım çalışmaları gibi binlerce yörüngenin hesaplandığı
+    durumlarda her yörünge için ayrı bir solve_ivp çağrısının Python yükünü
+    ortadan kaldırır. Adım büyüklüğü bütün yörüngelerin hata tahminine göre
+    ortak seçilir.
+
+    Arguments:
+        pvt0Listesi {list {ZamanKonumHız} ya da ndarray} -- başlangıç
+            durumları; ZamanKonumHız listesi ya da (N, 4) boyutlu (2D) veya
+            (N, 6) boyutlu (3D) [r v] dizisi
+        tAdım {float} -- çıktı adım büyüklüğü (s)
+        tSon {float} -- bitiş zamanı (s)
+        çözücüTipi {ODEÇözücüTipi} -- ODE Çözücü Tipi
+
+    Keyword Arguments:
+        t0 {float} -- başlangıç zamanı (s); ZamanKonumHız listesi verilirse
+            onlardan alınır, dizi verilirse varsayılan 0
+        mu {float} -- Kütleçekimi Sabiti (m^3/s^2) (default: {muDünya})
+        rtol {float} -- bağıl tolerans (default: {1e-12})
+        atol {float} -- mutlak tolerans (default: {1e-15})
+
+    Returns:
+        list {Yörünge} -- her başlangıç durumu için bir yörünge. Yörüngeler
+        (N, n, 2*boyut) boyutlu tek bir dizinin satırlarına bakar.
+    """
+    if isinstance(pvt0Listesi, np.ndarray):
+        ilkDeğerler = np.asarray(pvt0Listesi, dtype=np.float64)
+        t0 = 0.0 if t0 is None else t0
+    else:
+        zamanlar0 = {pvt.t for pvt in pvt0Listesi}
+        if len(zamanlar0) != 1:
+            raise ValueError("bütün başlangıç durumları aynı zamanda olmalı")
+        t0 = zamanlar0.pop() if t0 is None else t0
+        ilkDeğerler = np.array([np.concatenate([pvt.r, pvt.v])
+                                for pvt in pvt0Listesi])
+    if ilkDeğerler.ndim != 2 or ilkDeğerler.shape[1] not in (4, 6):
+        raise ValueError("başlangıç durumları (N, 4) ya da (N, 6) boyutlu olmalı")
+    N, durumBoyutu = ilkDeğerler.shape
+    boyut = durumBoyutu // 2
+
+    zamanlar = zamanListesi(t0, tAdım, tSon)
+
+    if çözücüTipi.sabitAdımlı:
+        durumlar = np.empty((N, len(zamanlar), durumBoyutu))
+        for i in range(N):
+            _, durumlar[i] = sabitAdımlıÇözüm(ilkDeğerler[i], t0, tAdım, tSon,
+                                              çözücüTipi, İvmeModeli.İKİCİSİM,
+                                              mu)
+        return [Yörünge.dizilerden(zamanlar, durumlar[i], ZamanKonumHız)
+                for i in range(N)]
+
+    # Kapalı (implicit) çözücüler Jacobian matrisini sayısal olarak
+    # hesaplar; uydular birbirinden bağımsız olduğundan matris blok
+    # köşegendir ve bunu bildirmek hesabı N kat hızlandırır.
+    ekSeçenekler = {}
+    if çözücüTipi in (ODEÇözücüTipi.RADAU, ODEÇözücüTipi.BDF):
+        blok = np.ones((durumBoyutu, durumBoyutu))
+        ekSeçenekler["jac_sparsity"] = block_diag([blok]*N, format="csc")
+
+    diffDenkÇözüm = solve_ivp(odeDiffDenklemToplu, [t0, zamanlar[-1]],
+                              ilkDeğerler.ravel(), method=çözücüTipi.value,
+                              t_eval=zamanlar, args=(mu, boyut),
+                              rtol=rtol, atol=atol, **ekSeçenekler)
+    if not diffDenkÇözüm.success:
+        raise RuntimeError(diffDenkÇözüm.message)
+
+    # (N*2*boyut, n) çözümü (N, n, 2*boyut) düzenine getir
+    durumlar = np.ascontiguousarray(
+        diffDenkÇözüm.y.reshape(N, durumBoyutu, -1).transpose(0, 2, 1))
+    return [Yörünge.dizilerden(zamanlar, durumlar[i], ZamanKonumHız)
+            for i in range(N)]
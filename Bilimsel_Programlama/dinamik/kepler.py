@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+İki cisim problemi için analitik (Kepler) çözüm.
+
+Evrensel değişken (universal variable) yöntemiyle bir başlangıç durumundan
+istenen herhangi bir zamandaki konum ve hız doğrudan hesaplanır; aradaki
+adımların integre edilmesi gerekmez. Eliptik, parabolik ve hiperbolik
+yörüngelerin hepsinde çalışır ve hem zamanlar hem de yörüngeler üzerinde
+vektörleştirilmiştir. Sayısal yöntemlerin doğruluğu bu çözüme göre ölçülür.
+
+Kaynak: H. D. Curtis, Orbital Mechanics for Engineering Students, Bölüm 3.7;
+D. A. Vallado, Fundamentals of Astrodynamics and Applications, Algoritma 8.
+"""
+import numpy as np
+
+from .ikicisim import ZamanKonumHız, muDünya
+from .yorunge import Yörünge
+
+
+def stumpffC(z):
+    """
+    Stumpff fonksiyonu C(z) = (1 - cos(sqrt(z)))/z
+
+    z = 0 civarında kuvvet serisi kullanılır.
+    """
+    z = np.asarray(z, dtype=np.float64)
+    sonuç = np.empty_like(z)
+    poz, neg = z > 1e-6, z < -1e-6
+    sıfır = ~(poz | neg)
+    s = np.sqrt(z[poz])
+    sonuç[poz] = (1 - np.cos(s)) / z[poz]
+    s = np.sqrt(-z[neg])
+    sonuç[neg] = (np.cosh(s) - 1) / -z[neg]
+    zs = z[sıfır]
+    sonuç[sıfır] = 1/2 - zs/24 + zs**2/720
+    return sonuç
+
+
+def stumpffS(z):
+    """
+    Stumpff fonksiyonu S(z) = (sqrt(z) - sin(sqrt(z)))/sqrt(z)^3
+
+    z = 0 civarında kuvvet serisi kullanılır.
+    """
+    z = np.asarray(z, dtype=np.float64)
+    sonuç = np.empty_like(z)
+    poz, neg = z > 1e-6, z < -1e-6
+    sıfır = ~(poz | neg)
+    s = np.sqrt(z[poz])
+    sonuç[poz] = (s - np.sin(s)) / s**3
+    s = np.sqrt(-z[neg])
+    sonuç[neg] = (np.sinh(s) - s) / s**3
+    zs = z[sıfır]
+    sonuç[sıfır] = 1/6 - zs/120 + zs**2/5040
+    return sonuç
+
+
+def keplerİlerlet(r0, v0, dt, mu=muDünya, tolerans=1e-12, enFazlaAdım=50):
+    """
+    Başlangıç konum ve hızından dt kadar sonraki konum ve hızı hesaplar.
+
+    Arguments:
+        r0 {array_like} -- başlangıç konumu (m), (d,) ya da N yörünge için (N, d)
+        v0 {array_like} -- başlangıç hızı (m/s), r0 ile aynı boyutlu
+        dt {array_like} -- başlangıçtan itibaren geçen süreler (s), (m,) boyutlu
+
+    Keyword Arguments:
+        mu {float} -- Kütleçekimi Sabiti (m^3/s^2) (default: {muDünya})
+        tolerans {float} -- evrensel anomali için bağıl Newton toleransı
+        enFazlaAdım {int} -- en fazla Newton iterasyonu
+
+    Returns:
+        {tuple} -- konum (m) ve hız (m/s) dizileri; r0 (d,) ise (m, d),
+        (N, d) ise (N, m, d) boyutlu
+
+    Raises:
+        RuntimeError -- Newton iterasyonu enFazlaAdım adımda yakınsamazsa
+    """
+    r0 = np.asarray(r0, dtype=np.float64)
+    v0 = np.asarray(v0, dtype=np.float64)
+    dt = np.atleast_1d(np.asarray(dt, dtype=np.float64))
+    tekYörünge = r0.ndim == 1
+    r0, v0 = np.atleast_2d(r0), np.atleast_2d(v0)
+
+    # yörünge başına sabitler, (N, 1) boyutlu
+    sqmu = np.sqrt(mu)
+    r0n = np.linalg.norm(r0, axis=1)[:, None]
+    v0n2 = np.einsum("ij,ij->i", v0, v0)[:, None]
+    rv = np.einsum("ij,ij->i", r0, v0)[:, None]
+    alfa = 2/r0n - v0n2/mu  # 1/a
+
+    dt = np.broadcast_to(dt, (len(r0), len(dt))).copy()
+    # Eliptik yörüngelerde tam periyotları at: durum aynıdır ve evrensel
+    # anomali küçük kaldığı için sayısal doğruluk korunur.
+    eliptik = (alfa > 0)[:, 0]
+    if eliptik.any():
+        periyot = 2*np.pi / (sqmu * alfa[eliptik]**1.5)
+        dt[eliptik] = np.fmod(dt[eliptik], periyot)
+
+    # Newton iterasyonu için başlangıç tahmini (Vallado)
+    chi = sqmu * alfa * dt
+    parabolik = np.abs(alfa * r0n)[:, 0] < 1e-9
+    chi[parabolik] = (sqmu * dt / r0n)[parabolik]
+    hiperbolik = ~eliptik & ~parabolik
+    if hiperbolik.any():
+        a = 1 / alfa[hiperbolik]
+        işaret = np.sign(dt[hiperbolik])
+        pay = -2*mu*alfa[hiperbolik]*dt[hiperbolik]
+        payda = rv[hiperbolik] + işaret*np.sqrt(-mu*a)*(1 - r0n[hiperbolik]*alfa[hiperbolik])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tahmin = işaret*np.sqrt(-a)*np.log(pay/payda)
+        chi[hiperbolik] = np.where(np.isfinite(tahmin), tahmin, 0.0)
+
+    # Kepler denklemini evrensel değişkenle Newton yöntemiyle çöz
+    for _ in range(enFazlaAdım):
+        chi2 = chi*chi
+        z = alfa*chi2
+        C, S = stumpffC(z), stumpffS(z)
+        r = rv/sqmu*chi*(1 - z*S) + (1 - alfa*r0n)*chi2*C + r0n
+        f = rv/sqmu*chi2*C + (1 - alfa*r0n)*chi2*chi*S + r0n*chi - sqmu*dt
+        düzeltme = f / r
+        chi = chi - düzeltme
+        bağılDüzeltme = np.abs(düzeltme) / np.maximum(np.abs(chi), 1.0)
+        if np.all(bağılDüzeltme <= tolerans):
+            break
+    else:
+        # yakınsamamış bir durum analitik referans olarak kullanılamaz
+        raise RuntimeError("Kepler denklemi %d Newton adımında yakınsamadı "
+                           "(en büyük bağıl düzeltme %.1e)"
+                           % (enFazlaAdım, np.nanmax(bağılDüzeltme)))
+
+    # Lagrange f ve g katsayıları
+    chi2 = chi*chi
+    z = alfa*chi2
+    C, S = stumpffC(z), stumpffS(z)
+    f = 1 - chi2/r0n*C
+    g = dt - chi2*chi/sqmu*S
+    r = f[..., None]*r0[:, None, :] + g[..., None]*v0[:, None, :]
+    rn = np.linalg.norm(r, axis=-1)
+    fNokta = sqmu/(rn*r0n)*(z*chi*S - chi)
+    gNokta = 1 - chi2/rn*C
+    v = fNokta[..., None]*r0[:, None, :] + gNokta[..., None]*v0[:, None, :]
+
+    if tekYörünge:
+        return r[0], v[0]
+    return r, v
+
+
+def keplerÇözümü(pvt0, zamanlar, mu=muDünya):
+    """
+    Analitik çözümle verilen zamanlardaki konum ve hız değerlerini hesaplar.
+
+    Arguments:
+        pvt0 {ZamanKonumHız} -- başlangıç zamanında zaman konum hız
+        zamanlar {array_like} -- istenen zamanlar (s); sıralı olması gerekmez
+
+    Keyword Arguments:
+        mu {float} -- Kütleçekimi Sabiti (m^3/s^2) (default: {muDünya})
+
+    Returns:
+        {Yörünge} -- her bir zaman için zaman konum hız değerleri
+
+    Raises:
+        RuntimeError -- Kepler denklemi yakınsamazsa (bkz. keplerİlerlet)
+    """
+    zamanlar = np.asarray(zamanlar, dtype=np.float64)
+    r, v = keplerİlerlet(pvt0.r, pvt0.v, zamanlar - pvt0.t, mu)
+    return Yörünge.dizilerden(zamanlar, np.hstack([r, v]), ZamanKonumHız)
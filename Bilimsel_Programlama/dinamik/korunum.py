@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+İki cisim problemi için korunan büyüklükler ve korunum kontrolleri.
+
+Spesifik enerji, açısal momentum ve eksantriklik vektörü bütün yörünge
+için tek bir vektörleştirilmiş geçişte hesaplanır; adım başına nesne ya da
+np.linalg.norm çağrısı yoktur. Uzun integrasyonlarda bütün durumları
+saklamadan izlemek için Korunumİzleyici durumları parça parça alır ve
+sadece başlangıç değerlerini ve sapma istatistiklerini tutar.
+
+Fonksiyonlar Yörünge ya da (n, 2d) boyutlu [r v] durum dizisi kabul eder;
+d = 2 ya da 3.
+"""
+import numpy as np
+
+from .cozuculer import İvmeModeli, ODEÇözücüTipi, sabitAdımlıÇözüm
+from .ikicisim import ZamanKonumHız, muDünya
+from .yorunge import Yörünge
+
+
+def _konumHız(yörünge):
+    """Yörünge ya da durum dizisinden (n, d) boyutlu konum ve hız."""
+    durum = yörünge.durum if isinstance(yörünge, Yörünge) else \
+        np.atleast_2d(np.asarray(yörünge, dtype=np.float64))
+    d = durum.shape[1] // 2
+    return durum[:, :d], durum[:, d:]
+
+
+def spesifikEnerjiDizisi(yörünge, mu=muDünya):
+    """
+    Her adım için spesifik enerji $ \\frac{1}{2} v^2 - \\frac{\\mu}{r} $
+
+    Returns:
+        {ndarray} -- (n,) boyutlu dizi ($m^2/s^2$)
+    """
+    r, v = _konumHız(yörünge)
+    return (0.5*np.einsum("ij,ij->i", v, v)
+            - mu/np.sqrt(np.einsum("ij,ij->i", r, r)))
+
+
+def açısalMomentumDizisi(yörünge):
+    """
+    Her adım için spesifik açısal momentum $ h = r \\times v $
+
+    Returns:
+        {ndarray} -- 2B'de (n,) boyutlu (z bileşeni), 3B'de (n, 3) boyutlu
+        dizi ($m^2/s$)
+    """
+    r, v = _konumHız(yörünge)
+    if r.shape[1] == 2:
+        return r[:, 0]*v[:, 1] - r[:, 1]*v[:, 0]
+    return np.cross(r, v)
+
+
+def eksantriklikVektörDizisi(yörünge, mu=muDünya):
+    """
+    Her adım için eksantriklik vektörü
+    $ e = \\frac{(v^2 - \\mu/r) r - (r \\cdot v) v}{\\mu} $
+
+    Returns:
+        {ndarray} -- (n, d) boyutlu dizi; büyüklüğü eksantriklik
+    """
+    r, v = _konumHız(yörünge)
+    rBüyüklüğü = np.sqrt(np.einsum("ij,ij->i", r, r))
+    vKare = np.einsum("ij,ij->i", v, v)
+    rv = np.einsum("ij,ij->i", r, v)
+    return ((vKare - mu/rBüyüklüğü)[:, None]*r - rv[:, None]*v) / mu
+
+
+def bağılSapma(seri, referans=None):
+    """
+    Bir serinin referans değere (varsayılan: ilk eleman) göre bağıl sapması.
+
+    Skaler seriler için (x - x0)/|x0|, vektör seriler için |x - x0|/|x0|.
+    Referans sıfırsa mutlak sapma döndürülür.
+
+    Returns:
+        {ndarray} -- (n,) boyutlu dizi
+    """
+    seri = np.asarray(seri, dtype=np.float64)
+    referans = seri[0] if referans is None else np.asarray(referans,
+                                                           dtype=np.float64)
+    fark = seri - referans
+    if seri.ndim == 2:
+        fark = np.sqrt(np.einsum("ij,ij->i", fark, fark))
+    ölçek = np.linalg.norm(referans)
+    return fark / ölçek if ölçek > 0 else fark
+
+
+def korunumHataları(yörünge, mu=muDünya):
+    """
+    Yörünge boyunca korunan büyüklüklerin başlangıca göre sapmaları.
+
+    Returns:
+        {dict} -- "enerji" ve "açısalMomentum" bağıl sapmaları,
+        "eksantriklik" eksantriklik vektörünün mutlak sapması; her biri (n,)
+        boyutlu dizi
+    """
+    e = eksantriklikVektörDizisi(yörünge, mu)
+    return {
+        "enerji": bağılSapma(spesifikEnerjiDizisi(yörünge, mu)),
+        "açısalMomentum": bağılSapma(açısalMomentumDizisi(yörünge)),
+        "eksantriklik": np.linalg.norm(e - e[0], axis=1),
+    }
+
+
+class Korunumİzleyici:
+    """
+    Korunan büyüklüklerin sapmalarını durumları saklamadan izler.
+
+    Durumlar tek tek ya da parça parça ekle() ile verilir; her parça tek
+    bir vektörleştirilmiş geçişte işlenir. Bellek kullanımı adım sayısından
+    bağımsızdır. Enerji sapmasının ortalama ve varyansı parçalar
+    birleştirilerek (Chan vd.) hesaplanır.
+    """
+    __slots__ = ("mu", "n", "enerji0", "momentum0", "eksantriklik0",
+                 "enerjiSapması", "momentumSapması", "eksantriklikSapması",
+                 "enBüyükEnerjiSapması", "enBüyükMomentumSapması",
+                 "enBüyükEksantriklikSapması", "_ortalama", "_M2")
+
+    def __init__(self, mu=muDünya):
+        self.mu = mu
+        self.n = 0
+        self.enerji0 = self.momentum0 = self.eksantriklik0 = None
+        # son adımdaki sapmalar
+        self.enerjiSapması = self.momentumSapması = 0.0
+        self.eksantriklikSapması = 0.0
+        self.enBüyükEnerjiSapması = self.enBüyükMomentumSapması = 0.0
+        self.enBüyükEksantriklikSapması = 0.0
+        self._ortalama = self._M2 = 0.0
+
+    def ekle(self, durum):
+        """
+        Bir ya da birden çok durumu işler.
+
+        Arguments:
+            durum {array_like} -- (2d,) ya da (n, 2d) boyutlu [r v] dizisi
+                veya Yörünge
+        """
+        enerji = spesifikEnerjiDizisi(durum, self.mu)
+        if len(enerji) == 0:
+            return
+        momentum = açısalMomentumDizisi(durum)
+        e = eksantriklikVektörDizisi(durum, self.mu)
+        if self.n == 0:
+            self.enerji0, self.momentum0, self.eksantriklik0 = \
+                enerji[0], momentum[0], e[0]
+
+        dE = bağılSapma(enerji, self.enerji0)
+        dH = bağılSapma(momentum, self.momentum0)
+        dEks = np.linalg.norm(e - self.eksantriklik0, axis=1)
+
+        self.enerjiSapması = dE[-1]
+        self.momentumSapması = dH[-1]
+        self.eksantriklikSapması = dEks[-1]
+        self.enBüyükEnerjiSapması = max(self.enBüyükEnerjiSapması,
+                                        np.abs(dE).max())
+        self.enBüyükMomentumSapması = max(self.enBüyükMomentumSapması,
+                                          np.abs(dH).max())
+        self.enBüyükEksantriklikSapması = max(self.enBüyükEksantriklikSapması,
+                                              dEks.max())
+
+        # parçanın ortalama ve varyansını öncekilerle birleştir
+        m = len(dE)
+        parçaOrtalama = dE.mean()
+        parçaM2 = np.sum((dE - parçaOrtalama)**2)
+        toplam = self.n + m
+        fark = parçaOrtalama - self._ortalama
+        self._ortalama += fark*m/toplam
+        self._M2 += parçaM2 + fark**2*self.n*m/toplam
+        self.n = toplam
+
+    @property
+    def enerjiSapmasıOrtalaması(self):
+        return self._ortalama
+
+    @property
+    def enerjiSapmasıStandartSapması(self):
+        return np.sqrt(self._M2/self.n) if self.n else 0.0
+
+    def özet(self):
+        """İzlenen değerlerin sözlük olarak özeti."""
+        return {
+            "adımSayısı": self.n,
+            "enerjiSapması": self.enerjiSapması,
+            "enBüyükEnerjiSapması": self.enBüyükEnerjiSapması,
+            "enerjiSapmasıOrtalaması": self.enerjiSapmasıOrtalaması,
+            "enerjiSapmasıStandartSapması": self.enerjiSapmasıStandartSapması,
+            "enBüyükMomentumSapması": self.enBüyükMomentumSapması,
+            "enBüyükEksantriklikSapması": self.enBüyükEksantriklikSapması,
+        }
+
+
+def izleyerekİlerlet(pvt0, tAdım, tSon, çözücüTipi=ODEÇözücüTipi.YOSHIDA4,
+                     mu=muDünya, blok=65536, izleyici=None):
+    """
+    Sabit adımlı bir yöntemle tSon'a kadar ilerler; ara durumları saklamadan
+    korunan büyüklükleri izler.
+
+    İntegrasyon blok adımlık parçalarla yapılır ve her parça izleyiciye
+    verildikten sonra bırakılır; bellek kullanımı toplam adım sayısından
+    bağımsızdır.
+
+    Arguments:
+        pvt0 {ZamanKonumHız} -- başlangıç zamanında zaman konum hız
+        tAdım {float} -- adım büyüklüğü (s)
+        tSon {float} -- bitiş zamanı (s)
+
+    Keyword Arguments:
+        çözücüTipi {ODEÇözücüTipi} -- sabit adımlı çözücü tipi
+        mu {float} -- Kütleçekimi Sabiti (m^3/s^2) (default: {muDünya})
+        blok {int} -- parça başına adım sayısı (default: {65536})
+        izleyici {Korunumİzleyici} -- kullanılacak izleyici; None ise yenisi
+
+    Returns:
+        {tuple} -- son durum (ZamanKonumHız) ve Korunumİzleyici
+    """
+    izleyici = izleyici or Korunumİzleyici(mu)
+    adımSayısı = int(np.floor((tSon - pvt0.t)/tAdım + 1e-9))
+    y = np.concatenate([pvt0.r, pvt0.v])
+    izleyici.ekle(y)
+    i = 0
+    while i < adımSayısı:
+        j = min(i + blok, adımSayısı)
+        _, durum = sabitAdımlıÇözüm(y, pvt0.t + i*tAdım, tAdım,
+                                    pvt0.t + j*tAdım, çözücüTipi,
+                                    İvmeModeli.İKİCİSİM, mu)
+        izleyici.ekle(durum[1:])
+        i, y = j, durum[-1]
+    return ZamanKonumHız(min(pvt0.t + adımSayısı*tAdım, tSon), *y), izleyici
@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""
+Olay (event) algılamalı yörünge hesabı.
+
+Yere çarpma, apoapsis/periapsis ve irtifa geçişleri gibi olaylar adım adım
+ilerleyip işaret değişimini beklemek yerine kök bularak hassas biçimde
+hesaplanır. Terminal olaylar integrasyonu durdurur, diğerleri sadece
+kaydedilir. Sonuçta sadece istenen zamanlar ve olay anları döndürülür;
+böylece büyük (uyarlamalı) adımlarla çalışırken ilgilenilen noktalardaki
+doğruluk kaybedilmez.
+
+Örnek: bir atışın yere çarpma anı ve 100 m'yi aşağı doğru geçtiği an
+
+    çözüm = olaylıÇözüm([0, 0, 60, 80], 0, 100,
+                        [yereÇarpma(), yükseklikGeçişi(100, yön=-1)],
+                        model=İvmeModeli.SABİTYERÇEKİMİ, parametre=gDünya)
+    çözüm.olaylar["yereÇarpma"].t     # tek RK45 adımı, hata ~1e-14 s
+"""
+import numpy as np
+from scipy.integrate import solve_ivp
+from scipy.optimize import brentq
+
+from .cozuculer import (İvmeModeli, ODEÇözücüTipi, hermiteEğrisi, ivmeler,
+                        sabitAdımlıÇözüm)
+from .ikicisim import ZamanKonumHız, muDünya, rDünya
+from .yorunge import DurumGörünümü, Yörünge
+
+
+class Olay:
+    """
+    Durumun sürekli bir fonksiyonunun sıfırdan geçişi.
+
+    fonksiyon(t, y) çağrısında y, tek bir durum için (2d,) ya da n durum
+    için (2d, n) boyutlu olabilir. terminal ve direction özellikleri
+    solve_ivp'nin beklediği adlarla tutulur: direction > 0 sadece artarak,
+    < 0 sadece azalarak, 0 her iki yönde geçişler.
+    """
+    __slots__ = ("isim", "fonksiyon", "terminal", "direction")
+
+    def __init__(self, isim, fonksiyon, terminal=False, yön=0):
+        self.isim = isim
+        self.fonksiyon = fonksiyon
+        self.terminal = terminal
+        self.direction = yön
+
+    def __call__(self, t, y):
+        return self.fonksiyon(t, y)
+
+    def __repr__(self):
+        return "Olay(%r, terminal=%r, yön=%r)" % (self.isim, self.terminal,
+                                                   self.direction)
+
+
+def _konum(y):
+    return y[:len(y)//2]
+
+
+def _hız(y):
+    return y[len(y)//2:]
+
+
+def yereÇarpma(yükseklik=0.0, terminal=True, isim="yereÇarpma"):
+    """
+    Düz zemin modelinde (son eksen yukarı) cismin yüksekliğe aşağı doğru
+    inmesi. Varsayılan olarak integrasyonu durdurur.
+    """
+    return Olay(isim, lambda t, y: _konum(y)[-1] - yükseklik, terminal, -1)
+
+
+def yükseklikGeçişi(yükseklik, yön=0, terminal=False, isim=None):
+    """Düz zemin modelinde (son eksen yukarı) verilen yüksekliğin geçilmesi."""
+    isim = isim or "yükseklik %g" % yükseklik
+    return Olay(isim, lambda t, y: _konum(y)[-1] - yükseklik, terminal, yön)
+
+
+def irtifaGeçişi(irtifa, yarıçap=rDünya, yön=0, terminal=False, isim=None):
+    """
+    Merkezi kütleçekimi modelinde yüzeyden verilen irtifanın geçilmesi;
+    yön=-1 ile atmosfere giriş ya da yere çarpma.
+    """
+    isim = isim or "irtifa %g" % irtifa
+    return Olay(isim,
+                lambda t, y: np.sqrt(np.sum(_konum(y)**2, axis=0)) - yarıçap - irtifa,
+                terminal, yön)
+
+
+def apoapsis(terminal=False, isim="apoapsis"):
+    """Merkeze uzaklığın en büyük olduğu an (r.v artıdan eksiye geçer)."""
+    return Olay(isim, lambda t, y: np.sum(_konum(y)*_hız(y), axis=0),
+                terminal, -1)
+
+
+def periapsis(terminal=False, isim="periapsis"):
+    """Merkeze uzaklığın en küçük olduğu an (r.v eksiden artıya geçer)."""
+    return Olay(isim, lambda t, y: np.sum(_konum(y)*_hız(y), axis=0),
+                terminal, 1)
+
+
+class OlaylıÇözüm:
+    """
+    olaylıÇözüm sonucu.
+
+    yörünge -- istenen zamanlardaki durumlar; terminal bir olay gerçekleşirse
+        son elemanı olay anıdır
+    olaylar -- olay ismi -> o olayın bütün gerçekleşme anlarını içeren Yörünge
+    adımSayısı -- integrasyon adımı sayısı (uyarlamalı çözücülerde zamanlar
+        verilmişse None)
+    fonksiyonÇağrısı -- ivme (diferansiyel denklem) hesabı sayısı
+    """
+    __slots__ = ("yörünge", "olaylar", "adımSayısı", "fonksiyonÇağrısı")
+
+    def __init__(self, yörünge, olaylar, adımSayısı, fonksiyonÇağrısı):
+        self.yörünge = yörünge
+        self.olaylar = olaylar
+        self.adımSayısı = adımSayısı
+        self.fonksiyonÇağrısı = fonksiyonÇağrısı
+
+
+def _geçişler(g, yön):
+    """
+    Ardışık adımlar arasında g'nin (yöne göre) sıfırdan geçtiği aralıklar.
+    solve_ivp ile aynı kural: sınırda sıfır olan değerler geçiş sayılır.
+    """
+    artan = (g[:-1] <= 0) & (g[1:] >= 0)
+    azalan = (g[:-1] >= 0) & (g[1:] <= 0)
+    if yön > 0:
+        return np.flatnonzero(artan)
+    if yön < 0:
+        return np.flatnonzero(azalan)
+    return np.flatnonzero(artan | azalan)
+
+
+def _sabitAdımlıOlaylar(durum0, t0, tSon, olaylar, zamanlar, çözücüTipi,
+                        model, parametre, tAdım, blok=256):
+    """
+    Sabit adımlı çekirdekle integre eder; olay anlarını adımlar arasındaki
+    kübik Hermite ara değerlemesi üzerinde kök bularak hesaplar.
+
+    Çekirdek blok adımlık (her seferinde iki katına çıkan) parçalarla
+    çalıştırılır ve her parçadan sonra terminal olaylara bakılır; böylece
+    tSon uzak olsa da olaydan sonrası hesaplanmaz.
+    """
+    # adımı tSon'a tam oturacak şekilde (en fazla tAdım) ayarla
+    adımSayısı = max(int(np.ceil((tSon - t0)/tAdım - 1e-9)), 1)
+    tAdım = (tSon - t0) / adımSayısı
+    terminaller = [olay for olay in olaylar if olay.terminal]
+
+    zamanParçaları, durumParçaları = [], []
+    i, y = 0, durum0
+    while True:
+        j = min(i + blok, adımSayısı)
+        tParça, durumParça = sabitAdımlıÇözüm(y, t0 + i*tAdım, tAdım,
+                                              t0 + j*tAdım, çözücüTipi,
+                                              model, parametre)
+        zamanParçaları.append(tParça if i == 0 else tParça[1:])
+        durumParçaları.append(durumParça if i == 0 else durumParça[1:])
+        if j == adımSayısı or any(
+                len(_geçişler(olay(tParça, durumParça.T), olay.direction))
+                for olay in terminaller):
+            break
+        i, y, blok = j, durumParça[-1], min(2*blok, 65536)
+    t = np.concatenate(zamanParçaları)
+    durum = np.concatenate(durumParçaları)
+
+    d = durum.shape[1] // 2
+    eğri = hermiteEğrisi(t, durum, model, parametre)
+
+    anlar = {}
+    tDur = np.inf
+    for olay in olaylar:
+        g = olay(t, durum.T)
+        kökler = [brentq(lambda s: olay(s, eğri(s)), t[k], t[k+1], xtol=1e-12)
+                  for k in _geçişler(g, olay.direction)]
+        anlar[olay.isim] = np.array(kökler)
+        if olay.terminal and kökler:
+            tDur = min(tDur, kökler[0])
+
+    olayDurumları = {}
+    for olay in olaylar:
+        tOlay = anlar[olay.isim]
+        tOlay = tOlay[tOlay <= tDur]
+        olayDurumları[olay.isim] = (tOlay, eğri(tOlay).reshape(-1, 2*d))
+
+    if zamanlar is None:
+        tÇıktı = t[t < tDur]
+        durumÇıktı = durum[:len(tÇıktı)]
+    else:
+        tÇıktı = zamanlar[zamanlar < tDur]
+        durumÇıktı = eğri(tÇıktı).reshape(-1, 2*d)
+    if np.isfinite(tDur):
+        tÇıktı = np.append(tÇıktı, tDur)
+        durumÇıktı = np.vstack([durumÇıktı, eğri(tDur)])
+
+    # durmaya kadar atılan adım ve adım başına ivme hesabı sayısı
+    adım = min(len(t) - 1, int(np.searchsorted(t, tDur)))
+    çağrı = {ODEÇözücüTipi.EULER: 1, ODEÇözücüTipi.RK4: 4,
+             ODEÇözücüTipi.VERLET: 1, ODEÇözücüTipi.YOSHIDA4: 3}[çözücüTipi]
+    return tÇıktı, durumÇıktı, olayDurumları, adım, adım*çağrı
+
+
+def olaylıÇözüm(durum0, t0, tSon, olaylar=(), zamanlar=None,
+                çözücüTipi=ODEÇözücüTipi.RK45, model=İvmeModeli.İKİCİSİM,
+                parametre=muDünya, tAdım=None, rtol=1e-10, atol=1e-8,
+                durumSınıfı=DurumGörünümü):
+    """
+    Durumu t0'dan tSon'a ya da ilk terminal olaya kadar ilerletir ve
+    olayların gerçekleştiği anları hassas olarak bulur.
+
+    Uyarlamalı çözücülerde (RK45, DOP853 ...) adım büyüklüğü rtol/atol hata
+    toleransına göre seçilir ve olaylar solve_ivp'nin yoğun çıktısı üzerinde
+    kök bulunarak hesaplanır. Sabit adımlı çözücülerde (Euler, RK4, Verlet,
+    Yoshida4) tAdım adımlarıyla integre edilir; istenen zamanlar ve olay
+    anları adımlar arasında kübik Hermite ara değerlemesiyle bulunur.
+
+    Arguments:
+        durum0 {array_like} -- başlangıç durumu [r v], 2*d elemanlı
+        t0 {float} -- başlangıç zamanı (s)
+        tSon {float} -- en geç bitiş zamanı (s)
+
+    Keyword Arguments:
+        olaylar {list {Olay}} -- algılanacak olaylar (default: {()})
+        zamanlar {array_like} -- çıktı istenen zamanlar (s), artan sırada;
+            None ise çözücünün kendi adımları, boş dizi ise sadece olaylar
+            ve (varsa) durma anı döndürülür (default: {None})
+        çözücüTipi {ODEÇözücüTipi} -- ODE Çözücü Tipi (default: {RK45})
+        model {İvmeModeli} -- ivme modeli (default: {İKİCİSİM})
+        parametre {float} -- modelin parametresi, mu ya da g
+            (default: {muDünya})
+        tAdım {float} -- sabit adımlı çözücüler için adım büyüklüğü (s)
+        rtol {float} -- uyarlamalı çözücüler için bağıl tolerans
+        atol {float} -- uyarlamalı çözücüler için mutlak tolerans
+        durumSınıfı {type} -- yörünge elemanlarının sınıfı
+
+    Returns:
+        {OlaylıÇözüm} -- istenen zamanlardaki yörünge ve olay anları
+    """
+    durum0 = np.asarray(durum0, dtype=np.float64)
+    isimler = [olay.isim for olay in olaylar]
+    if len(set(isimler)) != len(isimler):
+        raise ValueError("olay isimleri birbirinden farklı olmalı")
+    if zamanlar is not None:
+        zamanlar = np.atleast_1d(np.asarray(zamanlar, dtype=np.float64))
+        if len(zamanlar) and (zamanlar[0] < t0 or zamanlar[-1] > tSon
+                              or np.any(np.diff(zamanlar) < 0)):
+            raise ValueError("zamanlar t0 ile tSon arasında ve artan sırada olmalı")
+
+    if çözücüTipi.sabitAdımlı:
+        if tAdım is None:
+            raise ValueError(çözücüTipi.value + " için tAdım gerekli")
+        (tÇıktı, durumÇıktı, olayDurumları, adımSayısı,
+         fonksiyonÇağrısı) = _sabitAdımlıOlaylar(durum0, t0, tSon, olaylar, zamanlar,
+                                  çözücüTipi, model, parametre, tAdım)
+    else:
+        d = len(durum0) // 2
+
+        def diffDenklem(t, y):
+            dy = np.empty_like(y)
+            dy[:d] = y[d:]
+            dy[d:] = ivmeler(y[:d], model, parametre)
+            return dy
+
+        ekSeçenekler = {}
+        if tAdım is not None:
+            ekSeçenekler["max_step"] = tAdım
+        diffDenkÇözüm = solve_ivp(diffDenklem, [t0, tSon], durum0,
+                                  method=çözücüTipi.value, t_eval=zamanlar,
+                                  events=list(olaylar) or None,
+                                  rtol=rtol, atol=atol, **ekSeçenekler)
+        if not diffDenkÇözüm.success:
+            raise RuntimeError(diffDenkÇözüm.message)
+
+        tÇıktı = diffDenkÇözüm.t
+        durumÇıktı = np.asarray(diffDenkÇözüm.y).reshape(2*d, -1).T
+        olayDurumları = {}
+        for i, olay in enumerate(olaylar):
+            tOlay = diffDenkÇözüm.t_events[i]
+            durumOlay = diffDenkÇözüm.y_events[i].reshape(-1, 2*d)
+            olayDurumları[olay.isim] = (tOlay, durumOlay)
+        # terminal bir olayla durulduysa son eleman olay anı olsun; t_eval
+        # verildiğinde solve_ivp bu anı çıktıya eklemez
+        if diffDenkÇözüm.status == 1 and zamanlar is not None:
+            tDur, durDurumu = max(
+                ((olayDurumları[olay.isim][0][-1], olayDurumları[olay.isim][1][-1])
+                 for olay in olaylar
+                 if olay.terminal and len(olayDurumları[olay.isim][0])),
+                key=lambda olayAnı: olayAnı[0])
+            tÇıktı = np.append(tÇıktı, tDur)
+            durumÇıktı = np.vstack([durumÇıktı, durDurumu])
+        # solve_ivp adım sayısını vermez; kabul edilen adımlar sadece
+        # t_eval verilmediğinde çıktıdadır
+        adımSayısı = len(diffDenkÇözüm.t) - 1 if zamanlar is None else None
+        fonksiyonÇağrısı = diffDenkÇözüm.nfev
+
+    yörünge = Yörünge.dizilerden(tÇıktı, durumÇıktı, durumSınıfı)
+    olaylarSözlüğü = {isim: Yörünge.dizilerden(tOlay, durumOlay, durumSınıfı)
+                      for isim, (tOlay, durumOlay) in olayDurumları.items()}
+    return OlaylıÇözüm(yörünge, olaylarSözlüğü, adımSayısı, fonksiyonÇağrısı)
+
+
+def yörüngeOlayları(pvt0, tSon, olaylar, zamanlar=None,
+                    çözücüTipi=ODEÇözücüTipi.RK45, mu=muDünya, **seçenekler):
+    """
+    İki cisim problemi için olaylıÇözüm; başlangıç durumu ZamanKonumHız.
+
+    Örnek: 30 günlük yörüngedeki bütün apoapsis ve periapsis geçişleri
+
+        çözüm = yörüngeOlayları(pvt0, pvt0.t + 30*86400,
+                                [apoapsis(), periapsis()], zamanlar=[])
+        çözüm.olaylar["apoapsis"].konumBüyüklüğü()
+
+    Returns:
+        {OlaylıÇözüm} -- yörünge ve olay elemanları ZamanKonumHız gibidir
+    """
+    return olaylıÇözüm(np.concatenate([pvt0.r, pvt0.v]), pvt0.t, tSon,
+                       olaylar, zamanlar, çözücüTipi, İvmeModeli.İKİCİSİM, mu,
+                       durumSınıfı=ZamanKonumHız, **seçenekler)
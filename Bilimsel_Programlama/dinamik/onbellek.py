@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""
+Yörünge hesapları için diskte içerik adresli önbellek.
+
+Bir hesabın anahtarı; fonksiyonun ismi, bütün argümanları (başlangıç
+ZamanKonumHız'ı, mu, adım, çözücü tipi, toleranslar ...) ve dinamik
+paketinin kaynak kodunun özetinden (SHA-256) oluşur. Kod değişince eski
+sonuçlar kullanılmaz. Sonuçlar .npy dosyaları olarak yazılır ve bellek
+eşlemeli (mmap) olarak, kopyalanmadan okunur. Toplam boyut sınırı aşılınca
+en uzun süredir kullanılmayan kayıtlar silinir (LRU).
+
+Örnek:
+
+    from dinamik.onbellek import önbellekle
+    odeÇözümü = önbellekle(odeÇözümü)
+    çözüm = odeÇözümü(pvt0, 60, 6000)   # ikinci çalıştırmada diskten
+
+Önbellek dizini DINAMIK_ONBELLEK ortam değişkeniyle değiştirilebilir
+(varsayılan: ~/.cache/dinamik).
+"""
+import functools
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+from enum import Enum
+
+import numpy as np
+
+from .yorunge import DurumGörünümü, Yörünge
+
+# varsayılan en büyük önbellek boyutu [bayt]
+enBüyükBoyutVarsayılan = 512*2**20
+
+_kodSürümü = None
+
+
+def kodSürümü():
+    """dinamik paketindeki bütün .py dosyalarının SHA-256 özeti."""
+    global _kodSürümü
+    if _kodSürümü is None:
+        özet = hashlib.sha256()
+        dizin = os.path.dirname(os.path.abspath(__file__))
+        for isim in sorted(os.listdir(dizin)):
+            if isim.endswith(".py"):
+                özet.update(isim.encode())
+                with open(os.path.join(dizin, isim), "rb") as dosya:
+                    özet.update(dosya.read())
+        _kodSürümü = özet.hexdigest()
+    return _kodSürümü
+
+
+def _özetle(değer, özet):
+    """Bir değeri türüyle birlikte özete ekler; aynı değer aynı baytları verir."""
+    if değer is None or isinstance(değer, (bool, int, str)):
+        özet.update(repr((type(değer).__name__, değer)).encode())
+    elif isinstance(değer, float):
+        özet.update(b"float" + float.hex(değer).encode())
+    elif isinstance(değer, Enum):
+        özet.update(repr((type(değer).__qualname__, değer.value)).encode())
+    elif isinstance(değer, np.generic):
+        _özetle(değer.item(), özet)
+    elif isinstance(değer, np.ndarray):
+        değer = np.ascontiguousarray(değer)
+        özet.update(repr(("ndarray", değer.dtype.str, değer.shape)).encode())
+        özet.update(değer.tobytes())
+    elif isinstance(değer, DurumGörünümü):
+        özet.update(type(değer).__qualname__.encode())
+        _özetle(float(değer.t), özet)
+        _özetle(np.asarray(değer.r, dtype=np.float64), özet)
+        _özetle(np.asarray(değer.v, dtype=np.float64), özet)
+    elif isinstance(değer, Yörünge):
+        özet.update(b"Yorunge")
+        _özetle(değer.t, özet)
+        _özetle(değer.durum, özet)
+    elif isinstance(değer, (list, tuple)):
+        özet.update(repr((type(değer).__name__, len(değer))).encode())
+        for eleman in değer:
+            _özetle(eleman, özet)
+    elif isinstance(değer, dict):
+        özet.update(repr(("dict", len(değer))).encode())
+        for anahtar in sorted(değer, key=repr):
+            _özetle(anahtar, özet)
+            _özetle(değer[anahtar], özet)
+    else:
+        raise TypeError(type(değer).__name__ + " önbellek anahtarında kullanılamaz")
+
+
+def anahtar(*parçalar):
+    """
+    Parçalardan ve kod sürümünden önbellek anahtarı (onaltılık SHA-256).
+
+    Raises:
+        TypeError -- desteklenmeyen bir parça türü varsa
+    """
+    özet = hashlib.sha256(kodSürümü().encode())
+    for parça in parçalar:
+        _özetle(parça, özet)
+    return özet.hexdigest()
+
+
+class Önbellek:
+    """
+    Sonuçları dizin başına bir kayıt olarak saklayan LRU önbellek.
+
+    Saklanabilen değerler: Yörünge, ndarray ve bunların demet/listeleri.
+    """
+
+    def __init__(self, dizin=None, enBüyükBoyut=enBüyükBoyutVarsayılan):
+        """
+        Keyword Arguments:
+            dizin {str} -- önbellek dizini (default: {DINAMIK_ONBELLEK ya da
+                ~/.cache/dinamik})
+            enBüyükBoyut {int} -- toplam boyut sınırı, bayt
+        """
+        if dizin is None:
+            dizin = os.environ.get("DINAMIK_ONBELLEK") or os.path.join(
+                os.path.expanduser("~"), ".cache", "dinamik")
+        self.dizin = dizin
+        self.enBüyükBoyut = enBüyükBoyut
+
+    def _kayıt(self, anahtar):
+        return os.path.join(self.dizin, anahtar)
+
+    def __contains__(self, anahtar):
+        return os.path.isdir(self._kayıt(anahtar))
+
+    def oku(self, anahtar):
+        """
+        Kaydı bellek eşlemeli olarak okur ve son kullanım zamanını günceller.
+
+        Returns:
+            kayıtlı değer; yoksa None
+        """
+        kayıt = self._kayıt(anahtar)
+        try:
+            with open(os.path.join(kayıt, "tip.json"), encoding="utf-8") as dosya:
+                tip = json.load(dosya)
+            diziler = [np.load(os.path.join(kayıt, "%d.npy" % i), mmap_mode="r")
+                       for i in range(tip["diziSayısı"])]
+            os.utime(kayıt)
+        except (OSError, ValueError, KeyError):
+            return None
+
+        if tip["tip"] == "Yörünge":
+            modül, _, sınıf = tip["durumSınıfı"].rpartition(".")
+            durumSınıfı = getattr(importlib.import_module(modül), sınıf)
+            return Yörünge.dizilerden(diziler[0], diziler[1], durumSınıfı)
+        if tip["tip"] == "dizi":
+            return diziler[0]
+        return tuple(diziler) if tip["tip"] == "tuple" else diziler
+
+    def yaz(self, anahtar, değer):
+        """
+        Değeri kaydeder ve gerekirse eski kayıtları siler.
+
+        Raises:
+            TypeError -- değer saklanamıyorsa
+        """
+        if isinstance(değer, Yörünge):
+            sınıf = değer.durumSınıfı
+            tip = {"tip": "Yörünge",
+                   "durumSınıfı": sınıf.__module__ + "." + sınıf.__qualname__}
+            diziler = [değer.t, değer.durum]
+        elif isinstance(değer, np.ndarray):
+            tip, diziler = {"tip": "dizi"}, [değer]
+        elif isinstance(değer, (tuple, list)) and all(
+                isinstance(d, np.ndarray) for d in değer):
+            tip, diziler = {"tip": type(değer).__name__}, list(değer)
+        else:
+            raise TypeError(type(değer).__name__ + " önbelleğe yazılamaz")
+        tip["diziSayısı"] = len(diziler)
+
+        # önce geçici dizine yaz, sonra tek adımda yerine taşı; aynı anda
+        # yazan süreçler yarım kayıt göremez
+        os.makedirs(self.dizin, exist_ok=True)
+        geçici = tempfile.mkdtemp(prefix=".yaziliyor-", dir=self.dizin)
+        try:
+            for i, dizi in enumerate(diziler):
+                np.save(os.path.join(geçici, "%d.npy" % i), dizi)
+            with open(os.path.join(geçici, "tip.json"), "w", encoding="utf-8") as dosya:
+                json.dump(tip, dosya)
+            os.replace(geçici, self._kayıt(anahtar))
+        except OSError:
+            # başka bir süreç aynı kaydı yazmış
+            shutil.rmtree(geçici, ignore_errors=True)
+        self.boşalt()
+
+    def kayıtlar(self):
+        """(son kullanım zamanı, boyut, anahtar) listesi, eskiden yeniye."""
+        sonuç = []
+        if not os.path.isdir(self.dizin):
+            return sonuç
+        for isim in os.listdir(self.dizin):
+            kayıt = self._kayıt(isim)
+            if isim.startswith(".") or not os.path.isdir(kayıt):
+                continue
+            try:
+                boyut = sum(os.path.getsize(os.path.join(kayıt, dosya))
+                            for dosya in os.listdir(kayıt))
+                sonuç.append((os.path.getmtime(kayıt), boyut, isim))
+            except OSError:
+                continue
+        return sorted(sonuç)
+
+    def boşalt(self):
+        """Toplam boyut sınırın altına inene kadar en eski kayıtları siler."""
+        kayıtlar = self.kayıtlar()
+        toplam = sum(boyut for _, boyut, _ in kayıtlar)
+        for _, boyut, isim in kayıtlar:
+            if toplam <= self.enBüyükBoyut:
+                break
+            shutil.rmtree(self._kayıt(isim), ignore_errors=True)
+            toplam -= boyut
+
+    def temizle(self):
+        """Bütün kayıtları siler."""
+        for _, _, isim in self.kayıtlar():
+            shutil.rmtree(self._kayıt(isim), ignore_errors=True)
+
+
+def önbellekle(fonksiyon=None, önbellek=None):
+    """
+    Bir yörünge hesabı fonksiyonunun sonuçlarını önbelleğe alır.
+
+    Argümanlar varsayılan değerleri doldurularak anahtara katılır; bu yüzden
+    odeÇözümü(pvt0, 60, 6000) ile odeÇözümü(pvt0, 60, 6000, RK45) aynı
+    kaydı kullanır. Anahtara katılamayan bir argüman (ör. Olay nesneleri)
+    ya da saklanamayan bir sonuç (ör. TembelYörünge) varsa fonksiyon
+    önbelleksiz çalışır.
+
+    @önbellekle ya da önbellekle(önbellek=Önbellek(...))(fonksiyon)
+    biçiminde kullanılabilir.
+    """
+    if fonksiyon is None:
+        return functools.partial(önbellekle, önbellek=önbellek)
+    önbellek = önbellek or Önbellek()
+    imza = inspect.signature(fonksiyon)
+    isim = fonksiyon.__module__ + "." + fonksiyon.__qualname__
+
+    @functools.wraps(fonksiyon)
+    def sarmalayıcı(*args, **kwargs):
+        bağlı = imza.bind(*args, **kwargs)
+        bağlı.apply_defaults()
+        try:
+            kayıtAnahtarı = anahtar(isim, dict(bağlı.arguments))
+        except TypeError:
+            return fonksiyon(*args, **kwargs)
+        değer = önbellek.oku(kayıtAnahtarı)
+        if değer is None:
+            değer = fonksiyon(*args, **kwargs)
+            try:
+                önbellek.yaz(kayıtAnahtarı, değer)
+            except TypeError:
+                pass
+        return değer
+
+    sarmalayıcı.önbellek = önbellek
+    return sarmalayıcı
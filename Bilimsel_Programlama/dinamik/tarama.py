@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Parametre taraması: başlangıç durumları x adım büyüklükleri x çözücüler.
+
+Her bileşim bir süreç havuzunda (ProcessPoolExecutor) ayrı ayrı çözülür;
+son durumlar, analitik çözüme göre hatalar ve çalışma süreleri tek bir
+NumPy yapılandırılmış dizisinde (structured array) toplanır. Sonuç
+np.save ile saklanabilir ve alan isimleriyle süzülebilir:
+
+    sonuç = tarama(durumlar, [1, 10, 60], [ODEÇözücüTipi.EULER,
+                                           ODEÇözücüTipi.YOSHIDA4], tSon)
+    sonuç[sonuç["çözücü"] == "Yoshida4"]["konumHatası"]
+
+Süreç havuzu kullanan betiklerin ana kodu `if __name__ == "__main__":`
+altında olmalıdır (Windows ve macOS'ta alt süreçler betiği yeniden yükler).
+"""
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .cozuculer import İvmeModeli
+from .ikicisim import muDünya
+from .kepler import keplerİlerlet
+from .olaylar import olaylıÇözüm
+
+
+def sonuçTipi(boyut=2):
+    """tarama sonucunun yapılandırılmış dizi (dtype) tipi."""
+    return np.dtype([
+        ("durum", np.int64),            # başlangıç durumunun sırası
+        ("tAdım", np.float64),          # adım büyüklüğü (s)
+        ("çözücü", "U8"),               # ODEÇözücüTipi değeri
+        ("başlangıç", np.float64, (2*boyut,)),
+        ("son", np.float64, (2*boyut,)),
+        ("konumHatası", np.float64),    # analitik çözüme göre (m)
+        ("hızHatası", np.float64),      # analitik çözüme göre (m/s)
+        ("enerjiHatası", np.float64),   # bağıl spesifik enerji hatası
+        ("fonksiyonÇağrısı", np.int64),
+        ("süre", np.float64),           # çalışma süresi (s)
+    ])
+
+
+def _tekÇözüm(görev):
+    """Süreç havuzunda çalışan iş: tek bir bileşimi çözer."""
+    durum0, t0, tSon, tAdım, çözücüTipi, model, parametre, rtol, atol = görev
+    başla = time.perf_counter()
+    try:
+        çözüm = olaylıÇözüm(durum0, t0, tSon, zamanlar=[tSon],
+                            çözücüTipi=çözücüTipi, model=model,
+                            parametre=parametre, tAdım=tAdım,
+                            rtol=rtol, atol=atol)
+        son, çağrı = çözüm.yörünge.durum[-1], çözüm.fonksiyonÇağrısı
+    except RuntimeError:
+        son, çağrı = np.full(len(durum0), np.nan), -1
+    return son, çağrı, time.perf_counter() - başla
+
+
+def analitikSonDurum(durumlar, t0, tSon, model=İvmeModeli.İKİCİSİM,
+                     parametre=muDünya):
+    """
+    Başlangıç durumlarının tSon'daki analitik değerleri (Kepler ya da sabit
+    yerçekimi altında kapalı çözüm).
+
+    Arguments:
+        durumlar {ndarray} -- (N, 2d) boyutlu başlangıç durumları
+
+    Returns:
+        {ndarray} -- (N, 2d) boyutlu son durumlar
+    """
+    durumlar = np.asarray(durumlar, dtype=np.float64)
+    d = durumlar.shape[1] // 2
+    r0, v0 = durumlar[:, :d], durumlar[:, d:]
+    dt = tSon - t0
+    if model == İvmeModeli.İKİCİSİM:
+        r, v = keplerİlerlet(r0, v0, [dt], parametre)
+        return np.hstack([r[:, 0], v[:, 0]])
+    g = np.zeros(d)
+    g[-1] = -parametre
+    return np.hstack([r0 + v0*dt + 0.5*g*dt**2, v0 + g*dt])
+
+
+def _enerjiler(durumlar, model, parametre):
+    d = durumlar.shape[1] // 2
+    r, v = durumlar[:, :d], durumlar[:, d:]
+    kinetik = 0.5*np.einsum("ij,ij->i", v, v)
+    if model == İvmeModeli.İKİCİSİM:
+        return kinetik - parametre/np.linalg.norm(r, axis=1)
+    return kinetik + parametre*r[:, -1]
+
+
+def tarama(durumlar, tAdımlar, çözücüTipleri, tSon, t0=0.0,
+           model=İvmeModeli.İKİCİSİM, parametre=muDünya, rtol=1e-10,
+           atol=1e-8, işSayısı=None):
+    """
+    Bütün başlangıç durumu, adım büyüklüğü ve çözücü bileşimlerini çözer.
+
+    Sabit adımlı çözücüler tAdım adımlarıyla (tSon'a oturacak şekilde),
+    uyarlamalı çözücüler rtol/atol ile ve en büyük adım tAdım olacak
+    şekilde çalışır.
+
+    Arguments:
+        durumlar {array_like} -- (N, 2d) boyutlu başlangıç durumları [r v]
+        tAdımlar {array_like} -- adım büyüklükleri (s)
+        çözücüTipleri {list {ODEÇözücüTipi}} -- çözücüler
+        tSon {float} -- bitiş zamanı (s)
+
+    Keyword Arguments:
+        t0 {float} -- başlangıç zamanı (s) (default: {0.0})
+        model {İvmeModeli} -- ivme modeli (default: {İKİCİSİM})
+        parametre {float} -- modelin parametresi, mu ya da g
+        rtol {float} -- uyarlamalı çözücüler için bağıl tolerans
+        atol {float} -- uyarlamalı çözücüler için mutlak tolerans
+        işSayısı {int} -- süreç sayısı; None ise işlemci sayısı, 1 ise süreç
+            havuzu kullanılmadan sırayla
+
+    Returns:
+        {ndarray} -- N x len(tAdımlar) x len(çözücüTipleri) satırlı
+        yapılandırılmış dizi (bkz. sonuçTipi)
+    """
+    durumlar = np.atleast_2d(np.asarray(durumlar, dtype=np.float64))
+    if durumlar.ndim != 2 or durumlar.shape[1] not in (4, 6):
+        raise ValueError("başlangıç durumları (N, 4) ya da (N, 6) boyutlu olmalı")
+    bileşimler = list(itertools.product(range(len(durumlar)),
+                                        [float(h) for h in tAdımlar],
+                                        list(çözücüTipleri)))
+    görevler = [(durumlar[i], t0, tSon, h, tip, int(model), parametre, rtol,
+                 atol) for i, h, tip in bileşimler]
+
+    işSayısı = işSayısı or os.cpu_count() or 1
+    if işSayısı == 1 or len(görevler) == 1:
+        çıktılar = list(map(_tekÇözüm, görevler))
+    else:
+        # kısa işlerde süreçler arası iletişim yükünü azaltmak için parça
+        # parça gönder
+        parça = max(1, len(görevler) // (4*işSayısı))
+        with ProcessPoolExecutor(işSayısı) as havuz:
+            çıktılar = list(havuz.map(_tekÇözüm, görevler, chunksize=parça))
+
+    sonuç = np.zeros(len(görevler), dtype=sonuçTipi(durumlar.shape[1] // 2))
+    indis = np.array([i for i, _, _ in bileşimler], dtype=np.int64)
+    sonuç["durum"] = indis
+    sonuç["tAdım"] = [h for _, h, _ in bileşimler]
+    sonuç["çözücü"] = [tip.value for _, _, tip in bileşimler]
+    sonuç["başlangıç"] = durumlar[indis]
+    sonuç["son"] = [son for son, _, _ in çıktılar]
+    sonuç["fonksiyonÇağrısı"] = [çağrı for _, çağrı, _ in çıktılar]
+    sonuç["süre"] = [süre for _, _, süre in çıktılar]
+
+    # hataları bütün satırlar için tek seferde hesapla
+    d = durumlar.shape[1] // 2
+    referans = analitikSonDurum(durumlar, t0, tSon, model, parametre)[indis]
+    fark = sonuç["son"] - referans
+    sonuç["konumHatası"] = np.linalg.norm(fark[:, :d], axis=1)
+    sonuç["hızHatası"] = np.linalg.norm(fark[:, d:], axis=1)
+    enerji0 = _enerjiler(sonuç["başlangıç"], model, parametre)
+    enerji = _enerjiler(sonuç["son"], model, parametre)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sonuç["enerjiHatası"] = np.abs(enerji - enerji0) / np.abs(enerji0)
+    return sonuç
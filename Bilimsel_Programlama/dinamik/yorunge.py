@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""
+Yörünge verisi için dizi tabanlı kap.
+
+Her zaman adımı için ayrı bir ZamanKonumHız nesnesi ve iki yeni NumPy dizisi
+yaratmak yerine bütün zaman değerleri (n,) boyutlu, bütün konum ve hız
+değerleri (n, 2d) boyutlu, önceden ayrılmış bitişik dizilerde tutulur.
+Grafikler ve enerji hesapları sütunlara doğrudan erişir; tek bir adıma
+ihtiyaç olduğunda veri kopyalanmadan küçük bir görünüm nesnesi verilir.
+"""
+import numpy as np
+
+
+class DurumGörünümü:
+    """
+    Yörüngedeki tek bir zaman, konum ve hız değerine bakan hafif nesne.
+
+    r ve v, yörünge dizisinin ilgili satırına bakan görünümlerdir; veri
+    kopyalanmaz. ZamanKonumHız ile aynı alanlara sahiptir.
+    """
+    __slots__ = ("t", "r", "v")
+
+    def __init__(self, t, r, v):
+        """
+        Arguments:
+            t {float} -- zaman (s)
+            r {ndarray} -- konum vektörü (m)
+            v {ndarray} -- hız vektörü (m/s)
+        """
+        self.t = t
+        self.r = r
+        self.v = v
+
+    @classmethod
+    def görünüm(cls, t, r, v):
+        """Alt sınıfların __init__ metodunu çağırmadan görünüm yaratır."""
+        durum = object.__new__(cls)
+        DurumGörünümü.__init__(durum, t, r, v)
+        return durum
+
+    def konumBüyüklüğü(self):
+        """Konum vektörünün büyüklüğünü döndürür
+
+        Returns:
+            float -- Konum vektörünün büyüklüğü ($m$)
+        """
+        return np.linalg.norm(self.r)
+
+    def hızBüyüklüğü(self):
+        """Hız vektörünün büyüklüğünü döndürür
+
+        Returns:
+            float -- Hız vektörünün büyüklüğü ($m/s$)
+        """
+        return np.linalg.norm(self.v)
+
+
+class Yörünge:
+    """
+    Zaman ve durum (konum, hız) dizilerini bitişik bellekte tutan kap.
+
+    Durum dizisinin her satırı [r_1 .. r_d v_1 .. v_d] biçimindedir; bu
+    solve_ivp'nin kullandığı düzenle aynıdır. Kapasite dolunca diziler iki
+    katına büyütülür, böylece ekle() ortalama sabit sürede çalışır.
+    """
+    __slots__ = ("_t", "_durum", "_n", "boyut", "durumSınıfı")
+
+    def __init__(self, kapasite, boyut=2, durumSınıfı=DurumGörünümü):
+        """
+        Boş bir yörünge yaratır.
+
+        Arguments:
+            kapasite {int} -- önceden yer ayrılacak adım sayısı
+            boyut {int} -- uzay boyutu (2 ya da 3)
+            durumSınıfı {type} -- tek adımlar için döndürülecek görünüm
+                sınıfı (DurumGörünümü ya da bir alt sınıfı)
+        """
+        self._t = np.empty(max(int(kapasite), 1))
+        self._durum = np.empty((len(self._t), 2*boyut))
+        self._n = 0
+        self.boyut = boyut
+        self.durumSınıfı = durumSınıfı
+
+    @classmethod
+    def dizilerden(cls, t, durum, durumSınıfı=DurumGörünümü):
+        """
+        Hazır zaman ve durum dizilerinden yörünge yaratır.
+
+        Diziler zaten bitişik float64 ise kopyalanmaz.
+
+        Arguments:
+            t {ndarray} -- (n,) boyutlu zaman dizisi (s)
+            durum {ndarray} -- (n, 2d) boyutlu konum ve hız dizisi
+
+        Returns:
+            {Yörünge} -- n adımlı yörünge
+        """
+        t = np.ascontiguousarray(t, dtype=np.float64)
+        durum = np.ascontiguousarray(durum, dtype=np.float64)
+        if durum.ndim != 2 or durum.shape[1] % 2 or len(durum) != len(t):
+            raise ValueError("durum dizisi (n, 2d) boyutlu olmalı; "
+                             "n zaman dizisinin uzunluğu")
+        yörünge = cls.__new__(cls)
+        yörünge._t = t
+        yörünge._durum = durum
+        yörünge._n = len(t)
+        yörünge.boyut = durum.shape[1] // 2
+        yörünge.durumSınıfı = durumSınıfı
+        return yörünge
+
+    def ekle(self, t, r, v):
+        """
+        Yörüngenin sonuna bir adım ekler.
+
+        Arguments:
+            t {float} -- zaman (s)
+            r {array_like} -- konum vektörü (m)
+            v {array_like} -- hız vektörü (m/s)
+        """
+        if self._n == len(self._t):
+            self._büyüt(2*self._n)
+        self._t[self._n] = t
+        self._durum[self._n, :self.boyut] = r
+        self._durum[self._n, self.boyut:] = v
+        self._n += 1
+
+    def _büyüt(self, kapasite):
+        t = np.empty(kapasite)
+        durum = np.empty((kapasite, self._durum.shape[1]))
+        t[:self._n] = self._t[:self._n]
+        durum[:self._n] = self._durum[:self._n]
+        self._t, self._durum = t, durum
+
+    def kırp(self):
+        """Kullanılmayan kapasiteyi bırakır."""
+        if self._n < len(self._t):
+            self._büyüt(self._n)
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return Yörünge.dizilerden(self.t[i], self.durum[i],
+                                      self.durumSınıfı)
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError("yörünge dizini aralığın dışında")
+        satır = self._durum[i]
+        return self.durumSınıfı.görünüm(self._t[i], satır[:self.boyut],
+                                        satır[self.boyut:])
+
+    def __iter__(self):
+        for i in range(self._n):
+            yield self[i]
+
+    # Sütunlara doğrudan erişim. Hepsi kopyalanmamış görünümlerdir.
+
+    @property
+    def t(self):
+        """(n,) boyutlu zaman dizisi (s)"""
+        return self._t[:self._n]
+
+    @property
+    def durum(self):
+        """(n, 2d) boyutlu konum ve hız dizisi"""
+        return self._durum[:self._n]
+
+    @property
+    def r(self):
+        """(n, d) boyutlu konum dizisi (m)"""
+        return self._durum[:self._n, :self.boyut]
+
+    @property
+    def v(self):
+        """(n, d) boyutlu hız dizisi (m/s)"""
+        return self._durum[:self._n, self.boyut:]
+
+    def konumBüyüklüğü(self):
+        """Her adımdaki konum vektörünün büyüklüğü ($m$)"""
+        return np.sqrt(np.einsum("ij,ij->i", self.r, self.r))
+
+    def hızBüyüklüğü(self):
+        """Her adımdaki hız vektörünün büyüklüğü ($m/s$)"""
+        return np.sqrt(np.einsum("ij,ij->i", self.v, self.v))
+
+
+class TembelYörünge:
+    """
+    Çözücünün yoğun çıktısı (dense output) üzerinden istenen zamanlarda
+    hesaplanan yörünge.
+
+    Adımlar önceden örneklenip saklanmaz; sadece ara değerleme katsayıları
+    tutulur ve konum/hız istendiğinde hesaplanır. Uzun bir integrasyonun
+    farklı aralıklarla ya da sadece belli zamanlarda incelenmesi için.
+    """
+    __slots__ = ("_eğri", "t0", "tSon", "boyut", "durumSınıfı")
+
+    def __init__(self, eğri, t0, tSon, boyut=2, durumSınıfı=DurumGörünümü):
+        """
+        Arguments:
+            eğri {callable} -- (n,) boyutlu zaman dizisi için (n, 2d)
+                boyutlu durum dizisi döndüren ara değerleme fonksiyonu
+            t0 {float} -- geçerli aralığın başı (s)
+            tSon {float} -- geçerli aralığın sonu (s)
+            boyut {int} -- uzay boyutu (2 ya da 3)
+            durumSınıfı {type} -- tek adımlar için görünüm sınıfı
+        """
+        self._eğri = eğri
+        self.t0 = t0
+        self.tSon = tSon
+        self.boyut = boyut
+        self.durumSınıfı = durumSınıfı
+
+    def durum(self, zamanlar):
+        """
+        Verilen zamanlardaki konum ve hız dizisi.
+
+        Arguments:
+            zamanlar {array_like} -- zaman ya da zamanlar (s)
+
+        Returns:
+            {ndarray} -- (2d,) ya da (n, 2d) boyutlu durum dizisi
+        """
+        zamanlar = np.asarray(zamanlar, dtype=np.float64)
+        z = np.atleast_1d(zamanlar)
+        pay = 1e-9*max(abs(self.t0), abs(self.tSon), 1.0)
+        if len(z) and (z.min() < self.t0 - pay or z.max() > self.tSon + pay):
+            raise ValueError("zamanlar çözüm aralığının dışında")
+        durum = np.asarray(self._eğri(z)).reshape(len(z), 2*self.boyut)
+        return durum[0] if zamanlar.ndim == 0 else durum
+
+    def __call__(self, zamanlar):
+        """
+        Tek bir zaman için durum görünümü, zaman dizisi için Yörünge.
+        """
+        durum = self.durum(zamanlar)
+        if np.ndim(zamanlar) == 0:
+            return self.durumSınıfı.görünüm(float(zamanlar), durum[:self.boyut],
+                                            durum[self.boyut:])
+        return Yörünge.dizilerden(zamanlar, durum, self.durumSınıfı)
+
+    def örnekle(self, tAdım):
+        """Başlangıçtan tAdım aralıklarla örneklenmiş yörünge."""
+        adımSayısı = int(np.floor((self.tSon - self.t0)/tAdım + 1e-9)) + 1
+        return self(np.minimum(self.t0 + tAdım*np.arange(adımSayısı),
+                               self.tSon))
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+İki cisim problemi: adım büyüklüğü ve çözücü taraması.
+
+v1-v3 örneklerindeki adım/çözücü karşılaştırmasını bütün bileşimler için
+bir süreç havuzunda çalıştırır; sonuçlar tarama.npy dosyasına yazılır ve
+hata - çalışma süresi grafiği çizilir.
+"""
+# sonradan gerekecek kütüphaneleri çağır
+import argparse
+import os
+import sys
+import warnings
+
+import numpy as np
+
+# hesaplama fonksiyonları bir üst dizindeki dinamik paketinde
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from dinamik import grafik
+from dinamik.cozuculer import ODEÇözücüTipi
+from dinamik.tarama import tarama
+
+
+def main():
+    ayrıştırıcı = argparse.ArgumentParser(description=__doc__)
+    ayrıştırıcı.add_argument("--tSon", type=float, default=6000,
+                             help="bitiş zamanı (s)")
+    ayrıştırıcı.add_argument("--is", dest="işSayısı", type=int, default=None,
+                             help="süreç sayısı (varsayılan: işlemci sayısı)")
+    ayrıştırıcı.add_argument("--cikti", default="tarama.npy",
+                             help="sonuç dosyası")
+    ayrıştırıcı.add_argument("--kaydet", metavar="DIZIN", default=None,
+                             help="grafiği ekranda göstermek yerine bu "
+                                  "dizine PNG olarak yaz")
+    argümanlar = ayrıştırıcı.parse_args()
+
+    plt = grafik.başlat(argümanlar.kaydet)
+
+    # başlangıç konum ve hızları: 7000 km'den farklı hızlarla (x, y, vx, vy)
+    hızlar = np.linspace(7.0e3, 9.0e3, 5)
+    durumlar = np.column_stack([np.zeros_like(hızlar), np.full_like(hızlar, 7000e3),
+                                hızlar, np.zeros_like(hızlar)])
+    tAdımlar = [1, 5, 10, 30, 60]
+    çözücüTipleri = [ODEÇözücüTipi.EULER, ODEÇözücüTipi.RK4,
+                     ODEÇözücüTipi.VERLET, ODEÇözücüTipi.YOSHIDA4,
+                     ODEÇözücüTipi.RK45]
+
+    sonuç = tarama(durumlar, tAdımlar, çözücüTipleri, argümanlar.tSon,
+                   işSayısı=argümanlar.işSayısı)
+    # Türkçe alan isimleri .npy biçim 3.0'ı gerektirir (NumPy >= 1.17)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        np.save(argümanlar.cikti, sonuç)
+
+    # çözücü ve adım başına ortalama değerler
+    print("%-8s %6s %14s %14s %10s" % ("çözücü", "tAdım", "konum hatası",
+                                       "enerji hatası", "süre (s)"))
+    for tip in çözücüTipleri:
+        for tAdım in tAdımlar:
+            satırlar = sonuç[(sonuç["çözücü"] == tip.value)
+                             & (sonuç["tAdım"] == tAdım)]
+            print("%-8s %6g %14.3e %14.3e %10.4f"
+                  % (tip.value, tAdım, satırlar["konumHatası"].mean(),
+                     satırlar["enerjiHatası"].mean(), satırlar["süre"].mean()))
+
+    # hata - süre grafiği
+    for tip in çözücüTipleri:
+        satırlar = sonuç[sonuç["çözücü"] == tip.value]
+        plt.loglog(satırlar["süre"], satırlar["konumHatası"], "o", label=tip.value)
+
+    plt.title("Konum Hatası ve Çalışma Süresi (" + str(argümanlar.tSon) + " s)")
+    plt.xlabel("çalışma süresi (s)")
+    plt.ylabel("konum hatası (m)")
+    plt.grid(True, which='major', linestyle='--')
+    plt.legend(loc=1)
+
+    grafik.bitir("tarama")
+
+
+if __name__ == "__main__":
+    main()
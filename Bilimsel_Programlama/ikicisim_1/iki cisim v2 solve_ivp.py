@@ -238,8 +238,8 @@ plt.title("Konum")
 plt.xlabel("x konum (m)")
 plt.ylabel('y konum (m)')
 
-plt.axes().set_aspect('equal')
-plt.grid(b=True, which='major', linestyle='--')
+plt.gca().set_aspect('equal')
+plt.grid(True, which='major', linestyle='--')
 
 plt.show()
 
@@ -250,8 +250,8 @@ plt.title("Hız")
 plt.xlabel("x hız (m/s)")
 plt.ylabel("y hız (m/s)")
 
-plt.axes().set_aspect('equal')
-plt.grid(b=True, which='major', linestyle='--')
+plt.gca().set_aspect('equal')
+plt.grid(True, which='major', linestyle='--')
 
 plt.show() 
 
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# coklu_baslangic.py
+# Birbirinden bağımsız iyileştirme zincirlerini bir süreç havuzunda paralel
+# çalıştırır. Her zincir kendi başlangıç turundan başlar ve santa.improve ile
+# yerel arama, araya karıştırma adımları koyarak devam eder (iterated local
+# search). Şehir koordinatları ve aday komşu listeleri paylaşılan bellekte
+# (multiprocessing.shared_memory) durur; süreçler veriyi tekrar okumaz.
+# Belli aralıklarla zincirlerin sonuçları toplanır ve en iyi tur diske
+# kaydedilir.
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import santa
+import komsular
+
+# Yerel arama sadece C eklentisinde var; NumPy sürümüyle bu betik çalışmaz.
+if not hasattr(santa, "improve"):
+    raise ImportError("coklu_baslangic santa.improve'a ihtiyaç duyar; C "
+                      "eklentisini derleyin (python setup.py build_ext "
+                      "--inplace)")
+
+def ilk_tur(sehirler, rng):
+    """Şehirleri şeritler halinde dolaşan rastgele bir başlangıç turu.
+
+    Koordinatlar rastgele bir açıyla döndürülür, şeritlere bölünür ve her
+    şerit bir aşağı bir yukarı dolaşılır. Tur 0 numaralı şehirde başlar ve
+    biter.
+    """
+    n = len(sehirler)
+    aci = rng.uniform(0, np.pi)
+    u = sehirler @ np.array([np.cos(aci), np.sin(aci)])
+    v = sehirler @ np.array([-np.sin(aci), np.cos(aci)])
+    serit_sayisi = max(1, int(np.sqrt(n) * rng.uniform(0.3, 1.0)))
+    serit = np.minimum((np.argsort(np.argsort(u)) * serit_sayisi) // n,
+                       serit_sayisi - 1)
+    sira = np.lexsort((np.where(serit % 2 == 0, v, -v), serit))
+    sira = np.roll(sira, -int(np.flatnonzero(sira == 0)[0]))
+    return np.append(sira, 0).astype(np.int32)
+
+
+def karistir(tur, rng, adet):
+    """Turun rastgele yerlerinde kısa parçaları ters çevirir."""
+    tur = tur.copy()
+    N = len(tur) - 1
+    for _ in range(adet):
+        L = int(rng.integers(2, min(30, N - 1) + 1))
+        i = int(rng.integers(1, N - L + 1))
+        tur[i:i+L] = tur[i:i+L][::-1]
+    return tur
+
+
+# Süreç havuzundaki her sürecin paylaşılan bellekteki verilere bağlantısı.
+_bellekler = []
+_komsular = None
+
+
+def _hazirla(koordinat_adi, komsu_adi, n, k):
+    """Havuzdaki süreç açılırken paylaşılan belleğe bağlanır."""
+    global _bellekler, _komsular
+    kb = shared_memory.SharedMemory(name=koordinat_adi)
+    nb = shared_memory.SharedMemory(name=komsu_adi)
+    _bellekler = [kb, nb]
+    santa.load_cities(np.ndarray((n, 2), dtype=np.float64, buffer=kb.buf))
+    _komsular = np.ndarray((n, k), dtype=np.int32, buffer=nb.buf)
+
+
+def _zincir(tur, tohum, sure, karistirma):
+    """Bir zinciri sure saniye boyunca ilerletir; (tur, skor) döndürür."""
+    rng = np.random.default_rng(tohum)
+    bitis = time.perf_counter() + sure
+    tur = santa.improve(tur, _komsular, sure)
+    skor = santa.toplam_mesafe(tur)
+    while True:
+        kalan = bitis - time.perf_counter()
+        if kalan <= 0:
+            break
+        aday = santa.improve(karistir(tur, rng, karistirma), _komsular, kalan)
+        aday_skor = santa.toplam_mesafe(aday)
+        if aday_skor < skor:
+            tur, skor = aday, aday_skor
+    return tur, skor
+
+
+def _paylas(dizi):
+    bellek = shared_memory.SharedMemory(create=True, size=max(dizi.nbytes, 1))
+    np.ndarray(dizi.shape, dtype=dizi.dtype, buffer=bellek.buf)[...] = dizi
+    return bellek
+
+
+def _kaydet(dosya, tur):
+    # Yarım yazılmış bir dosya kalmaması için önce geçici dosyaya yaz.
+    gecici = dosya + ".tmp.npy"
+    np.save(gecici, tur)
+    os.replace(gecici, dosya)
+
+
+def calistir(sehirler, sure, zincir_sayisi=None, tur_suresi=60, k=10,
+             baslangic=None, kontrol_dosyasi=None, tohum=0, karistirma=100,
+             is_sayisi=None):
+    """Zincirleri toplam sure saniye çalıştırır, en iyi turu ve skorunu verir.
+
+    sehirler: (n, 2) boyutlu koordinat dizisi.
+    zincir_sayisi: paralel zincir sayısı (varsayılan: çekirdek sayısı).
+    tur_suresi: zincirlerin sonuçlarının toplanma aralığı (saniye).
+    baslangic: verilirse bütün zincirler bu turdan başlar; verilmezse her
+        zincir kendi rastgele şerit turundan başlar.
+    kontrol_dosyasi: verilirse her toplamada en iyi tur .npy olarak yazılır.
+    """
+    sehirler = np.ascontiguousarray(sehirler, dtype=np.float64)
+    komsu = np.ascontiguousarray(komsular.komsular(sehirler, k))
+    n, k = komsu.shape
+    if zincir_sayisi is None:
+        zincir_sayisi = os.cpu_count()
+
+    rng = np.random.default_rng(tohum)
+    if baslangic is not None:
+        turlar = [np.asarray(baslangic, dtype=np.int32)] * zincir_sayisi
+    else:
+        turlar = [ilk_tur(sehirler, rng) for _ in range(zincir_sayisi)]
+    skorlar = [np.inf] * zincir_sayisi
+    en_iyi_tur, en_iyi_skor = None, np.inf
+
+    kb, nb = _paylas(sehirler), _paylas(komsu)
+    try:
+        with ProcessPoolExecutor(is_sayisi, initializer=_hazirla,
+                                 initargs=(kb.name, nb.name, n, k)) as havuz:
+            bitis = time.perf_counter() + sure
+            tur_no = 0
+            while True:
+                kalan = bitis - time.perf_counter()
+                if kalan <= 0:
+                    break
+                isler = [havuz.submit(_zincir, turlar[z], (tohum, z, tur_no),
+                                      min(tur_suresi, kalan), karistirma)
+                         for z in range(zincir_sayisi)]
+                for z, is_ in enumerate(isler):
+                    turlar[z], skorlar[z] = is_.result()
+                tur_no += 1
+
+                z = int(np.argmin(skorlar))
+                if skorlar[z] < en_iyi_skor:
+                    en_iyi_tur, en_iyi_skor = turlar[z], skorlar[z]
+                    if kontrol_dosyasi is not None:
+                        _kaydet(kontrol_dosyasi, en_iyi_tur)
+                print("%d. toplama: en iyi %.2f, zincirler %.2f - %.2f"
+                      % (tur_no, en_iyi_skor, min(skorlar), max(skorlar)),
+                      flush=True)
+    finally:
+        kb.close()
+        kb.unlink()
+        nb.close()
+        nb.unlink()
+    return en_iyi_tur, en_iyi_skor
+
+
+def main():
+    ayristirici = argparse.ArgumentParser(
+        description="Paralel çok başlangıçlı tur iyileştirme.")
+    ayristirici.add_argument("sure", type=float,
+                             help="toplam çalışma süresi (saniye)")
+    ayristirici.add_argument("--sehirler", default="data/cities.bin",
+                             help="ikili koordinat dosyası "
+                                  "(varsayılan: %(default)s)")
+    ayristirici.add_argument("--zincir", type=int, default=None,
+                             help="zincir sayısı (varsayılan: çekirdek sayısı)")
+    ayristirici.add_argument("--tur-suresi", type=float, default=60,
+                             help="sonuçların toplanma aralığı, saniye "
+                                  "(varsayılan: %(default)s)")
+    ayristirici.add_argument("--baslangic", default=None,
+                             help="başlangıç turu (.npy)")
+    ayristirici.add_argument("--kontrol", default="data/en_iyi.npy",
+                             help="en iyi turun yazılacağı dosya "
+                                  "(varsayılan: %(default)s)")
+    ayristirici.add_argument("--tohum", type=int, default=0)
+    args = ayristirici.parse_args()
+
+    sehirler = np.fromfile(args.sehirler, dtype="<f8").reshape(-1, 2)
+    baslangic = np.load(args.baslangic) if args.baslangic else None
+    _, skor = calistir(sehirler, args.sure, args.zincir, args.tur_suresi,
+                       baslangic=baslangic, kontrol_dosyasi=args.kontrol,
+                       tohum=args.tohum)
+    print("En iyi skor: %.2f (%s)" % (skor, args.kontrol))
+
+
+if __name__ == "__main__":
+    main()
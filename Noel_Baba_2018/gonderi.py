@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# gonderi.py
+# Kaggle'a gönderilecek CSV dosyalarını (ilk satırda "Path" başlığı, sonra
+# her satırda bir şehir numarası) kontrol eder ve puanlar. Dosya tek geçişte,
+# sabit boyutlu parçalar halinde okunur; her parça santa.toplam_mesafe ile
+# hesaplanır. Turun bütünü hiçbir zaman Python listesine çevrilmez.
+#
+#   python gonderi.py aday1.csv aday2.csv ...
+
+import argparse
+import itertools
+import sys
+import warnings
+
+import numpy as np
+
+import santa
+
+
+def _dolu_satirlar(satirlar):
+    """Boş ya da sadece yorum olmayan satırların parçadaki sırası.
+
+    np.loadtxt bu satırları atladığından, okunan k. değer satirlar[dolu[k]]
+    satırından gelir.
+    """
+    return [i for i, satir in enumerate(satirlar)
+            if satir.split("#", 1)[0].strip()]
+
+
+def _satir_hatasi(yol, satirlar, ilk):
+    """Parçada tek bir tamsayı içermeyen ilk satır için ValueError."""
+    for i in _dolu_satirlar(satirlar):
+        alanlar = satirlar[i].split("#", 1)[0].split()
+        if len(alanlar) > 1:
+            return ValueError("%s: %d. satır: tek bir şehir numarası "
+                              "bekleniyor" % (yol, ilk + i))
+        try:
+            int(alanlar[0])
+        except ValueError:
+            break
+    else:
+        i = 0
+    return ValueError("%s: %d. satır bir şehir numarası değil"
+                      % (yol, ilk + i))
+
+
+def puanla(yol, parca=65536):
+    """Gönderi dosyasını kontrol eder ve turun toplam mesafesini döndürür.
+
+    Tur 0 numaralı şehirde başlayıp bitmeli, diğer her şehre bir kez
+    uğramalı ve geçersiz şehir numarası içermemeli. Kurallara uymayan bir
+    dosya için ValueError verilir. Şehirler önceden santa.load_cities ile
+    yüklenmiş olmalı.
+    """
+    n = len(santa.cities())
+    gorulen = np.zeros(n, dtype=bool)
+    toplam = 0.0
+    konum = 0          # parçanın ilk şehrinin turdaki konumu
+    onceki = None      # bir önceki parçanın son şehri
+    satir_no = 2       # parçanın ilk satırının dosyadaki numarası
+
+    with open(yol) as f:
+        if next(f, "").strip() != "Path":
+            raise ValueError(yol + ": ilk satır 'Path' olmalı")
+        while True:
+            satirlar = list(itertools.islice(f, parca))
+            if not satirlar:
+                break
+            ilk, satir_no = satir_no, satir_no + len(satirlar)
+            try:
+                with warnings.catch_warnings():
+                    # Boş parçalar aşağıda atlanıyor; uyarıya gerek yok.
+                    warnings.simplefilter("ignore", UserWarning)
+                    sehirler = np.loadtxt(satirlar, dtype=np.int64, ndmin=2)
+            except ValueError:
+                sehirler = None
+            # Hatalı satırı bulmak için parçayı satır satır dene. Bütün
+            # satırlar iki sütunluysa loadtxt hata vermez, (m, 2) döndürür.
+            if sehirler is None or sehirler.shape[1] != 1:
+                raise _satir_hatasi(yol, satirlar, ilk) from None
+            sehirler = sehirler[:, 0]
+            # Sadece boş ya da yorum satırlarından oluşan parça.
+            if sehirler.size == 0:
+                continue
+            if konum == 0 and sehirler[0] != 0:
+                raise ValueError(yol + ": tur 0 numaralı şehirde başlamalı")
+            hatali = np.flatnonzero((sehirler < 0) | (sehirler >= n))
+            if len(hatali):
+                i = _dolu_satirlar(satirlar)[hatali[0]]
+                raise ValueError("%s: %d. satırda geçersiz şehir numarası %d"
+                                 % (yol, ilk + i, sehirler[hatali[0]]))
+            gorulen[sehirler] = True
+
+            # Parçalar arasındaki adım da hesaplansın diye bir önceki
+            # parçanın son şehrini başa ekle.
+            if onceki is None:
+                toplam += santa.toplam_mesafe(sehirler)
+            else:
+                toplam += santa.toplam_mesafe(np.insert(sehirler, 0, onceki),
+                                              adim0=konum - 1)
+            onceki = sehirler[-1]
+            konum += len(sehirler)
+
+    if konum == 0:
+        raise ValueError(yol + ": dosyada tur yok")
+    if onceki != 0:
+        raise ValueError(yol + ": tur 0 numaralı şehirde bitmeli")
+    # Son 0 dışındaki konum sayısı n ise ve bütün şehirler görüldüyse, her
+    # şehre tam olarak bir kez uğranmıştır.
+    if konum != n + 1 or not gorulen.all():
+        eksik = np.count_nonzero(~gorulen)
+        raise ValueError("%s: her şehre bir kez uğranmalı (%d durak, %d şehir "
+                         "hiç ziyaret edilmedi)" % (yol, konum, eksik))
+    return toplam
+
+
+def main():
+    ayristirici = argparse.ArgumentParser(
+        description="Gönderi dosyalarını kontrol eder ve puanlar.")
+    ayristirici.add_argument("dosyalar", nargs="+", help="gönderi CSV dosyaları")
+    ayristirici.add_argument("--sehirler", default="data/cities.bin",
+                             help="ikili koordinat dosyası "
+                                  "(varsayılan: %(default)s)")
+    ayristirici.add_argument("--parca", type=int, default=65536,
+                             help="bir seferde okunacak satır sayısı "
+                                  "(varsayılan: %(default)s)")
+    args = ayristirici.parse_args()
+
+    santa.load_cities(args.sehirler)
+    gecersiz = 0
+    for yol in args.dosyalar:
+        try:
+            print("%s\t%.2f" % (yol, puanla(yol, args.parca)))
+        except (OSError, ValueError) as hata:
+            print("%s\tGEÇERSİZ: %s" % (yol, hata))
+            gecersiz += 1
+    sys.exit(1 if gecersiz else 0)
+
+
+if __name__ == "__main__":
+    main()
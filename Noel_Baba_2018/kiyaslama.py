@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+# kiyaslama.py
+# noelbaba.ipynb içindeki bütün toplam_mesafe denemelerini ve santa modülünün
+# yollarını, istenen büyüklükte rastgele üretilmiş şehir kümeleri üzerinde
+# karşılaştırır. Her uygulama için hız (saniyede adım), tepe bellek
+# kullanımı ve referans sonuca göre hata ölçülür. Sonuçlar bir JSON
+# dosyasına yazılır; önceki bir sonuç dosyası verilirse hız oranları
+# yanyana gösterilir. --simd ile C yolları, SANTA_SIMD ortam değişkeni
+# değiştirilerek ayrı süreçlerde her SIMD seviyesi için tekrar ölçülür.
+#
+#   python kiyaslama.py --boyut 10000 197769 2000000 --cikti sonuc.json
+#   python kiyaslama.py --simd skaler sse2 avx2
+#   python kiyaslama.py --karsilastir onceki.json
+
+import argparse
+import bisect
+import datetime
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+import santa
+from santa2c import asal_maskesi
+
+
+def sehir_kumesi(n, tohum=0):
+    """Kaggle verisiyle aynı alanda n rastgele şehir ve rastgele bir tur."""
+    rng = np.random.default_rng(tohum)
+    sehirler = rng.uniform((0, 0), (5100, 3400), size=(n, 2))
+    tur = np.concatenate([[0], 1 + rng.permutation(n - 1), [0]])
+    return sehirler, tur
+
+
+def referans(sehirler, asal, tur):
+    """Kayıpsız toplama (math.fsum) ile hesaplanan doğru sonuç."""
+    mesafeler = np.linalg.norm(sehirler[tur[1:]] - sehirler[tur[:-1]], axis=1)
+    uzun = (np.arange(1, len(tur)) % 10 == 0) & ~asal[tur[:-1]]
+    mesafeler[uzun] *= 1.1
+    return math.fsum(mesafeler)
+
+
+def uygulamalar(sehirler, asal, tur):
+    """Her uygulama için, girdisi hazırlanmış ve argümansız çağrılabilen
+    bir fonksiyon döndürür. Sözlük sırası noelbaba.ipynb sırasıdır."""
+    asal_listesi = np.flatnonzero(asal).tolist()
+    yol = tur.tolist()
+
+    # Birinci deneme: asallık için listede `in` ile arama.
+    def birinci(p):
+        def mesafe(i, j):
+            d = sehirler[i, :] - sehirler[j, :]
+            return np.sqrt(np.dot(d, d))
+        toplam = 0
+        for adimno in range(1, len(p)):
+            m = mesafe(p[adimno], p[adimno-1])
+            if adimno % 10 == 0 and (p[adimno-1] not in asal_listesi):
+                m = 1.1*m
+            toplam += m
+        return toplam
+
+    # İkinci deneme: bisect ile ikiye bölerek arama.
+    def icinde(a, x):
+        i = bisect.bisect_left(a, x)
+        return i != len(a) and a[i] == x
+
+    def ikinci(p):
+        def mesafe(i, j):
+            d = sehirler[i, :] - sehirler[j, :]
+            return np.sqrt(np.dot(d, d))
+        toplam = 0
+        for adimno in range(1, len(p)):
+            m = mesafe(p[adimno], p[adimno-1])
+            if adimno % 10 == 0 and not icinde(asal_listesi, p[adimno-1]):
+                toplam += 1.1*m
+            else:
+                toplam += m
+        return toplam
+
+    # Üçüncü deneme: mesafe fonksiyon çağrısı yapmadan.
+    def ucuncu(p):
+        toplam = 0
+        for adimno in range(1, len(p)):
+            d = sehirler[p[adimno]] - sehirler[p[adimno-1]]
+            m = np.sqrt(d[0]**2+d[1]**2)
+            if adimno % 10 == 0 and not icinde(asal_listesi, p[adimno-1]):
+                toplam += 1.1*m
+            else:
+                toplam += m
+        return toplam
+
+    # Dördüncü deneme: NumPy ile vektörleştirme.
+    def dorduncu(p):
+        p = np.array(p)
+        kaymalar = sehirler[p[1:]] - sehirler[p[:-1]]
+        mesafeler = np.linalg.norm(kaymalar, axis=1)
+        asalmaske = np.isin(p[:-1], asal_listesi, assume_unique=True,
+                            invert=True)
+        uzunadimlar = (np.arange(1, len(p)) % 10 == 0) & asalmaske
+        mesafeler[uzunadimlar] *= 1.1
+        return mesafeler.sum()
+
+    tur32 = tur.astype(np.int32)
+    matris = np.tile(tur, (8, 1))
+    return {
+        "python_in": lambda: birinci(yol),
+        "python_bisect": lambda: ikinci(yol),
+        "python_satir_ici": lambda: ucuncu(yol),
+        "numpy_isin": lambda: dorduncu(yol),
+        "c_liste": lambda: santa.toplam_mesafe(yol),
+        "c_int64": lambda: santa.toplam_mesafe(tur),
+        "c_int32": lambda: santa.toplam_mesafe(tur32),
+        "c_kesin": lambda: santa.toplam_mesafe(tur, kesin=True),
+        # Sekiz turluk matris; sonuç tur başına verilir.
+        "c_batch": lambda: santa.toplam_mesafe_batch(matris)[0],
+    }
+
+
+# Adım başına yavaş olan uygulamalar ancak bu kadar şehre kadar çalıştırılır.
+YAVAS = {"python_in": 20000, "python_bisect": 200000,
+         "python_satir_ici": 200000}
+
+# c_batch bir çağrıda kaç tur hesaplıyor.
+TUR_SAYISI = {"c_batch": 8}
+
+
+def olc(fonk, en_az=0.5):
+    """En az en_az saniye tekrarlayıp en iyi süreyi, tepe belleği ve
+    sonucu döndürür. Bellek ölçümü ilk çağrıda tracemalloc ile yapılır."""
+    tracemalloc.start()
+    t = time.perf_counter()
+    sonuc = fonk()
+    sureler = [time.perf_counter() - t]
+    _, tepe = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    baslangic = time.perf_counter()
+    while time.perf_counter() - baslangic < en_az:
+        t = time.perf_counter()
+        fonk()
+        sureler.append(time.perf_counter() - t)
+    return min(sureler), tepe, float(sonuc)
+
+
+def kiyasla(boyutlar, secilenler=None, tohum=0, en_az=0.5):
+    """Her boyut ve uygulama için bir sonuç sözlüğü listesi döndürür."""
+    sonuclar = []
+    for n in boyutlar:
+        sehirler, tur = sehir_kumesi(n, tohum)
+        asal = asal_maskesi(n)
+        santa.load_cities(sehirler)
+        dogru = referans(sehirler, asal, tur)
+        for ad, fonk in uygulamalar(sehirler, asal, tur).items():
+            if secilenler and ad not in secilenler:
+                continue
+            if n > YAVAS.get(ad, n):
+                continue
+            sure, tepe, sonuc = olc(fonk, en_az)
+            sure /= TUR_SAYISI.get(ad, 1)
+            sonuclar.append({
+                "uygulama": ad,
+                "simd": santa.simd,
+                "sehir": n,
+                "sure_s": sure,
+                "adim_per_s": (len(tur) - 1) / sure,
+                "tepe_bellek_bayt": tepe,
+                "bagil_hata": abs(sonuc - dogru) / dogru,
+            })
+            s = sonuclar[-1]
+            print("%-18s %-6s n=%-8d %10.3f ms %12.3g adım/s %10.1f KB  "
+                  "hata %.1e" % (ad, s["simd"], n, 1e3*sure, s["adim_per_s"],
+                                 tepe/1024, s["bagil_hata"]), flush=True)
+    return sonuclar
+
+
+def simd_kiyasla(seviyeler, boyutlar, tohum=0, en_az=0.5):
+    """C uygulamalarını her SIMD seviyesi için ayrı bir süreçte ölçer.
+
+    SIMD seviyesi modül yüklenirken seçildiği için her seviye yeni bir
+    Python süreci gerektirir.
+    """
+    sonuclar = []
+    c_yollari = ["c_liste", "c_int64", "c_int32", "c_batch"]
+    for seviye in seviyeler:
+        with tempfile.TemporaryDirectory() as dizin:
+            dosya = os.path.join(dizin, "sonuc.json")
+            komut = [sys.executable, os.path.abspath(__file__),
+                     "--boyut"] + [str(n) for n in boyutlar] + [
+                     "--uygulama"] + c_yollari + [
+                     "--tohum", str(tohum), "--en-az", str(en_az),
+                     "--cikti", dosya]
+            ortam_ = dict(os.environ, SANTA_SIMD=seviye)
+            subprocess.run(komut, env=ortam_, check=True)
+            with open(dosya) as f:
+                kayit = json.load(f)
+        # İstenen seviye işlemcide yoksa modül daha basit olanı seçer.
+        if kayit["ortam"]["simd"] != seviye:
+            print("%s bu işlemcide yok, %s kullanıldı"
+                  % (seviye, kayit["ortam"]["simd"]))
+        sonuclar += kayit["sonuclar"]
+    return sonuclar
+
+
+def ortam():
+    """Sonuçların hangi koşullarda alındığını kaydetmek için."""
+    return {
+        "tarih": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "islemci": platform.processor() or platform.machine(),
+        "simd": getattr(santa, "simd", None),
+    }
+
+
+def karsilastir(onceki, sonuclar):
+    """Önceki bir çalıştırmaya göre hız oranlarını yazar (>1 hızlanma)."""
+    eski = {(s["uygulama"], s.get("simd"), s["sehir"]): s["sure_s"]
+            for s in onceki["sonuclar"]}
+    print("\nÖnceki çalıştırmaya göre (%s):" % onceki["ortam"]["tarih"])
+    for s in sonuclar:
+        anahtar = (s["uygulama"], s["simd"], s["sehir"])
+        if anahtar in eski:
+            print("%-18s %-6s n=%-8d %6.2fx"
+                  % (anahtar + (eski[anahtar] / s["sure_s"],)))
+
+
+def main():
+    ayristirici = argparse.ArgumentParser(
+        description="toplam_mesafe uygulamalarını karşılaştırır.")
+    ayristirici.add_argument("--boyut", type=int, nargs="+",
+                             default=[10000, 197769],
+                             help="şehir sayıları (varsayılan: %(default)s)")
+    ayristirici.add_argument("--uygulama", nargs="+", default=None,
+                             help="sadece bu uygulamaları çalıştır")
+    ayristirici.add_argument("--simd", nargs="+", default=None,
+                             choices=["skaler", "sse2", "avx2"],
+                             help="C yollarını bu SIMD seviyelerinde de ölç")
+    ayristirici.add_argument("--tohum", type=int, default=0)
+    ayristirici.add_argument("--en-az", type=float, default=0.5,
+                             help="uygulama başına en az ölçüm süresi (saniye)")
+    ayristirici.add_argument("--cikti", default=None,
+                             help="sonuçların yazılacağı JSON dosyası")
+    ayristirici.add_argument("--karsilastir", default=None,
+                             help="karşılaştırılacak önceki JSON dosyası")
+    args = ayristirici.parse_args()
+
+    sonuclar = kiyasla(args.boyut, args.uygulama, args.tohum, args.en_az)
+    if args.simd:
+        sonuclar += simd_kiyasla(args.simd, args.boyut, args.tohum, args.en_az)
+    kayit = {"ortam": ortam(), "tohum": args.tohum, "sonuclar": sonuclar}
+    if args.cikti:
+        with open(args.cikti, "w") as f:
+            json.dump(kayit, f, indent=1)
+    if args.karsilastir:
+        with open(args.karsilastir) as f:
+            karsilastir(json.load(f), sonuclar)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# komsular.py
+# Her şehir için en yakın k şehrin listesini (aday komşular) hazırlar. 2-opt,
+# or-opt gibi yerel arama hamleleri sadece bu adaylara bakarak yapılır.
+# Listeler bir k-d ağacıyla (scipy.spatial.cKDTree) hesaplanır ve tekrar
+# kullanılmak üzere diske kaydedilir.
+
+import argparse
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+def aday_listesi(sehirler, k=10):
+    """Her şehrin en yakın k komşusunu (kendisi hariç) döndürür.
+
+    sehirler: (n, 2) boyutlu koordinat dizisi.
+    Sonuç (n, k) boyutlu bir int32 dizisidir; her satır yakından uzağa sıralı.
+    """
+    sehirler = np.asarray(sehirler, dtype=np.float64)
+    n = len(sehirler)
+    k = min(k, n - 1)
+    agac = cKDTree(sehirler)
+    _, sira = agac.query(sehirler, k=k+1, workers=-1)
+    sira = sira.reshape(n, k+1)
+
+    # Şehrin kendisi normalde ilk sütundadır, ama aynı koordinatlara sahip
+    # başka bir şehir varsa yerleri değişebilir. Kendisi hiç çıkmadıysa en
+    # uzak adayı at.
+    kendisi = sira == np.arange(n)[:, None]
+    kendisi[~kendisi.any(axis=1), -1] = True
+    return sira[~kendisi].reshape(n, k).astype(np.int32)
+
+
+def komsular(sehirler=None, k=10, dizin="data"):
+    """Aday komşu listesini önbellekten okur, yoksa hesaplayıp kaydeder.
+
+    sehirler verilmezse santa modülüne yüklü koordinatlar kullanılır.
+    Önbellek dosyasının adı koordinatların özetini içerir, böylece farklı
+    şehir kümeleri birbirine karışmaz. Dosya belleğe eşlenerek açılır.
+    """
+    if sehirler is None:
+        import santa
+        sehirler = santa.cities()
+    sehirler = np.ascontiguousarray(sehirler, dtype=np.float64)
+    # aday_listesi k'yı n-1 ile sınırlar; dosya adı gerçek k'yı göstersin.
+    k = min(k, len(sehirler) - 1)
+
+    ozet = hashlib.blake2b(sehirler.tobytes(), digest_size=8).hexdigest()
+    dosya = os.path.join(dizin, "komsular_k%d_%s.npy" % (k, ozet))
+    if not os.path.exists(dosya):
+        os.makedirs(dizin, exist_ok=True)
+        # Yarım yazılmış bir dosya kalmaması için önce geçici dosyaya yaz.
+        # Aynı anda çalışan süreçler (coklu_baslangic) birbirinin geçici
+        # dosyasını ezmesin diye her biri kendi dosyasını açar.
+        fd, gecici = tempfile.mkstemp(suffix=".npy", dir=dizin)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, aday_listesi(sehirler, k))
+            os.replace(gecici, dosya)
+        except BaseException:
+            os.remove(gecici)
+            raise
+    return np.load(dosya, mmap_mode="r")
+
+
+def main():
+    ayristirici = argparse.ArgumentParser(
+        description="Şehirler için aday komşu listelerini hazırlar.")
+    ayristirici.add_argument("sehirler", nargs="?", default="data/cities.bin",
+                             help="ikili koordinat dosyası "
+                                  "(varsayılan: %(default)s)")
+    ayristirici.add_argument("-k", type=int, default=10,
+                             help="şehir başına komşu sayısı "
+                                  "(varsayılan: %(default)s)")
+    args = ayristirici.parse_args()
+
+    sehirler = np.fromfile(args.sehirler, dtype="<f8").reshape(-1, 2)
+    liste = komsular(sehirler, args.k, os.path.dirname(args.sehirler))
+    print(liste.shape)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,77 +1,882 @@
 // pysanta.c
+#define PY_SSIZE_T_CLEAN
 #include <Python.h>
 #include <math.h>
+#include <stdint.h>
 #include <stdlib.h>
+#include <string.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+#if defined(__GNUC__) && (defined(__x86_64__) || defined(__i386__))
+#define SANTA_X86 1
+#include <immintrin.h>
+#endif
+#include "santa.h"
 
-#define n_asal 17802
+// Şehirlerin koordinatları (x0, y0, x1, y1, ...) sırasıyla ve asal olan
+// şehir numaralarının bit tablosu. load_cities ile yüklenir.
+const double *koordinat = NULL;
+Py_ssize_t n_sehir = 0;
+unsigned char *asal_bitleri = NULL;
+int veri_kullanimda = 0;
 
-// Bu üç array data.c dosyasında yazılı.
-extern double x[];
-extern double y[];
-extern unsigned int asalsehirler[];
+// Koordinatların okunduğu nesne (NumPy dizisi, bellek eşlemli dosya).
+// Modül bu buffer'ı bırakmadığı sürece veri kopyalanmadan kullanılır.
+static Py_buffer koordinat_view;
+static int koordinat_view_dolu = 0;
 
-inline double mesafe(long onceki, long yeni)
+static inline double adim_mesafesi(Py_ssize_t adim, long onceki, long yeni)
 {
-    double dx, dy;
-    dx = x[yeni] - x[onceki];
-    dy = y[yeni] - y[onceki];
-    return sqrt(dx*dx+dy*dy);
+    double m = mesafe(onceki, yeni);
+
+    // On adımda bir bak: Başlangıç şehri asal mı?
+    // Asallar arasında bulunmadıysa mesafeyi %10 arttır.
+    if (adim%10==0 && !asal_mi(onceki))
+        m *= 1.1;
+    return m;
 }
 
-int compareints (const void * a, const void * b)
+int veri_kontrol(void)
 {
-  return ( *(int*)a - *(int*)b );
+    if (koordinat != NULL)
+        return 0;
+    PyErr_SetString(PyExc_RuntimeError,
+                    "şehir verisi yüklenmedi; önce santa.load_cities() çağırın");
+    return -1;
 }
 
-static PyObject* toplam_mesafe(PyObject* self, PyObject* args)
+// Toplam mesafe bloklar halinde hesaplanır: Önce BLOK adımın koordinat
+// farkları ve ceza çarpanları (1 ya da 1.1) küçük dizilere toplanır, sonra
+// bu diziler üzerinde karekök ve toplama vektör komutlarıyla yapılır.
+#define BLOK 64
+
+typedef double (*blok_fonksiyonu)(const double *dx, const double *dy,
+                                  const double *carpan, int n);
+
+static double blok_toplam_skaler(const double *dx, const double *dy,
+                                 const double *carpan, int n)
 {
-    PyObject *yol;
-    long onceki, yeni;
-    int *item;
-    double m;
     double toplam = 0;
-    
-    if (!PyArg_ParseTuple(args, "O", &yol))
-        return NULL;
-    
-    Py_ssize_t len = PyList_Size(yol);
-	
-    onceki = PyLong_AsLong(PyList_GetItem(yol, 0));
-    
-	for (int adim=1; adim<len; adim++) {
-        
-		yeni = PyLong_AsLong(PyList_GetItem(yol, adim));
-        
-        m = mesafe(onceki, yeni);
-        
-        if (adim%10==0) { // On adımda bir bak: Başlangıç şehri asal mı?
-            item = (int*) bsearch (&onceki, asalsehirler, n_asal,
-                               sizeof (unsigned int), compareints);
-            // Asallar arasında bulunmadıysa mesafeyi %10 arttır.
-            if (item==NULL) m *= 1.1;
-        }
-        
-        toplam += m;
+    for (int i = 0; i < n; i++)
+        toplam += sqrt(dx[i]*dx[i] + dy[i]*dy[i]) * carpan[i];
+    return toplam;
+}
+
+#ifdef SANTA_X86
+__attribute__((target("sse2")))
+static double blok_toplam_sse2(const double *dx, const double *dy,
+                               const double *carpan, int n)
+{
+    __m128d toplam = _mm_setzero_pd();
+    double parcalar[2];
+    int i = 0;
+
+    for (; i + 2 <= n; i += 2) {
+        __m128d a = _mm_loadu_pd(dx + i);
+        __m128d b = _mm_loadu_pd(dy + i);
+        __m128d m = _mm_sqrt_pd(_mm_add_pd(_mm_mul_pd(a, a), _mm_mul_pd(b, b)));
+        toplam = _mm_add_pd(toplam, _mm_mul_pd(m, _mm_loadu_pd(carpan + i)));
+    }
+    _mm_storeu_pd(parcalar, toplam);
+    return parcalar[0] + parcalar[1] + blok_toplam_skaler(dx+i, dy+i, carpan+i, n-i);
+}
+
+__attribute__((target("avx2,fma")))
+static double blok_toplam_avx2(const double *dx, const double *dy,
+                               const double *carpan, int n)
+{
+    __m256d toplam = _mm256_setzero_pd();
+    double parcalar[4];
+    int i = 0;
+
+    for (; i + 4 <= n; i += 4) {
+        __m256d a = _mm256_loadu_pd(dx + i);
+        __m256d b = _mm256_loadu_pd(dy + i);
+        __m256d m = _mm256_sqrt_pd(_mm256_fmadd_pd(a, a, _mm256_mul_pd(b, b)));
+        toplam = _mm256_fmadd_pd(m, _mm256_loadu_pd(carpan + i), toplam);
+    }
+    _mm256_storeu_pd(parcalar, toplam);
+    return (parcalar[0] + parcalar[1]) + (parcalar[2] + parcalar[3])
+         + blok_toplam_skaler(dx+i, dy+i, carpan+i, n-i);
+}
+#endif
+
+// Telafili (Neumaier) toplama: her eklemede yuvarlamayla kaybolan düşük
+// basamaklar telafi değişkeninde biriktirilir. Sonuç toplama sırasından ve
+// seçilen SIMD çekirdeğinden bağımsız olarak hemen hemen tam doğrudur.
+static inline double telafili_ekle(double toplam, double x, double *telafi)
+{
+    double t = toplam + x;
+
+    if (fabs(toplam) >= fabs(x))
+        *telafi += (toplam - t) + x;
+    else
+        *telafi += (x - t) + toplam;
+    return t;
+}
+
+static double blok_toplam_kesin(const double *dx, const double *dy,
+                                const double *carpan, int n,
+                                double toplam, double *telafi)
+{
+    for (int i = 0; i < n; i++)
+        toplam = telafili_ekle(toplam, sqrt(dx[i]*dx[i] + dy[i]*dy[i])
+                                       * carpan[i], telafi);
+    return toplam;
+}
+
+// Modül yüklenirken işlemcinin desteklediği en hızlı çekirdek seçilir.
+static blok_fonksiyonu blok_toplam = blok_toplam_skaler;
+static const char *simd_adi = "skaler";
+
+// SANTA_SIMD ortam değişkeniyle ("avx2", "sse2", "skaler") daha yavaş bir
+// çekirdek zorlanabilir; karşılaştırma yapmak için kullanışlıdır.
+static void simd_sec(void)
+{
+#ifdef SANTA_X86
+    const char *istek = getenv("SANTA_SIMD");
+    int avx2, sse2;
+
+    __builtin_cpu_init();
+    avx2 = __builtin_cpu_supports("avx2") && __builtin_cpu_supports("fma");
+    sse2 = __builtin_cpu_supports("sse2");
+    if (istek != NULL && strcmp(istek, "skaler") == 0)
+        return;
+    if (avx2 && (istek == NULL || strcmp(istek, "avx2") == 0)) {
+        blok_toplam = blok_toplam_avx2;
+        simd_adi = "avx2";
+    }
+    else if (sse2) {
+        blok_toplam = blok_toplam_sse2;
+        simd_adi = "sse2";
+    }
+#endif
+}
+
+// Buffer protokolünü destekleyen nesneler (NumPy dizileri, array.array,
+// memoryview) için toplam mesafe döngüsü. Şehir numaraları kopyalanmadan,
+// doğrudan nesnenin belleğinden okunur. Döngü içinde tip kontrolü yapmamak
+// için her tamsayı tipine ayrı bir fonksiyon derlenir. adim0, veri[0]'ın
+// bütün turdaki konumudur; tur parça parça hesaplanırken cezalı adımların
+// yerini korur. kesin ise bloklar SIMD çekirdeği yerine telafili toplamayla
+// hesaplanır.
+//
+// Döngü şehir numaralarını kontrol etmez; önce aralik_disi_TIP ile bütün
+// numaraların 0 ile n_sehir-1 arasında olduğuna bakılmalıdır. Bu kontrol
+// dallanmasız tek bir geçiştir ve hesaplamanın yanında çok kısa sürer.
+#define YOL_DONGUSU(TIP)                                                    \
+static Py_ssize_t aralik_disi_##TIP(const char *veri, Py_ssize_t len,      \
+                                    Py_ssize_t adimlik)                     \
+{                                                                           \
+    /* Negatif numaralar işaretsize çevrilince çok büyük olur. */           \
+    const uint64_t sinir = (uint64_t) n_sehir;                              \
+    int hatali = 0;                                                         \
+    Py_ssize_t i;                                                           \
+                                                                            \
+    for (i = 0; i < len; i++)                                               \
+        hatali |= (uint64_t) (int64_t) *(const TIP *) (veri + i*adimlik)    \
+                  >= sinir;                                                 \
+    if (!hatali)                                                            \
+        return -1;                                                          \
+    for (i = 0; i < len; i++)                                               \
+        if ((uint64_t) (int64_t) *(const TIP *) (veri + i*adimlik) >= sinir)\
+            break;                                                          \
+    return i;                                                               \
+}                                                                           \
+                                                                            \
+static double toplam_##TIP(const char *veri, Py_ssize_t len,               \
+                           Py_ssize_t adimlik, Py_ssize_t adim0, int kesin) \
+{                                                                           \
+    double dx[BLOK], dy[BLOK], carpan[BLOK];                                \
+    const double *a, *b;                                                    \
+    long onceki, yeni;                                                      \
+    double toplam = 0, telafi = 0;                                          \
+    Py_ssize_t adim = 1;                                                    \
+    int n, onlu = (int) ((adim0 + 1) % 10);  /* (adim0 + adim) % 10 */      \
+                                                                            \
+    onceki = (long) *(const TIP *) veri;                                    \
+    while (adim < len) {                                                    \
+        for (n = 0; n < BLOK && adim < len; n++, adim++) {                  \
+            yeni = (long) *(const TIP *) (veri + adim*adimlik);             \
+            a = koordinat + 2*onceki;                                       \
+            b = koordinat + 2*yeni;                                         \
+            dx[n] = b[0] - a[0];                                            \
+            dy[n] = b[1] - a[1];                                            \
+            /* On adımda bir, başlangıç şehri asal değilse %10 fazla. */    \
+            carpan[n] = (onlu == 0 && !asal_mi(onceki)) ? 1.1 : 1.0;        \
+            if (++onlu == 10)                                               \
+                onlu = 0;                                                   \
+            onceki = yeni;                                                  \
+        }                                                                   \
+        if (kesin)                                                          \
+            toplam = blok_toplam_kesin(dx, dy, carpan, n, toplam, &telafi); \
+        else                                                                \
+            toplam += blok_toplam(dx, dy, carpan, n);                       \
+    }                                                                       \
+    return toplam + telafi;                                                 \
+}
+
+YOL_DONGUSU(int32_t)
+YOL_DONGUSU(int64_t)
+YOL_DONGUSU(uint32_t)
+YOL_DONGUSU(uint64_t)
+
+// Buffer biçim dizesinin tek karakterlik tip kodunu verir. Yerel bayt
+// sırasıyla uyuşmayan ya da birden fazla alan içeren biçimler için 0 döner.
+static char bicim_kodu(const char *bicim)
+{
+    if (bicim == NULL)
+        return 'B';
+#if PY_LITTLE_ENDIAN
+    if (*bicim == '@' || *bicim == '=' || *bicim == '<')
+#else
+    if (*bicim == '@' || *bicim == '=' || *bicim == '>' || *bicim == '!')
+#endif
+        bicim++;
+    if (bicim[0] == '\0' || bicim[1] != '\0')
+        return 0;
+    return bicim[0];
+}
+
+// Buffer'ın boyut sayısını ve eleman tipini kontrol eder. Desteklenmeyen
+// bir tip varsa TypeError verir ve -1 döndürür.
+int buffer_tipi(Py_buffer *view, int boyut)
+{
+    char kod = bicim_kodu(view->format);
+    int isaretli;
+
+    if (view->ndim != boyut) {
+        PyErr_Format(PyExc_TypeError, "%s (beklenen %d, bulunan %d)",
+                     YOL_BOYUTU_HATASI, boyut, view->ndim);
+        return -1;
+    }
+    if (kod == 0 || strchr("ilqnILQN", kod) == NULL
+            || (view->itemsize != 4 && view->itemsize != 8)) {
+        PyErr_Format(PyExc_TypeError, "%s ('%s')", YOL_TIPI_HATASI,
+                     view->format);
+        return -1;
+    }
+    isaretli = (kod >= 'a');
+
+    if (view->itemsize == 4)
+        return isaretli ? YOL_INT32 : YOL_UINT32;
+    return isaretli ? YOL_INT64 : YOL_UINT64;
+}
+
+// Tipine uygun döngüyü çağırarak tek bir turun toplam mesafesini verir.
+// Python nesnelerine dokunmadığı için GIL bırakılmışken de çağrılabilir.
+static double yol_toplam(int tip, const char *veri, Py_ssize_t len,
+                         Py_ssize_t adimlik, Py_ssize_t adim0, int kesin)
+{
+    if (len < 1)
+        return 0;
+    switch (tip) {
+    case YOL_INT32:  return toplam_int32_t(veri, len, adimlik, adim0, kesin);
+    case YOL_INT64:  return toplam_int64_t(veri, len, adimlik, adim0, kesin);
+    case YOL_UINT32: return toplam_uint32_t(veri, len, adimlik, adim0, kesin);
+    default:         return toplam_uint64_t(veri, len, adimlik, adim0, kesin);
+    }
+}
+
+// Geçersiz ilk şehir numarasının konumunu, hepsi geçerliyse -1 döndürür.
+static Py_ssize_t aralik_disi(int tip, const char *veri, Py_ssize_t len,
+                              Py_ssize_t adimlik)
+{
+    switch (tip) {
+    case YOL_INT32:  return aralik_disi_int32_t(veri, len, adimlik);
+    case YOL_INT64:  return aralik_disi_int64_t(veri, len, adimlik);
+    case YOL_UINT32: return aralik_disi_uint32_t(veri, len, adimlik);
+    default:         return aralik_disi_uint64_t(veri, len, adimlik);
+    }
+}
+
+// Yoldaki şehir numaralarından biri geçersizse IndexError verir ve -1
+// döndürür.
+static int yol_kontrol(int tip, const char *veri, Py_ssize_t len,
+                       Py_ssize_t adimlik)
+{
+    Py_ssize_t konum = aralik_disi(tip, veri, len, adimlik);
+
+    if (konum < 0)
+        return 0;
+    PyErr_Format(PyExc_IndexError, "%s (konum %zd)", SEHIR_NUMARASI_HATASI,
+                 konum);
+    return -1;
+}
+
+// Python listesindeki bir şehir numarasını okur. Tamsayı değilse ya da
+// geçersizse hata verir ve -1 döndürür.
+static long liste_elemani(PyObject **elemanlar, Py_ssize_t konum)
+{
+    long sehir = PyLong_AsLong(elemanlar[konum]);
+
+    if (sehir == -1 && PyErr_Occurred())
+        return -1;
+    if (sehir < 0 || sehir >= n_sehir) {
+        PyErr_Format(PyExc_IndexError, "%s (konum %zd)",
+                     SEHIR_NUMARASI_HATASI, konum);
+        return -1;
+    }
+    return sehir;
+}
+
+static PyObject* toplam_mesafe(PyObject* self, PyObject* args,
+                               PyObject* kwargs)
+{
+    static char *anahtarlar[] = {"yol", "adim0", "kesin", NULL};
+    PyObject *yol, *liste, **elemanlar;
+    Py_ssize_t adim0 = 0, len;
+    int kesin = 0;
+    long onceki, yeni;
+    double toplam = 0, telafi = 0;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|np", anahtarlar,
+                                     &yol, &adim0, &kesin))
+        return NULL;
+    if (adim0 < 0) {
+        PyErr_SetString(PyExc_ValueError, "adim0 negatif olamaz");
+        return NULL;
+    }
+    if (veri_kontrol() < 0)
+        return NULL;
+
+    // NumPy dizisi gibi buffer destekleyen nesneleri kopyalamadan oku.
+    if (PyObject_CheckBuffer(yol)) {
+        Py_buffer view;
+        int tip;
+
+        if (PyObject_GetBuffer(yol, &view, PyBUF_STRIDES | PyBUF_FORMAT) < 0)
+            return NULL;
+        tip = buffer_tipi(&view, 1);
+        if (tip >= 0 && yol_kontrol(tip, view.buf, view.shape[0],
+                                    view.strides[0]) < 0)
+            tip = -1;
+        if (tip >= 0)
+            toplam = yol_toplam(tip, view.buf, view.shape[0], view.strides[0],
+                                adim0, kesin);
+        PyBuffer_Release(&view);
+        if (tip < 0)
+            return NULL;
+        return PyFloat_FromDouble(toplam);
+    }
+
+    // Diğer durumlarda yol bir Python listesi (ya da demeti) olmalı.
+    liste = PySequence_Fast(yol, "yol bir liste ya da tamsayı dizisi olmalı");
+    if (liste == NULL)
+        return NULL;
+    len = PySequence_Fast_GET_SIZE(liste);
+    elemanlar = PySequence_Fast_ITEMS(liste);
+
+    if (len > 0 && (onceki = liste_elemani(elemanlar, 0)) < 0)
+        goto hata;
+
+    for (Py_ssize_t adim=1; adim<len; adim++) {
+        if ((yeni = liste_elemani(elemanlar, adim)) < 0)
+            goto hata;
+
+        if (kesin)
+            toplam = telafili_ekle(toplam,
+                                   adim_mesafesi(adim0 + adim, onceki, yeni),
+                                   &telafi);
+        else
+            toplam += adim_mesafesi(adim0 + adim, onceki, yeni);
         onceki = yeni;
-	}	
-    return Py_BuildValue("f", toplam);
+    }
+    Py_DECREF(liste);
+    return PyFloat_FromDouble(toplam + telafi);
+
+hata:
+    Py_DECREF(liste);
+    return NULL;
+}
+
+// Bir tur matrisinin (n_tur x n_durak) her satırının toplam mesafesini
+// hesaplar. Satırlar GIL bırakılarak OpenMP iş parçacıklarına dağıtılır.
+static PyObject* toplam_mesafe_batch(PyObject* self, PyObject* args,
+                                     PyObject* kwargs)
+{
+    static char *anahtarlar[] = {"turlar", "is_sayisi", "kesin", NULL};
+    PyObject *turlar, *numpy, *sonuc;
+    Py_buffer view, cikti;
+    Py_ssize_t n_tur, n_durak, satir_adimi, sutun_adimi;
+    const char *veri;
+    double *toplamlar;
+    int is_sayisi = 0, kesin = 0;
+    int tip;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|ip", anahtarlar,
+                                     &turlar, &is_sayisi, &kesin))
+        return NULL;
+    if (veri_kontrol() < 0)
+        return NULL;
+
+    if (PyObject_GetBuffer(turlar, &view, PyBUF_STRIDES | PyBUF_FORMAT) < 0)
+        return NULL;
+    tip = buffer_tipi(&view, 2);
+    if (tip < 0) {
+        PyBuffer_Release(&view);
+        return NULL;
+    }
+    n_tur = view.shape[0];
+    n_durak = view.shape[1];
+    satir_adimi = view.strides[0];
+    sutun_adimi = view.strides[1];
+    veri = view.buf;
+    for (Py_ssize_t i = 0; i < n_tur; i++) {
+        Py_ssize_t konum = aralik_disi(tip, veri + i*satir_adimi, n_durak,
+                                       sutun_adimi);
+        if (konum >= 0) {
+            // Biçim dizesi ASCII olmalı; Türkçe kelime %s ile verilir.
+            PyErr_Format(PyExc_IndexError, "%s (%s %zd, konum %zd)",
+                         SEHIR_NUMARASI_HATASI, "satır", i, konum);
+            PyBuffer_Release(&view);
+            return NULL;
+        }
+    }
+
+    // Sonuçları doğrudan bir float64 NumPy dizisinin içine yaz.
+    numpy = PyImport_ImportModule("numpy");
+    if (numpy == NULL) {
+        PyBuffer_Release(&view);
+        return NULL;
+    }
+    sonuc = PyObject_CallMethod(numpy, "zeros", "ns", n_tur, "float64");
+    Py_DECREF(numpy);
+    if (sonuc == NULL) {
+        PyBuffer_Release(&view);
+        return NULL;
+    }
+    if (PyObject_GetBuffer(sonuc, &cikti, PyBUF_WRITABLE) < 0) {
+        Py_DECREF(sonuc);
+        PyBuffer_Release(&view);
+        return NULL;
+    }
+    toplamlar = cikti.buf;
+
+    veri_kullanimda++;
+    Py_BEGIN_ALLOW_THREADS
+#ifdef _OPENMP
+    if (is_sayisi <= 0)
+        is_sayisi = omp_get_max_threads();
+    #pragma omp parallel for num_threads(is_sayisi) schedule(static)
+#endif
+    for (Py_ssize_t i = 0; i < n_tur; i++)
+        toplamlar[i] = yol_toplam(tip, veri + i*satir_adimi, n_durak,
+                                  sutun_adimi, 0, kesin);
+    Py_END_ALLOW_THREADS
+    veri_kullanimda--;
+
+    PyBuffer_Release(&cikti);
+    PyBuffer_Release(&view);
+    return sonuc;
+}
+
+// Hamle fonksiyonlarının ortak girdisini hazırlar: yolu tek boyutlu bir
+// tamsayı buffer'ı olarak alır.
+static int yol_al(PyObject *nesne, Py_buffer *view, yol_t *yol)
+{
+    if (veri_kontrol() < 0)
+        return -1;
+    if (PyObject_GetBuffer(nesne, view, PyBUF_STRIDES | PyBUF_FORMAT) < 0)
+        return -1;
+    yol->tip = buffer_tipi(view, 1);
+    if (yol->tip < 0) {
+        PyBuffer_Release(view);
+        return -1;
+    }
+    yol->veri = view->buf;
+    yol->len = view->shape[0];
+    yol->adimlik = view->strides[0];
+    return 0;
+}
+
+static int konum_kontrol(int gecerli, Py_buffer *view)
+{
+    if (gecerli)
+        return 0;
+    PyErr_SetString(PyExc_IndexError, "hamle konumları yolun dışında");
+    PyBuffer_Release(view);
+    return -1;
+}
+
+// Hamlenin okuduğu [ilk, son] konumlarındaki şehir numaralarını kontrol
+// eder. Bütün yol değil sadece bu aralık taranır; maliyet hamlenin cezalı
+// adımlarını hesaplamakla aynı mertebededir.
+static int sehir_kontrol(const yol_t *yol, Py_ssize_t ilk, Py_ssize_t son,
+                         Py_buffer *view)
+{
+    Py_ssize_t konum = aralik_disi(yol->tip, yol->veri + ilk*yol->adimlik,
+                                   son - ilk + 1, yol->adimlik);
+
+    if (konum < 0)
+        return 0;
+    PyErr_Format(PyExc_IndexError, "%s (konum %zd)", SEHIR_NUMARASI_HATASI,
+                 ilk + konum);
+    PyBuffer_Release(view);
+    return -1;
+}
+
+static PyObject* delta_2opt(PyObject* self, PyObject* args)
+{
+    PyObject *nesne;
+    Py_buffer view;
+    yol_t yol;
+    Py_ssize_t i, j;
+    double fark;
+
+    if (!PyArg_ParseTuple(args, "Onn", &nesne, &i, &j))
+        return NULL;
+    if (yol_al(nesne, &view, &yol) < 0)
+        return NULL;
+    if (konum_kontrol(1 <= i && i < j && j <= yol.len-2, &view) < 0
+            || sehir_kontrol(&yol, i-1, j+1, &view) < 0)
+        return NULL;
+
+    fark = fark_2opt(&yol, i, j);
+    PyBuffer_Release(&view);
+    return PyFloat_FromDouble(fark);
+}
+
+static PyObject* delta_oropt(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+    static char *anahtarlar[] = {"yol", "i", "j", "k", "ters", NULL};
+    PyObject *nesne;
+    Py_buffer view;
+    yol_t yol;
+    Py_ssize_t i, j, k;
+    int ters = 0;
+    double fark;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "Onnn|p", anahtarlar,
+                                     &nesne, &i, &j, &k, &ters))
+        return NULL;
+    if (yol_al(nesne, &view, &yol) < 0)
+        return NULL;
+    if (konum_kontrol(1 <= i && i <= j && j <= yol.len-2
+                      && 0 <= k && k <= yol.len-2
+                      && (k < i-1 || k > j), &view) < 0
+            || sehir_kontrol(&yol, k < i ? k : i-1, k > j ? k+1 : j+1,
+                             &view) < 0)
+        return NULL;
+
+    fark = fark_oropt(&yol, i, j, k, ters);
+    PyBuffer_Release(&view);
+    return PyFloat_FromDouble(fark);
+}
+
+// i ve j konumlarındaki şehirlerin yer değiştirmesinin toplam mesafeye
+// etkisi.
+static PyObject* delta_swap(PyObject* self, PyObject* args)
+{
+    PyObject *nesne;
+    Py_buffer view;
+    yol_t yol;
+    hamle_t h = {HAMLE_SWAP, 0, 0, 0, 0};
+    double fark;
+
+    if (!PyArg_ParseTuple(args, "Onn", &nesne, &h.i, &h.j))
+        return NULL;
+    if (yol_al(nesne, &view, &yol) < 0)
+        return NULL;
+    if (konum_kontrol(1 <= h.i && h.i < h.j && h.j <= yol.len-2, &view) < 0
+            || sehir_kontrol(&yol, h.i-1, h.j+1, &view) < 0)
+        return NULL;
+
+    if (h.j == h.i+1) {
+        fark = kenar(&yol, h.i-1, h.j) + kenar(&yol, h.i, h.j+1)
+             - kenar(&yol, h.i-1, h.i) - kenar(&yol, h.j, h.j+1);
+        fark += ceza_farki(&yol, &h, h.i, h.j+1);
+    }
+    else {
+        fark = kenar(&yol, h.i-1, h.j) + kenar(&yol, h.j, h.i+1)
+             + kenar(&yol, h.j-1, h.i) + kenar(&yol, h.i, h.j+1)
+             - kenar(&yol, h.i-1, h.i) - kenar(&yol, h.i, h.i+1)
+             - kenar(&yol, h.j-1, h.j) - kenar(&yol, h.j, h.j+1);
+        fark += ceza_farki(&yol, &h, h.i, h.i+1);
+        fark += ceza_farki(&yol, &h, h.j, h.j+1);
+    }
+
+    PyBuffer_Release(&view);
+    return PyFloat_FromDouble(fark);
+}
+
+// 0 ile n-1 arasındaki asal sayıları Eratosthenes kalburuyla bulur ve bit
+// tablosu olarak döndürür. Bellek ayrılamazsa NULL döner.
+static unsigned char* asal_tablosu_kur(Py_ssize_t n)
+{
+    unsigned char *bilesik, *bitler;
+
+    bilesik = calloc(n > 2 ? n : 2, 1);
+    bitler = calloc(n/8 + 1, 1);
+    if (bilesik == NULL || bitler == NULL) {
+        free(bilesik);
+        free(bitler);
+        return NULL;
+    }
+    bilesik[0] = bilesik[1] = 1;
+    for (Py_ssize_t i = 2; i*i < n; i++)
+        if (!bilesik[i])
+            for (Py_ssize_t j = i*i; j < n; j += i)
+                bilesik[j] = 1;
+    for (Py_ssize_t i = 0; i < n; i++)
+        if (!bilesik[i])
+            bitler[i >> 3] |= (unsigned char) (1 << (i & 7));
+    free(bilesik);
+    return bitler;
+}
+
+// Verilen dosya yolunu NumPy ile belleğe eşler. .npy dosyaları başlıklarıyla
+// okunur; diğer dosyalar ham float64 (x, y) çiftleri olarak kabul edilir.
+static PyObject* dosya_esle(PyObject *yol)
+{
+    PyObject *numpy, *yol_dizesi, *sonek, *dizi, *sonuc;
+    int npy;
+
+    yol_dizesi = PyOS_FSPath(yol);
+    if (yol_dizesi == NULL)
+        return NULL;
+    if (PyBytes_Check(yol_dizesi)) {
+        PyObject *cozulmus = PyUnicode_DecodeFSDefaultAndSize(
+            PyBytes_AS_STRING(yol_dizesi), PyBytes_GET_SIZE(yol_dizesi));
+        Py_SETREF(yol_dizesi, cozulmus);
+        if (yol_dizesi == NULL)
+            return NULL;
+    }
+    sonek = PyUnicode_FromString(".npy");
+    npy = sonek ? (int) PyUnicode_Tailmatch(yol_dizesi, sonek, 0,
+                                            PY_SSIZE_T_MAX, 1) : -1;
+    Py_XDECREF(sonek);
+    if (npy < 0) {
+        Py_DECREF(yol_dizesi);
+        return NULL;
+    }
+    numpy = PyImport_ImportModule("numpy");
+    if (numpy == NULL) {
+        Py_DECREF(yol_dizesi);
+        return NULL;
+    }
+    if (npy)
+        sonuc = PyObject_CallMethod(numpy, "load", "Os", yol_dizesi, "r");
+    else {
+        dizi = PyObject_CallMethod(numpy, "memmap", "Oss", yol_dizesi,
+                                   "<f8", "r");
+        sonuc = dizi ? PyObject_CallMethod(dizi, "reshape", "ii", -1, 2)
+                     : NULL;
+        Py_XDECREF(dizi);
+    }
+    Py_DECREF(numpy);
+    Py_DECREF(yol_dizesi);
+    return sonuc;
+}
+
+// Şehir koordinatlarını bir diziden ya da bellek eşlemli bir dosyadan
+// yükler ve asal şehir tablosunu bu şehir sayısına göre yeniden kurar.
+static PyObject* load_cities(PyObject* self, PyObject* args)
+{
+    PyObject *kaynak, *dizi;
+    Py_buffer view;
+    unsigned char *bitler;
+    Py_ssize_t n;
+
+    if (!PyArg_ParseTuple(args, "O", &kaynak))
+        return NULL;
+
+    if (PyUnicode_Check(kaynak) || PyBytes_Check(kaynak)
+            || PyObject_HasAttrString(kaynak, "__fspath__"))
+        dizi = dosya_esle(kaynak);
+    else {
+        dizi = kaynak;
+        Py_INCREF(dizi);
+    }
+    if (dizi == NULL)
+        return NULL;
+
+    if (PyObject_GetBuffer(dizi, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0) {
+        Py_DECREF(dizi);
+        return NULL;
+    }
+    Py_DECREF(dizi);  // Artık view nesneye bir referans tutuyor.
+    if (view.ndim != 2 || view.shape[1] != 2 || view.itemsize != 8
+            || bicim_kodu(view.format) != 'd') {
+        PyBuffer_Release(&view);
+        PyErr_SetString(PyExc_TypeError, SEHIR_HATASI);
+        return NULL;
+    }
+    n = view.shape[0];
+
+    bitler = asal_tablosu_kur(n);
+    if (bitler == NULL) {
+        PyBuffer_Release(&view);
+        return PyErr_NoMemory();
+    }
+
+    // GIL bırakılarak çalışan bir hesap eski veriyi okuyor olabilir. Bu
+    // kontrol, GIL'i bırakabilecek son çağrıdan (dosya_esle) sonra yapılmalı.
+    if (veri_kullanimda) {
+        free(bitler);
+        PyBuffer_Release(&view);
+        PyErr_SetString(PyExc_RuntimeError,
+                        "şehir verisi başka bir iş parçacığında kullanılıyor; "
+                        "hesap bitmeden load_cities çağrılamaz");
+        return NULL;
+    }
+
+    // Eski veriyi bırak, yenisini yerleştir.
+    if (koordinat_view_dolu)
+        PyBuffer_Release(&koordinat_view);
+    free(asal_bitleri);
+    koordinat_view = view;
+    koordinat_view_dolu = 1;
+    koordinat = view.buf;
+    n_sehir = n;
+    asal_bitleri = bitler;
+
+    return PyLong_FromSsize_t(n_sehir);
+}
+
+// Yüklü şehir koordinatlarını (n, 2) boyutlu bir nesne olarak verir:
+// load_cities'e verilen dizinin kendisi ya da gömülü veri üzerinde bir
+// memoryview. Veri kopyalanmaz.
+static PyObject* cities(PyObject* self, PyObject* args)
+{
+    PyObject *bellek, *sonuc;
+
+    if (veri_kontrol() < 0)
+        return NULL;
+    if (koordinat_view_dolu) {
+        Py_INCREF(koordinat_view.obj);
+        return koordinat_view.obj;
+    }
+    bellek = PyMemoryView_FromMemory((char *) koordinat,
+                                     2 * n_sehir * sizeof(double), PyBUF_READ);
+    if (bellek == NULL)
+        return NULL;
+    sonuc = PyObject_CallMethod(bellek, "cast", "s(ni)", "d", n_sehir, 2);
+    Py_DECREF(bellek);
+    return sonuc;
 }
 
 static PyMethodDef SantaMethods[] =
 {
-     {"toplam_mesafe", toplam_mesafe, METH_VARARGS, "Belli bir turun katettiği toplam mesafeyi verir."},
+     {"load_cities", load_cities, METH_VARARGS,
+      "load_cities(kaynak)\n\n"
+      "Şehir koordinatlarını yükler ve şehir sayısını döndürür. kaynak "
+      "(n, 2) boyutlu bir float64 dizisi ya da bir dosya yolu olabilir. "
+      "Dosyalar belleğe eşlenerek okunur: .npy dosyaları başlıklarıyla, "
+      "diğerleri ham float64 (x, y) çiftleri olarak. Asal şehir tablosu "
+      "yükleme sırasında hesaplanır. Diziler kopyalanmaz; bu yüzden "
+      "yüklenen dizi sonradan değiştirilmemeli. Başka bir iş parçacığında "
+      "toplam_mesafe_batch ya da improve çalışırken RuntimeError verir."},
+     {"cities", cities, METH_NOARGS,
+      "cities()\n\n"
+      "Yüklü şehir koordinatlarını (n, 2) boyutlu bir dizi olarak verir. "
+      "Veri kopyalanmaz; numpy.asarray() ile NumPy dizisine çevrilebilir."},
+     {"toplam_mesafe", (PyCFunction) toplam_mesafe,
+      METH_VARARGS | METH_KEYWORDS,
+      "toplam_mesafe(yol, adim0=0, kesin=False)\n\n"
+      "Belli bir turun katettiği toplam mesafeyi verir.\n\n"
+      "Tur bir Python listesi ya da buffer protokolünü destekleyen tek "
+      "boyutlu bir tamsayı dizisi (int32/int64 NumPy dizisi, array.array, "
+      "memoryview) olabilir. Diziler kopyalanmadan okunur. Uzun bir tur "
+      "parça parça hesaplanırken adim0, yol[0]'ın bütün turdaki konumu "
+      "olarak verilir; böylece on adımda bir gelen cezalar doğru yere "
+      "düşer. kesin ise adımlar telafili (Kahan-Neumaier) toplamayla "
+      "toplanır; sonuç daha yavaş hesaplanır ama SIMD çekirdeğinden ve "
+      "toplama sırasından bağımsızdır. Geçersiz bir şehir numarası için "
+      "IndexError verilir."},
+     {"toplam_mesafe_batch", (PyCFunction) toplam_mesafe_batch,
+      METH_VARARGS | METH_KEYWORDS,
+      "toplam_mesafe_batch(turlar, is_sayisi=0, kesin=False)\n\n"
+      "(n_tur x n_durak) boyutlu bir tamsayı matrisinin her satırını ayrı "
+      "bir tur olarak değerlendirir ve toplam mesafeleri float64 bir NumPy "
+      "dizisi olarak döndürür. Hesaplama GIL bırakılarak yapılır; OpenMP "
+      "ile derlenmişse satırlar is_sayisi kadar iş parçacığına dağıtılır "
+      "(0 ise bütün çekirdekler kullanılır). kesin, toplam_mesafe'deki "
+      "gibidir."},
+     {"delta_2opt", delta_2opt, METH_VARARGS,
+      "delta_2opt(yol, i, j)\n\n"
+      "yol[i:j+1] parçası ters çevrildiğinde toplam mesafedeki değişimi "
+      "verir (1 <= i < j <= len(yol)-2). Yol tek boyutlu bir tamsayı "
+      "dizisi olmalı. Ters çevrilen parçadaki cezalı adımlar hesaba "
+      "katılır; bütün tur yeniden hesaplanmaz."},
+     {"delta_oropt", (PyCFunction) delta_oropt, METH_VARARGS | METH_KEYWORDS,
+      "delta_oropt(yol, i, j, k, ters=False)\n\n"
+      "yol[i:j+1] parçası yol[k] ile yol[k+1] arasına taşındığında (ters "
+      "ise ters çevrilerek) toplam mesafedeki değişimi verir. k, parçanın "
+      "içinde ya da hemen önünde olamaz."},
+     {"improve", (PyCFunction) improve, METH_VARARGS | METH_KEYWORDS,
+      "improve(yol, komsular, sure, hamleler=('2opt', 'oropt'), en_uzun=1000)\n\n"
+      "Turu aday komşu listeleriyle (komsular.py) yerel arama yaparak "
+      "iyileştirir ve yeni turu int32 bir NumPy dizisi olarak döndürür. "
+      "Amaç fonksiyonu toplam_mesafe ile aynıdır. Arama bir yerel "
+      "optimuma ulaşınca (bütün şehirlere bakılan bir turda hiç hamle "
+      "yapılamayınca; sonucu tekrar improve'a vermek bir şey değiştirmez) "
+      "ya da sure saniye dolunca (sure <= 0 ise süre sınırı yok) biter ve "
+      "GIL bırakılarak yapılır. Ters çevrilen ya da kaydırılan aralıklar "
+      "en_uzun konumla sınırlıdır. hamleler \"2opt\" ve \"oropt\" "
+      "isimlerinden oluşan bir liste olmalı; bilinmeyen bir isim için "
+      "ValueError verilir."},
+     {"delta_swap", delta_swap, METH_VARARGS,
+      "delta_swap(yol, i, j)\n\n"
+      "yol[i] ile yol[j] yer değiştirdiğinde toplam mesafedeki değişimi "
+      "verir (1 <= i < j <= len(yol)-2)."},
      {NULL, NULL, 0, NULL}
 };
 
-static struct PyModuleDef Santa_Module = {  
+static struct PyModuleDef Santa_Module = {
     PyModuleDef_HEAD_INIT,
-    "santa",     // Python'un gordugu modul ismi.
+    "_santa",    // Python'un gordugu modul ismi (santa.py bunu yükler).
     "Gezgin Santa Problemi modulu.", // modul belgeleme dizesi
     -1,
     SantaMethods
 };
 
-PyMODINIT_FUNC PyInit_santa(void)
+#ifdef SANTA_GOMULU_VERI
+// santa2c.py ile üretilen data.c dosyasındaki diziler. Modül bu seçenekle
+// derlendiyse bu şehirler başlangıçta yüklü gelir.
+extern double x[];
+extern double y[];
+extern long n_gomulu;
+
+static int gomulu_veriyi_yukle(void)
 {
-     return PyModule_Create(&Santa_Module);
+    double *xy = malloc(2 * n_gomulu * sizeof(double));
+
+    asal_bitleri = asal_tablosu_kur(n_gomulu);
+    if (xy == NULL || asal_bitleri == NULL) {
+        free(xy);
+        free(asal_bitleri);
+        asal_bitleri = NULL;
+        PyErr_NoMemory();
+        return -1;
+    }
+    for (long i = 0; i < n_gomulu; i++) {
+        xy[2*i] = x[i];
+        xy[2*i+1] = y[i];
+    }
+    koordinat = xy;
+    n_sehir = n_gomulu;
+    return 0;
+}
+#endif
+
+PyMODINIT_FUNC PyInit__santa(void)
+{
+     PyObject *m;
+
+#ifdef SANTA_GOMULU_VERI
+     if (koordinat == NULL && gomulu_veriyi_yukle() < 0)
+         return NULL;
+#endif
+     simd_sec();
+     m = PyModule_Create(&Santa_Module);
+     if (m == NULL)
+         return NULL;
+     // Toplam mesafe için seçilen çekirdek: "avx2", "sse2" ya da "skaler".
+     if (PyModule_AddStringConstant(m, "simd", simd_adi) < 0) {
+         Py_DECREF(m);
+         return NULL;
+     }
+     return m;
 }
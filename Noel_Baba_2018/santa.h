@@ -0,0 +1,174 @@
+// santa.h
+// pysanta.c ve yerelarama.c dosyalarının ortak kullandığı veriler ve
+// yardımcı fonksiyonlar.
+#ifndef SANTA_H
+#define SANTA_H
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif
+#include <Python.h>
+#include <math.h>
+#include <stdint.h>
+
+#define YOL_TIPI_HATASI "yol elemanları 32 veya 64 bitlik tamsayı olmalı"
+#define YOL_BOYUTU_HATASI "yol dizisinin boyut sayısı hatalı"
+#define SEHIR_HATASI "şehir koordinatları (n, 2) boyutlu, C sıralı bir float64 dizisi olmalı"
+#define SEHIR_NUMARASI_HATASI "yolda geçersiz şehir numarası var"
+
+// Şehirlerin koordinatları (x0, y0, x1, y1, ...) sırasıyla ve asal olan
+// şehir numaralarının bit tablosu (s numaralı şehir asalsa s. bit 1).
+// load_cities ile yüklenir.
+extern const double *koordinat;
+extern Py_ssize_t n_sehir;
+extern unsigned char *asal_bitleri;
+
+// GIL bırakılarak yukarıdaki verileri okuyan hesapların sayısı. Sıfır
+// değilken load_cities veriyi değiştirmez. Sadece GIL tutulurken
+// arttırılıp azaltıldığından kilide gerek yoktur.
+extern int veri_kullanimda;
+
+static inline double mesafe(long onceki, long yeni)
+{
+    double dx, dy;
+    dx = koordinat[2*yeni] - koordinat[2*onceki];
+    dy = koordinat[2*yeni+1] - koordinat[2*onceki+1];
+    return sqrt(dx*dx+dy*dy);
+}
+
+// Asallık kontrolü tek bir bellek erişimidir. Tablo 200 bin şehir için
+// 25 KB tuttuğundan işlemcinin birinci seviye önbelleğine sığar.
+static inline int asal_mi(long sehir)
+{
+    return (asal_bitleri[sehir >> 3] >> (sehir & 7)) & 1;
+}
+
+// Buffer'dan okunabilen şehir numarası tipleri.
+enum yol_tipi { YOL_INT32, YOL_INT64, YOL_UINT32, YOL_UINT64 };
+
+// pysanta.c içinde tanımlı.
+int veri_kontrol(void);
+int buffer_tipi(Py_buffer *view, int boyut);
+
+// Yerel arama hamlelerinin mesafe farkını hesaplamak için turun elemanlarına
+// rastgele erişim.
+typedef struct {
+    const char *veri;
+    Py_ssize_t len, adimlik;
+    int tip;
+} yol_t;
+
+static inline long yol_eleman(const yol_t *yol, Py_ssize_t k)
+{
+    const char *p = yol->veri + k*yol->adimlik;
+    switch (yol->tip) {
+    case YOL_INT32:  return (long) *(const int32_t *) p;
+    case YOL_INT64:  return (long) *(const int64_t *) p;
+    case YOL_UINT32: return (long) *(const uint32_t *) p;
+    default:         return (long) *(const uint64_t *) p;
+    }
+}
+
+static inline double kenar(const yol_t *yol, Py_ssize_t a, Py_ssize_t b)
+{
+    return mesafe(yol_eleman(yol, a), yol_eleman(yol, b));
+}
+
+// Bir hamleden sonra turun m. konumuna, eski turun hangi konumundaki şehrin
+// geldiğini tarif eder.
+enum hamle_tipi { HAMLE_2OPT, HAMLE_OROPT, HAMLE_SWAP };
+
+typedef struct {
+    int tip;
+    Py_ssize_t i, j, k;  // [i, j] aralığı; or-opt'ta k'dan sonraya taşınır
+    int ters;            // or-opt'ta parça ters çevrilerek mi yerleşiyor?
+} hamle_t;
+
+static inline Py_ssize_t eski_konum(const hamle_t *h, Py_ssize_t m)
+{
+    Py_ssize_t L, s;
+
+    switch (h->tip) {
+    case HAMLE_2OPT:
+        return (m >= h->i && m <= h->j) ? h->i + h->j - m : m;
+    case HAMLE_SWAP:
+        return m == h->i ? h->j : (m == h->j ? h->i : m);
+    default:
+        L = h->j - h->i + 1;
+        if (h->k > h->j) {
+            // [j+1, k] geri kayar, parça k'nın yerine gelir.
+            if (m < h->i || m > h->k)
+                return m;
+            if (m <= h->k - L)
+                return m + L;
+            s = m - (h->k - L + 1);
+        }
+        else {
+            // Parça k'dan sonraya gelir, [k+1, i-1] ileri kayar.
+            if (m <= h->k || m > h->j)
+                return m;
+            if (m > h->k + L)
+                return m - L;
+            s = m - (h->k + 1);
+        }
+        return h->ters ? h->j - s : h->i + s;
+    }
+}
+
+// [ilk, son] adımları içindeki cezalı adımların (her onuncu adım) yeni ve
+// eski ek maliyetleri arasındaki fark. Cezalı olmayan adımlar atlandığından
+// maliyet aralık uzunluğunun onda biriyle orantılıdır.
+static inline double ceza_farki(const yol_t *yol, const hamle_t *h,
+                                Py_ssize_t ilk, Py_ssize_t son)
+{
+    double fark = 0;
+    long a;
+
+    for (Py_ssize_t adim = (ilk + 9) / 10 * 10; adim <= son; adim += 10) {
+        a = yol_eleman(yol, adim-1);
+        if (!asal_mi(a))
+            fark -= 0.1 * mesafe(a, yol_eleman(yol, adim));
+        a = yol_eleman(yol, eski_konum(h, adim-1));
+        if (!asal_mi(a))
+            fark += 0.1 * mesafe(a, yol_eleman(yol, eski_konum(h, adim)));
+    }
+    return fark;
+}
+
+// [i, j] aralığını ters çevirmenin (2-opt) toplam mesafeye etkisi.
+static inline double fark_2opt(const yol_t *yol, Py_ssize_t i, Py_ssize_t j)
+{
+    hamle_t h = {HAMLE_2OPT, i, j, 0, 0};
+
+    // Parçanın içindeki kenarlar aynı kalır, sadece yönleri değişir.
+    // Ama parçanın içindeki cezalı adımların başlangıç şehirleri değişir.
+    return kenar(yol, i-1, j) + kenar(yol, i, j+1)
+         - kenar(yol, i-1, i) - kenar(yol, j, j+1)
+         + ceza_farki(yol, &h, i, j+1);
+}
+
+// [i, j] aralığını k konumundaki şehirle ondan sonraki şehrin arasına
+// taşımanın (or-opt) toplam mesafeye etkisi.
+static inline double fark_oropt(const yol_t *yol, Py_ssize_t i, Py_ssize_t j,
+                                Py_ssize_t k, int ters)
+{
+    hamle_t h = {HAMLE_OROPT, i, j, k, ters};
+    Py_ssize_t bas = ters ? j : i;
+    Py_ssize_t son = ters ? i : j;
+    double fark;
+
+    fark = kenar(yol, i-1, j+1) + kenar(yol, k, bas) + kenar(yol, son, k+1)
+         - kenar(yol, i-1, i) - kenar(yol, j, j+1) - kenar(yol, k, k+1);
+    // Parça ile k arasındaki bütün şehirler kaydığından cezalı adımlar
+    // bu aralığın tamamında değişebilir.
+    if (k > j)
+        fark += ceza_farki(yol, &h, i, k+1);
+    else
+        fark += ceza_farki(yol, &h, k+1, j+1);
+    return fark;
+}
+
+// yerelarama.c içinde tanımlı.
+PyObject* improve(PyObject* self, PyObject* args, PyObject* kwargs);
+
+#endif
@@ -0,0 +1,15 @@
+# santa.py
+# Derlenmiş C eklentisini (_santa) yükler. Eklenti derlenmemişse ya da
+# yüklenemiyorsa aynı arayüzü saf NumPy ile sağlayan santa_numpy kullanılır;
+# hangisinin yüklendiği santa.simd değişkeninden anlaşılabilir ("numpy" ise
+# NumPy sürümü). SANTA_NUMPY=1 ortam değişkeniyle NumPy sürümü zorlanabilir.
+
+import os
+
+if os.environ.get("SANTA_NUMPY", "0") != "0":
+    from santa_numpy import *
+else:
+    try:
+        from _santa import *
+    except ImportError:
+        from santa_numpy import *
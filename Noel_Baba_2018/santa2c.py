@@ -1,28 +1,90 @@
 #!/usr/bin/env python
 # santa2c.py
-# CSV dosyasındaki verileri C array olarak içeren bir data.c dosyası yaratır.
+# CSV dosyasındaki şehir verilerini santa.load_cities() ile yüklenecek ikili
+# dosyalara yazar:
+#   data/cities.bin : şehir koordinatları, (x, y) çiftleri halinde ham float64
+#   data/primes.bin : asal şehir numaralarının bit tablosu (s. bit, s numaralı
+#                     şehir asalsa 1; bit sırası küçükten büyüğe)
+# santa.load_cities sadece cities.bin'i okur; asal tablosunu şehir sayısından
+# kendisi kurar (200 bin şehir için birkaç milisaniye). primes.bin, asal
+# şehirleri kalbur çalıştırmadan okumak isteyen diğer araçlar içindir.
+# İstenirse (--c) aynı koordinatları C array olarak içeren bir data.c dosyası
+# da yaratır (modülü SANTA_GOMULU_VERI=1 ile derlemek için).
+
+import argparse
+import itertools
+import os
 
 import numpy as np
-cities = np.loadtxt("data/cities.csv", delimiter=",",skiprows=1, usecols=(1,2))
-
-from sympy import sieve
-primeids = sieve.primerange(0,197769)
-        
-with open("data.c","w") as f:
-    # Asal olan şehir numaralarını sıralı bir diziye yaz.
-    f.write("unsigned int asalsehirler[] = {")
-    for p in primeids:
-        f.write( str(p)+"," )
-    f.write( "};\n" )
-    
-    # Şehirlerin x koordinatlarını bir diziye yaz.
-    f.write( "double x[]={"+str(cities[0,0]) )
-    for x in cities[1:,0]:
-        f.write( ","+str(x) )
-    f.write( "};\n" )
-
-    # Şehirlerin y koordinatlarını bir diziye yaz.
-    f.write( "double y[]={"+str(cities[0,1]) )
-    for y in cities[1:,1]:
-        f.write( ","+str(y) )
-    f.write( "};\n" )
\ No newline at end of file
+
+
+def asal_maskesi(n):
+    """0 ile n-1 arasındaki sayılar için asal olanları True yapan dizi.
+
+    Eratosthenes kalburu: her asalın katları tek bir dilim atamasıyla silinir.
+    """
+    asal = np.ones(n, dtype=bool)
+    asal[:2] = False
+    for i in range(2, int(n**0.5) + 1):
+        if asal[i]:
+            asal[i*i::i] = False
+    return asal
+
+
+def csv_oku(yol, parca=65536):
+    """CSV dosyasını parça parça okuyup (n, 2) boyutlu koordinat dizisi döndürür.
+
+    Şehir numaralarının 0'dan başlayıp sırayla arttığı kontrol edilir.
+    """
+    parcalar = []
+    n = 0
+    with open(yol) as f:
+        next(f)  # sütun başlıkları
+        while True:
+            satirlar = list(itertools.islice(f, parca))
+            if not satirlar:
+                break
+            veri = np.loadtxt(satirlar, delimiter=",", ndmin=2)
+            if not np.array_equal(veri[:, 0], np.arange(n, n + len(veri))):
+                raise ValueError(yol + ": şehir numaraları 0'dan başlayıp "
+                                 "sırayla artmalı")
+            parcalar.append(veri[:, 1:3])
+            n += len(veri)
+    return np.concatenate(parcalar) if parcalar else np.zeros((0, 2))
+
+
+def c_yaz(yol, sehirler):
+    """Koordinatları C dizileri olarak bir kaynak dosyasına yazar."""
+    with open(yol, "w") as f:
+        # Şehir sayısını yaz.
+        f.write("long n_gomulu = " + str(len(sehirler)) + ";\n")
+        # Şehirlerin x ve y koordinatlarını birer diziye yaz.
+        for ad, sutun in (("x", sehirler[:, 0]), ("y", sehirler[:, 1])):
+            f.write("double " + ad + "[]={")
+            f.write(",".join(map(repr, sutun.tolist())))
+            f.write("};\n")
+
+
+def main():
+    ayristirici = argparse.ArgumentParser(
+        description="CSV dosyasındaki şehir verilerini ikili dosyalara yazar.")
+    ayristirici.add_argument("csv", nargs="?", default="data/cities.csv",
+                             help="şehirler dosyası (varsayılan: %(default)s)")
+    ayristirici.add_argument("--dizin", default="data",
+                             help="ikili dosyaların yazılacağı dizin "
+                                  "(varsayılan: %(default)s)")
+    ayristirici.add_argument("--c", action="store_true",
+                             help="ayrıca data.c dosyasını da yaz")
+    args = ayristirici.parse_args()
+
+    sehirler = csv_oku(args.csv)
+    sehirler.astype("<f8").tofile(os.path.join(args.dizin, "cities.bin"))
+    asal = np.packbits(asal_maskesi(len(sehirler)), bitorder="little")
+    asal.tofile(os.path.join(args.dizin, "primes.bin"))
+
+    if args.c:
+        c_yaz("data.c", sehirler)
+
+
+if __name__ == "__main__":
+    main()
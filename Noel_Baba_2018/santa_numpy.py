@@ -0,0 +1,178 @@
+# santa_numpy.py
+# C eklentisi (_santa) derlenemediğinde kullanılan, aynı arayüze sahip saf
+# NumPy sürümü. Sonuçlar C sürümüyle aynıdır (kayan nokta toplama sırası
+# dışında); sadece daha yavaştır. santa.improve bu sürümde tanımlı değildir;
+# hasattr(santa, "improve") ile kontrol edilebilir.
+#
+# Doğrudan kullanılmaz; `import santa` C eklentisini bulamazsa bu modülü
+# yükler. SANTA_NUMPY=1 ortam değişkeniyle bu sürüm zorlanabilir.
+
+import math
+import os
+
+import numpy as np
+
+from santa2c import asal_maskesi
+
+__all__ = ["load_cities", "cities", "toplam_mesafe", "toplam_mesafe_batch",
+           "delta_2opt", "delta_oropt", "delta_swap", "simd"]
+
+# C sürümündeki santa.simd karşılığı.
+simd = "numpy"
+
+YOL_TIPI_HATASI = "yol elemanları 32 veya 64 bitlik tamsayı olmalı"
+YOL_BOYUTU_HATASI = "yol dizisinin boyut sayısı hatalı"
+SEHIR_HATASI = ("şehir koordinatları (n, 2) boyutlu, C sıralı bir float64 "
+                "dizisi olmalı")
+SEHIR_NUMARASI_HATASI = "yolda geçersiz şehir numarası var"
+
+# load_cities ile yüklenen şehir koordinatları ve asal şehir maskesi.
+_kaynak = None
+_koordinat = None
+_asal = None
+
+
+def _veri_kontrol():
+    if _koordinat is None:
+        raise RuntimeError("şehir verisi yüklenmedi; önce santa.load_cities() "
+                           "çağırın")
+
+
+def _yol_al(yol, boyut=1):
+    """Yolu tamsayı bir NumPy dizisine çevirir ve şehir numaralarını
+    kontrol eder."""
+    _veri_kontrol()
+    yol = np.asarray(yol)
+    if yol.size == 0 and yol.dtype.kind == "f":
+        yol = yol.astype(np.int64)  # boş liste
+    if yol.ndim != boyut:
+        raise TypeError("%s (beklenen %d, bulunan %d)"
+                        % (YOL_BOYUTU_HATASI, boyut, yol.ndim))
+    if yol.dtype.kind not in "iu":
+        raise TypeError("%s ('%s')" % (YOL_TIPI_HATASI, yol.dtype.str))
+    hatali = np.flatnonzero(((yol < 0) | (yol >= len(_koordinat))).ravel())
+    if len(hatali):
+        satir, konum = divmod(int(hatali[0]), yol.shape[-1])
+        if yol.ndim == 2:
+            raise IndexError("%s (satır %d, konum %d)"
+                             % (SEHIR_NUMARASI_HATASI, satir, konum))
+        raise IndexError("%s (konum %d)" % (SEHIR_NUMARASI_HATASI, konum))
+    return yol
+
+
+def _adim_mesafeleri(yol, adim0):
+    """yol[s-1]'den yol[s]'ye giden her adımın (cezalı) uzunluğu."""
+    fark = _koordinat[yol[1:]] - _koordinat[yol[:-1]]
+    mesafeler = np.sqrt(fark[:, 0]**2 + fark[:, 1]**2)
+    # On adımda bir, başlangıç şehri asal değilse %10 fazla. Turdaki
+    # adım numarası adim0 + s olduğundan ilk cezalı adımı bul.
+    ilk = (-(adim0 + 1)) % 10
+    cezali = slice(ilk, None, 10)
+    mesafeler[cezali] *= np.where(_asal[yol[:-1][cezali]], 1.0, 1.1)
+    return mesafeler
+
+
+def _toplam(yol, adim0=0, kesin=False):
+    if len(yol) < 2:
+        return 0.0
+    mesafeler = _adim_mesafeleri(yol, adim0)
+    return math.fsum(mesafeler) if kesin else float(mesafeler.sum())
+
+
+def load_cities(kaynak):
+    """Şehir koordinatlarını yükler ve şehir sayısını döndürür.
+
+    kaynak (n, 2) boyutlu bir float64 dizisi ya da bir dosya yolu olabilir.
+    Dosyalar belleğe eşlenerek okunur: .npy dosyaları başlıklarıyla,
+    diğerleri ham float64 (x, y) çiftleri olarak.
+    """
+    global _kaynak, _koordinat, _asal
+    if isinstance(kaynak, (str, bytes, os.PathLike)):
+        yol = os.fsdecode(kaynak)
+        if yol.endswith(".npy"):
+            kaynak = np.load(yol, mmap_mode="r")
+        else:
+            kaynak = np.memmap(yol, dtype="<f8", mode="r").reshape(-1, 2)
+    dizi = np.asarray(kaynak)
+    if (dizi.ndim != 2 or dizi.shape[1] != 2 or dizi.dtype != np.float64
+            or not dizi.flags.c_contiguous):
+        raise TypeError(SEHIR_HATASI)
+    _kaynak, _koordinat, _asal = kaynak, dizi, asal_maskesi(len(dizi))
+    return len(dizi)
+
+
+def cities():
+    """Yüklü şehir koordinatlarını kopyalamadan verir."""
+    _veri_kontrol()
+    return _kaynak
+
+
+def toplam_mesafe(yol, adim0=0, kesin=False):
+    """Belli bir turun katettiği toplam mesafeyi verir.
+
+    adim0, yol[0]'ın bütün turdaki konumudur. kesin ise adımlar kayıpsız
+    (math.fsum) toplanır.
+    """
+    if adim0 < 0:
+        raise ValueError("adim0 negatif olamaz")
+    return _toplam(_yol_al(yol), adim0, kesin)
+
+
+def toplam_mesafe_batch(turlar, is_sayisi=0, kesin=False):
+    """Bir tur matrisinin her satırının toplam mesafesini verir.
+
+    is_sayisi C sürümüyle uyumluluk için vardır; hesaplama tek iş
+    parçacığında yapılır.
+    """
+    turlar = _yol_al(turlar, 2)
+    return np.array([_toplam(tur, 0, kesin) for tur in turlar],
+                    dtype=np.float64)
+
+
+def _pencere_farki(yol, yeni, a, b):
+    """yol[a:b+1] penceresi yeni ile değiştirildiğinde toplam mesafedeki
+    değişim. Pencere dışındaki adımlar aynı kaldığından hesaplanmaz."""
+    return _toplam(yeni, a) - _toplam(yol[a:b+1], a)
+
+
+def _konum_kontrol(gecerli):
+    if not gecerli:
+        raise IndexError("hamle konumları yolun dışında")
+
+
+def delta_2opt(yol, i, j):
+    """yol[i:j+1] parçası ters çevrildiğinde toplam mesafedeki değişim."""
+    yol = _yol_al(yol)
+    _konum_kontrol(1 <= i < j <= len(yol) - 2)
+    yeni = yol[i-1:j+2].copy()
+    yeni[1:-1] = yeni[1:-1][::-1]
+    return _pencere_farki(yol, yeni, i - 1, j + 1)
+
+
+def delta_oropt(yol, i, j, k, ters=False):
+    """yol[i:j+1] parçası yol[k] ile yol[k+1] arasına taşındığında (ters ise
+    ters çevrilerek) toplam mesafedeki değişim."""
+    yol = _yol_al(yol)
+    _konum_kontrol(1 <= i <= j <= len(yol) - 2 and 0 <= k <= len(yol) - 2
+                   and (k < i - 1 or k > j))
+    parca = yol[i:j+1][::-1] if ters else yol[i:j+1]
+    if k > j:
+        yeni = np.concatenate([yol[i-1:i], yol[j+1:k+1], parca, yol[k+1:k+2]])
+        return _pencere_farki(yol, yeni, i - 1, k + 1)
+    yeni = np.concatenate([yol[k:k+1], parca, yol[k+1:i], yol[j+1:j+2]])
+    return _pencere_farki(yol, yeni, k, j + 1)
+
+
+def delta_swap(yol, i, j):
+    """yol[i] ile yol[j] yer değiştirdiğinde toplam mesafedeki değişim."""
+    yol = _yol_al(yol)
+    _konum_kontrol(1 <= i < j <= len(yol) - 2)
+    if j == i + 1:
+        yeni = yol[i-1:j+2][[0, 2, 1, 3]]
+        return _pencere_farki(yol, yeni, i - 1, j + 1)
+    # Sadece i ve j konumlarına giren ve çıkan adımlar değişir.
+    yeni_i, yeni_j = yol[i-1:i+2].copy(), yol[j-1:j+2].copy()
+    yeni_i[1], yeni_j[1] = yol[j], yol[i]
+    return (_pencere_farki(yol, yeni_i, i - 1, i + 1)
+            + _pencere_farki(yol, yeni_j, j - 1, j + 1))
+
@@ -1,8 +1,51 @@
-from distutils.core import setup, Extension
+import os
+import sys
+from setuptools import setup, Extension
 
-module = Extension('santa', sources = ['data.c','pysanta.c'])
+# Paket bilgileri pyproject.toml dosyasında. Bu dosya sadece C eklentisinin
+# nasıl derleneceğini tanımlar; `pip install .` ya da
+# `python setup.py build_ext --inplace` ile kullanılır.
 
-setup (name = 'santa',
-        version = '1.0',
-        description = 'Gezgin Santa Problemi',
-        ext_modules = [module])
+# Optimizasyon seçenekleri derleme sırasında ortam değişkenleriyle verilir:
+#   SANTA_OPT   : optimizasyon seviyesi (varsayılan -O3, Windows'ta /O2)
+#   SANTA_MARCH : hedef işlemci, ör. native (varsayılan yok). SIMD çekirdeği
+#                 zaten çalışma anında işlemciye göre seçildiği için
+#                 taşınabilir bir derleme de vektör komutlarını kullanır.
+# Kayan nokta toplamaları (kesin=True) IEEE kurallarına dayandığından
+# -ffast-math kullanılmamalı.
+if sys.platform == 'win32':
+    derleme = [os.environ.get('SANTA_OPT', '/O2')]
+else:
+    derleme = [os.environ.get('SANTA_OPT', '-O3')]
+    if os.environ.get('SANTA_MARCH'):
+        derleme.append('-march=' + os.environ['SANTA_MARCH'])
+baglama = []
+
+# Toplu hesaplamaları paralel yapmak için OpenMP kullan. macOS'un varsayılan
+# derleyicisi OpenMP desteklemediğinden orada kapalı; SANTA_OPENMP=0 ile
+# her yerde kapatılabilir.
+if os.environ.get('SANTA_OPENMP', '1') != '0' and sys.platform != 'darwin':
+    if sys.platform == 'win32':
+        derleme.append('/openmp')
+    else:
+        derleme.append('-fopenmp')
+        baglama.append('-fopenmp')
+
+# Şehirler normalde çalışma anında santa.load_cities() ile yüklenir.
+# SANTA_GOMULU_VERI=1 verilirse `python santa2c.py --c` ile üretilen data.c
+# modüle gömülür ve şehirler başlangıçta yüklü gelir.
+kaynaklar, makrolar = ['pysanta.c', 'yerelarama.c'], []
+if os.environ.get('SANTA_GOMULU_VERI', '0') != '0':
+    kaynaklar.insert(0, 'data.c')
+    makrolar.append(('SANTA_GOMULU_VERI', None))
+
+# Eklenti derlenemezse (ör. derleyici yoksa) kurulum yine de tamamlanır ve
+# santa modülü aynı arayüzü sağlayan santa_numpy sürümünü kullanır.
+module = Extension('_santa', sources = kaynaklar,
+                   depends = ['santa.h'],
+                   define_macros = makrolar,
+                   extra_compile_args = derleme,
+                   extra_link_args = baglama,
+                   optional = os.environ.get('SANTA_ZORUNLU', '0') == '0')
+
+setup(ext_modules = [module])
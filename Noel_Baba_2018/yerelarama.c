@@ -0,0 +1,372 @@
+// yerelarama.c
+// Aday komşu listeleriyle 2-opt ve or-opt yerel araması. Amaç fonksiyonu
+// toplam_mesafe ile aynıdır; her onuncu adımın cezası hamlelerin mesafe
+// farkına katılır.
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdlib.h>
+#include <string.h>
+#ifdef _WIN32
+#include <windows.h>
+#else
+#include <time.h>
+#endif
+#include "santa.h"
+
+// Bu kadar küçük kazançlar yuvarlama hatası sayılır; hamle yapılmaz.
+#define EPS 1e-7
+
+// Or-opt ile taşınan en uzun parça.
+#define EN_UZUN_PARCA 3
+
+static double saniye(void)
+{
+#ifdef _WIN32
+    LARGE_INTEGER sayac, frekans;
+    QueryPerformanceCounter(&sayac);
+    QueryPerformanceFrequency(&frekans);
+    return (double) sayac.QuadPart / frekans.QuadPart;
+#else
+    struct timespec t;
+    clock_gettime(CLOCK_MONOTONIC, &t);
+    return t.tv_sec + 1e-9 * t.tv_nsec;
+#endif
+}
+
+typedef struct {
+    int32_t *tur;          // tur[0..N]; tur[0] == tur[N] sabit kalır
+    Py_ssize_t N;
+    int32_t *konum;        // şehrin turdaki yeri (turda yoksa -1)
+    const int32_t *komsu;  // (n_sehir x k) aday komşu listesi
+    Py_ssize_t k;
+    Py_ssize_t en_uzun;    // ters çevrilen ya da kaydırılan en uzun aralık
+    yol_t yol;             // fark hesapları için tur dizisine erişim
+
+    // Bakılacak şehirler kuyruğu. Kuyrukta olmayan şehirlerin "bakma"
+    // (don't-look) biti açık sayılır; çevresinde bir hamle yapılınca ya da
+    // yeri değişince şehir tekrar kuyruğa girer.
+    int32_t *kuyruk;
+    Py_ssize_t bas, say;
+    unsigned char *kuyrukta;
+} arama_t;
+
+static void kuyruga_ekle(arama_t *a, int32_t sehir)
+{
+    if (a->kuyrukta[sehir] || a->konum[sehir] < 0)
+        return;
+    a->kuyrukta[sehir] = 1;
+    a->kuyruk[(a->bas + a->say) % n_sehir] = sehir;
+    a->say++;
+}
+
+static int32_t kuyruktan_al(arama_t *a)
+{
+    int32_t sehir = a->kuyruk[a->bas];
+    a->bas = (a->bas + 1) % n_sehir;
+    a->say--;
+    a->kuyrukta[sehir] = 0;
+    return sehir;
+}
+
+// Yeri değişen şehirlerin konumlarını günceller ve onları tekrar kuyruğa
+// koyar: Konumu değişen şehrin on adımlık ceza sırası da değişir, bu yüzden
+// daha önce kazançsız bulunan hamleleri kazançlı olabilir. Aralık en fazla
+// en_uzun (or-opt'ta en_uzun + parça) konum uzunluğundadır.
+static void konumlari_guncelle(arama_t *a, Py_ssize_t ilk, Py_ssize_t son)
+{
+    for (Py_ssize_t m = ilk; m <= son; m++) {
+        a->konum[a->tur[m]] = (int32_t) m;
+        kuyruga_ekle(a, a->tur[m]);
+    }
+}
+
+static void ters_cevir(arama_t *a, Py_ssize_t i, Py_ssize_t j)
+{
+    int32_t gecici;
+
+    kuyruga_ekle(a, a->tur[i-1]);
+    kuyruga_ekle(a, a->tur[j+1]);
+    for (Py_ssize_t p = i, q = j; p < q; p++, q--) {
+        gecici = a->tur[p];
+        a->tur[p] = a->tur[q];
+        a->tur[q] = gecici;
+    }
+    konumlari_guncelle(a, i, j);
+}
+
+static void tasi(arama_t *a, Py_ssize_t i, Py_ssize_t j, Py_ssize_t k,
+                 int ters)
+{
+    int32_t parca[EN_UZUN_PARCA];
+    Py_ssize_t L = j - i + 1;
+
+    kuyruga_ekle(a, a->tur[i-1]);
+    kuyruga_ekle(a, a->tur[j+1]);
+    kuyruga_ekle(a, a->tur[k]);
+    kuyruga_ekle(a, a->tur[k+1]);
+    for (Py_ssize_t s = 0; s < L; s++)
+        parca[s] = a->tur[ters ? j - s : i + s];
+    if (k > j) {
+        memmove(a->tur + i, a->tur + j + 1, (k - j) * sizeof(int32_t));
+        memcpy(a->tur + k - L + 1, parca, L * sizeof(int32_t));
+        konumlari_guncelle(a, i, k);
+    }
+    else {
+        memmove(a->tur + k + 1 + L, a->tur + k + 1, (i - 1 - k) * sizeof(int32_t));
+        memcpy(a->tur + k + 1, parca, L * sizeof(int32_t));
+        konumlari_guncelle(a, k + 1, j);
+    }
+}
+
+// [i, j] ters çevrilebilir ve kazançlıysa hamleyi yapar.
+static int dene_ters(arama_t *a, Py_ssize_t i, Py_ssize_t j)
+{
+    if (i < 1 || j > a->N - 1 || i >= j || j - i + 1 > a->en_uzun)
+        return 0;
+    if (fark_2opt(&a->yol, i, j) > -EPS)
+        return 0;
+    ters_cevir(a, i, j);
+    return 1;
+}
+
+// 2-opt: şehri aday komşularından birine bağlayan bir ters çevirme arar.
+static int dene_2opt(arama_t *a, int32_t sehir)
+{
+    Py_ssize_t i = a->konum[sehir], j;
+    double d, sonraki, onceki;
+    int32_t b;
+
+    sonraki = i < a->N ? mesafe(sehir, a->tur[i+1]) : 0;
+    onceki = i > 0 ? mesafe(a->tur[i-1], sehir) : 0;
+    for (Py_ssize_t v = 0; v < a->k; v++) {
+        b = a->komsu[sehir * a->k + v];
+        j = a->konum[b];
+        d = mesafe(sehir, b);
+        // Komşular yakından uzağa sıralı; mevcut kenarlardan kısa olmayan
+        // bir kenar kazanç getirmez.
+        if (d >= sonraki && d >= onceki)
+            break;
+        if (j < 0 || j == i)
+            continue;
+        // Şehrin sonrasındaki kenarı kırıp b'ye bağla.
+        if (d < sonraki && dene_ters(a, i < j ? i+1 : j+1, i < j ? j : i))
+            return 1;
+        // Şehrin öncesindeki kenarı kırıp b'ye bağla.
+        if (d < onceki && dene_ters(a, i < j ? i : j, i < j ? j-1 : i-1))
+            return 1;
+    }
+    return 0;
+}
+
+// Or-opt: şehirle başlayan 1-3 şehirlik parçayı aday komşularından birinin
+// yanına taşımayı dener.
+static int dene_oropt(arama_t *a, int32_t sehir)
+{
+    Py_ssize_t i = a->konum[sehir], j, k, m;
+    double d, onceki;
+    int32_t b;
+
+    if (i < 1)
+        return 0;
+    onceki = mesafe(a->tur[i-1], sehir);
+    for (Py_ssize_t L = 1; L <= EN_UZUN_PARCA && i + L - 1 <= a->N - 1; L++) {
+        j = i + L - 1;
+        for (Py_ssize_t v = 0; v < a->k; v++) {
+            b = a->komsu[sehir * a->k + v];
+            m = a->konum[b];
+            d = mesafe(sehir, b);
+            if (d >= onceki)
+                break;
+            if (m < 0 || (m >= i && m <= j))
+                continue;
+            // Parçayı b'nin arkasına (düz) ya da önüne (ters) yerleştir.
+            for (int ters = 0; ters <= 1; ters++) {
+                k = ters ? m - 1 : m;
+                if (k < 0 || k > a->N - 1 || (k >= i-1 && k <= j))
+                    continue;
+                if ((k > i ? k - i : i - k) > a->en_uzun)
+                    continue;
+                if (fark_oropt(&a->yol, i, j, k, ters) < -EPS) {
+                    tasi(a, i, j, k, ters);
+                    return 1;
+                }
+            }
+        }
+    }
+    return 0;
+}
+
+// Verilen turu girdi olarak alıp iyileştirilmiş bir int32 NumPy dizisi
+// döndürür. Arama GIL bırakılarak yapılır.
+PyObject* improve(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+    static char *anahtarlar[] = {"yol", "komsular", "sure", "hamleler",
+                                 "en_uzun", NULL};
+    PyObject *yol_nesnesi, *komsu_nesnesi, *hamleler = NULL;
+    PyObject *numpy, *sonuc = NULL;
+    Py_buffer yol_view, komsu_view, cikti;
+    yol_t girdi;
+    arama_t a;
+    double sure, bitis;
+    Py_ssize_t en_uzun = 1000, sayac = 0;
+    int iki_opt = 1, or_opt = 1, degisti, sure_doldu = 0;
+    long sehir;
+
+    memset(&a, 0, sizeof(a));
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OOd|On", anahtarlar,
+                                     &yol_nesnesi, &komsu_nesnesi, &sure,
+                                     &hamleler, &en_uzun))
+        return NULL;
+    if (veri_kontrol() < 0)
+        return NULL;
+
+    if (hamleler != NULL) {
+        PyObject *liste, *ad;
+
+        // Tek bir dize de bir dizidir; "2opt" in "oropt,2opt" gibi
+        // kazara çalışmasın diye reddedilir.
+        if (PyUnicode_Check(hamleler)) {
+            PyErr_SetString(PyExc_TypeError, "hamleler tek bir dize değil, "
+                            "hamle isimlerinin listesi olmalı");
+            return NULL;
+        }
+        liste = PySequence_Fast(hamleler, "hamleler bir liste ya da demet olmalı");
+        if (liste == NULL)
+            return NULL;
+        iki_opt = or_opt = 0;
+        for (Py_ssize_t m = 0; m < PySequence_Fast_GET_SIZE(liste); m++) {
+            ad = PySequence_Fast_GET_ITEM(liste, m);
+            if (PyUnicode_Check(ad)
+                    && PyUnicode_CompareWithASCIIString(ad, "2opt") == 0)
+                iki_opt = 1;
+            else if (PyUnicode_Check(ad)
+                    && PyUnicode_CompareWithASCIIString(ad, "oropt") == 0)
+                or_opt = 1;
+            else {
+                // Biçim dizesi ASCII olmalı; Türkçe kelime %s ile verilir.
+                PyErr_Format(PyExc_ValueError, "bilinmeyen hamle %R "
+                             "(\"2opt\" ya da \"oropt\" %s)", ad, "olmalı");
+                Py_DECREF(liste);
+                return NULL;
+            }
+        }
+        Py_DECREF(liste);
+    }
+
+    if (PyObject_GetBuffer(yol_nesnesi, &yol_view, PyBUF_STRIDES | PyBUF_FORMAT) < 0)
+        return NULL;
+    girdi.tip = buffer_tipi(&yol_view, 1);
+    if (girdi.tip < 0) {
+        PyBuffer_Release(&yol_view);
+        return NULL;
+    }
+    girdi.veri = yol_view.buf;
+    girdi.len = yol_view.shape[0];
+    girdi.adimlik = yol_view.strides[0];
+
+    if (PyObject_GetBuffer(komsu_nesnesi, &komsu_view,
+                           PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0) {
+        PyBuffer_Release(&yol_view);
+        return NULL;
+    }
+    if (buffer_tipi(&komsu_view, 2) != YOL_INT32
+            || komsu_view.shape[0] != n_sehir) {
+        if (!PyErr_Occurred())
+            PyErr_SetString(PyExc_TypeError, "komşu listesi (şehir sayısı x k) "
+                            "boyutlu bir int32 dizisi olmalı");
+        goto son;
+    }
+
+    a.N = girdi.len - 1;
+    a.komsu = komsu_view.buf;
+    a.k = komsu_view.shape[1];
+    a.en_uzun = en_uzun;
+    a.tur = malloc(girdi.len * sizeof(int32_t));
+    a.konum = malloc(n_sehir * sizeof(int32_t));
+    a.kuyruk = malloc(n_sehir * sizeof(int32_t));
+    a.kuyrukta = calloc(n_sehir, 1);
+    if (!a.tur || !a.konum || !a.kuyruk || !a.kuyrukta) {
+        PyErr_NoMemory();
+        goto son;
+    }
+
+    // Girdiyi kontrol et: tur aynı şehirde başlayıp bitmeli, her şehir en
+    // fazla bir kez geçmeli.
+    for (Py_ssize_t m = 0; m < n_sehir; m++)
+        a.konum[m] = -1;
+    for (Py_ssize_t m = 0; m < a.k * n_sehir; m++)
+        if (a.komsu[m] < 0 || a.komsu[m] >= n_sehir) {
+            PyErr_SetString(PyExc_ValueError, "komşu listesinde geçersiz şehir");
+            goto son;
+        }
+    if (a.N < 1 || yol_eleman(&girdi, 0) != yol_eleman(&girdi, a.N)) {
+        PyErr_SetString(PyExc_ValueError, "tur aynı şehirde başlayıp bitmeli");
+        goto son;
+    }
+    for (Py_ssize_t m = 0; m <= a.N; m++) {
+        sehir = yol_eleman(&girdi, m);
+        if (sehir < 0 || sehir >= n_sehir
+                || (m < a.N && a.konum[sehir] >= 0)) {
+            PyErr_SetString(PyExc_ValueError,
+                            "turda geçersiz ya da tekrarlanan şehir var");
+            goto son;
+        }
+        a.tur[m] = (int32_t) sehir;
+        if (m < a.N)
+            a.konum[sehir] = (int32_t) m;
+    }
+    a.yol.veri = (const char *) a.tur;
+    a.yol.len = girdi.len;
+    a.yol.adimlik = sizeof(int32_t);
+    a.yol.tip = YOL_INT32;
+
+    veri_kullanimda++;
+    Py_BEGIN_ALLOW_THREADS
+    bitis = saniye() + sure;
+    // Kuyruk boşalınca bütün şehirlere bir kez daha bakılır. Yeri değişen
+    // bir parça, uzaktaki bir şehrin hamlesinin ceza farkını da
+    // değiştirebilir; arama ancak hiç hamle yapılmayan bir turdan sonra
+    // (yerel optimumda) biter.
+    do {
+        degisti = 0;
+        for (Py_ssize_t m = 0; m < a.N; m++)
+            kuyruga_ekle(&a, a.tur[m]);
+        while (a.say > 0) {
+            if ((++sayac & 255) == 0 && sure > 0 && saniye() > bitis) {
+                sure_doldu = 1;
+                break;
+            }
+            sehir = kuyruktan_al(&a);
+            if ((iki_opt && dene_2opt(&a, (int32_t) sehir))
+                    || (or_opt && dene_oropt(&a, (int32_t) sehir))) {
+                kuyruga_ekle(&a, (int32_t) sehir);
+                degisti = 1;
+            }
+        }
+    } while (degisti && !sure_doldu);
+    Py_END_ALLOW_THREADS
+    veri_kullanimda--;
+
+    numpy = PyImport_ImportModule("numpy");
+    if (numpy == NULL)
+        goto son;
+    sonuc = PyObject_CallMethod(numpy, "empty", "ns", girdi.len, "int32");
+    Py_DECREF(numpy);
+    if (sonuc == NULL)
+        goto son;
+    if (PyObject_GetBuffer(sonuc, &cikti, PyBUF_WRITABLE) < 0) {
+        Py_CLEAR(sonuc);
+        goto son;
+    }
+    memcpy(cikti.buf, a.tur, girdi.len * sizeof(int32_t));
+    PyBuffer_Release(&cikti);
+
+son:
+    free(a.tur);
+    free(a.konum);
+    free(a.kuyruk);
+    free(a.kuyrukta);
+    PyBuffer_Release(&komsu_view);
+    PyBuffer_Release(&yol_view);
+    return sonuc;
+}